@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from app.core.config import settings          # lê DATABASE_URL do .env
 from app.database import Base                 # metadata base
 import app.models.senha_validador_model       # noqa: F401 — registra tabelas no metadata
+import app.models.senha_validador_resumo_model  # noqa: F401
 
 config = context.config
 
@@ -0,0 +1,42 @@
+"""create_senhas_validador_resumo_diario
+
+Revision ID: 4c1e7a2b9d30
+Revises: 9613d8f09999
+Create Date: 2026-10-18 10:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1e7a2b9d30'
+down_revision: Union[str, Sequence[str], None] = '9613d8f09999'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('senhas_validador_resumo_diario',
+    sa.Column('dia', sa.Date(), nullable=False, comment='Data (UTC) de registro das análises'),
+    sa.Column('score', sa.Integer(), nullable=False, comment='Pontuação de força da senha de 0 (muito fraca) a 5 (muito forte)'),
+    sa.Column('total', sa.BigInteger(), nullable=False, comment='Quantidade de análises no dia com este score'),
+    sa.PrimaryKeyConstraint('dia', 'score')
+    )
+
+    # Backfill dos dados existentes (pode ser refeito com
+    # python -m app.commands.backfill_resumo_diario)
+    op.execute("""
+        INSERT INTO senhas_validador_resumo_diario (dia, score, total)
+        SELECT (created_at AT TIME ZONE 'UTC')::date, score, count(*)
+        FROM senhas_validador
+        GROUP BY 1, 2
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('senhas_validador_resumo_diario')
@@ -0,0 +1,39 @@
+"""is_common_nullable
+
+Revision ID: a6e2d94c1f08
+Revises: f1a9c3e5b7d2
+Create Date: 2026-10-19 09:14:27.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6e2d94c1f08'
+down_revision: Union[str, Sequence[str], None] = 'f1a9c3e5b7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Políticas com short_circuit podem reprovar a senha antes da blocklist:
+    # nulo = não verificada (antes era gravado como False)
+    op.alter_column('senhas_validador', 'is_common',
+               existing_type=sa.Boolean(),
+               nullable=True,
+               comment='True se a senha constar na lista de senhas mais comuns; nulo = não verificada',
+               existing_comment='True se a senha constar na lista de senhas mais comuns')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("UPDATE senhas_validador SET is_common = false WHERE is_common IS NULL")
+    op.alter_column('senhas_validador', 'is_common',
+               existing_type=sa.Boolean(),
+               nullable=False,
+               comment='True se a senha constar na lista de senhas mais comuns',
+               existing_comment='True se a senha constar na lista de senhas mais comuns; nulo = não verificada')
@@ -0,0 +1,38 @@
+"""senha_capturada_nullable
+
+Revision ID: b7d24e91c5a8
+Revises: 4c1e7a2b9d30
+Create Date: 2026-10-18 14:03:27.551930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d24e91c5a8'
+down_revision: Union[str, Sequence[str], None] = '4c1e7a2b9d30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A gravação em lote persiste apenas métricas derivadas — a senha não é mais gravada
+    op.alter_column('senhas_validador', 'senha_capturada',
+               existing_type=sa.Text(),
+               nullable=True,
+               comment='Legado — senha digitada pelo usuário; não é mais gravada',
+               existing_comment='Senha digitada pelo usuário, capturada após 3s de inatividade')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("UPDATE senhas_validador SET senha_capturada = '' WHERE senha_capturada IS NULL")
+    op.alter_column('senhas_validador', 'senha_capturada',
+               existing_type=sa.Text(),
+               nullable=False,
+               comment='Senha digitada pelo usuário, capturada após 3s de inatividade',
+               existing_comment='Legado — senha digitada pelo usuário; não é mais gravada')
@@ -0,0 +1,32 @@
+"""keyset_index_created_at_id
+
+Revision ID: d3f58a1c2e67
+Revises: b7d24e91c5a8
+Create Date: 2026-10-18 18:41:09.306215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f58a1c2e67'
+down_revision: Union[str, Sequence[str], None] = 'b7d24e91c5a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Paginação por cursor em (created_at, id): o índice composto atende também
+    # as consultas só por created_at, então o índice simples sai
+    op.create_index('ix_senhas_validador_created_at_id', 'senhas_validador', ['created_at', 'id'], unique=False)
+    op.drop_index(op.f('ix_senhas_validador_created_at'), table_name='senhas_validador')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_senhas_validador_created_at'), 'senhas_validador', ['created_at'], unique=False)
+    op.drop_index('ix_senhas_validador_created_at_id', table_name='senhas_validador')
@@ -0,0 +1,105 @@
+"""partition_senhas_validador_by_month
+
+Revision ID: f1a9c3e5b7d2
+Revises: d3f58a1c2e67
+Create Date: 2026-10-18 21:07:52.640318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a9c3e5b7d2'
+down_revision: Union[str, Sequence[str], None] = 'd3f58a1c2e67'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mesma convenção de app/repositories/particoes.py: senhas_validador_pAAAAMM,
+# limites em UTC. Cria do mês do registro mais antigo até 3 meses à frente.
+# O instante vai para UTC antes do date_trunc, que num timestamptz trunca no
+# fuso da sessão.
+_CRIAR_PARTICOES = """
+DO $$
+DECLARE
+    mes date := date_trunc('month', (coalesce(
+        (SELECT min(created_at) FROM senhas_validador_heap), now()) AT TIME ZONE 'UTC'))::date;
+    fim date := (date_trunc('month', (greatest(
+        (SELECT max(created_at) FROM senhas_validador_heap), now()) AT TIME ZONE 'UTC'))
+        + interval '4 months')::date;
+BEGIN
+    WHILE mes < fim LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF senhas_validador FOR VALUES FROM (%L) TO (%L)',
+            'senhas_validador_p' || to_char(mes, 'YYYYMM'),
+            mes || ' 00:00:00+00',
+            (mes + interval '1 month')::date || ' 00:00:00+00'
+        );
+        mes := (mes + interval '1 month')::date;
+    END LOOP;
+END $$
+"""
+
+_COLUNAS = (
+    "id, created_at, senha_capturada, ip_origem, user_agent, score, strength_label, "
+    "entropy_bits, is_common, comprimento, tem_maiuscula, tem_minuscula, tem_numero, tem_especial"
+)
+
+
+def _colunas() -> list:
+    return [
+        sa.Column('id', sa.UUID(), nullable=False, comment='Identificador único do registro (UUID v4)'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, comment='Data e hora em que a senha foi capturada (UTC)'),
+        sa.Column('senha_capturada', sa.Text(), nullable=True, comment='Legado — senha digitada pelo usuário; não é mais gravada'),
+        sa.Column('ip_origem', sa.String(length=45), nullable=True, comment='Endereço IP da máquina que enviou a requisição'),
+        sa.Column('user_agent', sa.Text(), nullable=True, comment='User-Agent HTTP — navegador e sistema operacional do usuário'),
+        sa.Column('score', sa.Integer(), nullable=False, comment='Pontuação de força da senha de 0 (muito fraca) a 5 (muito forte)'),
+        sa.Column('strength_label', sa.String(length=30), nullable=False, comment='Rótulo da força: Muito Fraca | Fraca | Razoável | Forte | Muito Forte'),
+        sa.Column('entropy_bits', sa.Float(), nullable=False, comment='Entropia estimada da senha em bits (Shannon log2)'),
+        sa.Column('is_common', sa.Boolean(), nullable=False, comment='True se a senha constar na lista de senhas mais comuns'),
+        sa.Column('comprimento', sa.Integer(), nullable=False, comment='Número de caracteres da senha'),
+        sa.Column('tem_maiuscula', sa.Boolean(), nullable=False, comment='True se a senha contém ao menos uma letra maiúscula'),
+        sa.Column('tem_minuscula', sa.Boolean(), nullable=False, comment='True se a senha contém ao menos uma letra minúscula'),
+        sa.Column('tem_numero', sa.Boolean(), nullable=False, comment='True se a senha contém ao menos um número'),
+        sa.Column('tem_especial', sa.Boolean(), nullable=False, comment='True se a senha contém ao menos um caractere especial'),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tabela antiga vira fonte da cópia; sem índices/PK, os nomes ficam livres
+    op.drop_index('ix_senhas_validador_created_at_id', table_name='senhas_validador')
+    op.drop_index(op.f('ix_senhas_validador_ip_origem'), table_name='senhas_validador')
+    op.execute("ALTER TABLE senhas_validador DROP CONSTRAINT senhas_validador_pkey")
+    op.rename_table('senhas_validador', 'senhas_validador_heap')
+
+    # Particionamento declarativo por mês: a PK precisa conter a chave (created_at).
+    # ip_origem não é mais gravado nem consultado — o índice não volta.
+    op.create_table('senhas_validador',
+    *_colunas(),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    postgresql_partition_by='RANGE (created_at)',
+    )
+    op.create_index('ix_senhas_validador_created_at_id', 'senhas_validador', ['created_at', 'id'], unique=False)
+    op.execute(_CRIAR_PARTICOES)
+
+    op.execute(f"INSERT INTO senhas_validador ({_COLUNAS}) SELECT {_COLUNAS} FROM senhas_validador_heap")
+    op.drop_table('senhas_validador_heap')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_senhas_validador_created_at_id', table_name='senhas_validador')
+    op.execute("ALTER TABLE senhas_validador DROP CONSTRAINT senhas_validador_pkey")
+    op.rename_table('senhas_validador', 'senhas_validador_particionada')
+
+    op.create_table('senhas_validador',
+    *_colunas(),
+    sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute(f"INSERT INTO senhas_validador ({_COLUNAS}) SELECT {_COLUNAS} FROM senhas_validador_particionada")
+    op.create_index('ix_senhas_validador_created_at_id', 'senhas_validador', ['created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_senhas_validador_ip_origem'), 'senhas_validador', ['ip_origem'], unique=False)
+    op.drop_table('senhas_validador_particionada')   # leva junto as partições
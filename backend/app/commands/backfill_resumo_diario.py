@@ -0,0 +1,34 @@
+"""
+Backfill do rollup senhas_validador_resumo_diario.
+
+Reconstrói os totais por (dia, score) a partir de senhas_validador. Use após
+importar dados antigos ou se o rollup ficar dessincronizado.
+
+Uso (a partir de backend/):
+    python -m app.commands.backfill_resumo_diario
+"""
+import asyncio
+
+from app.database import AsyncSessionLocal, engine
+from app.repositories.senha_validador_repository import SenhaValidadorRepository
+
+
+async def _backfill() -> int:
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            return await SenhaValidadorRepository(session).recalcular_resumo()
+
+
+def main() -> None:
+    async def run():
+        try:
+            return await _backfill()
+        finally:
+            await engine.dispose()
+
+    linhas = asyncio.run(run())
+    print(f"Resumo diário reconstruído: {linhas} linhas (dia, score).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Manutenção das partições mensais de senhas_validador.
+
+Cria as partições dos próximos PARTITION_MONTHS_AHEAD meses e, com
+PARTITION_RETENTION_MONTHS > 0, remove as dos meses expirados. A API já faz
+isso a cada PARTITION_MAINTENANCE_HOURS; com o intervalo em 0, agende este
+comando (ex.: cron diário).
+
+Uso (a partir de backend/):
+    python -m app.commands.manter_particoes
+"""
+import asyncio
+
+from app.database import engine
+from app.repositories.particoes import manter_particoes
+
+
+def main() -> None:
+    async def run():
+        try:
+            return await manter_particoes()
+        finally:
+            await engine.dispose()
+
+    resultado = asyncio.run(run())
+    if resultado is None:
+        print("Outra manutenção de partições em andamento; nada feito.")
+        return
+    criadas, removidas = resultado
+    print(f"Partições criadas: {', '.join(criadas) or 'nenhuma'}")
+    print(f"Partições removidas: {', '.join(removidas) or 'nenhuma'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Middleware ASGI do controle de admissão (``services/admission_control``).
+
+Cada rota pesada pertence a uma classe — ``cpu`` (análises no event loop e no
+pool de processos) ou ``db`` (consultas que seguram uma conexão do pool) — e
+tem uma prioridade: 0 para as baratas, 1 para lotes e exportação. A vaga é
+ocupada até o fim do corpo da resposta (inclusive em streaming). Recusada, a
+requisição recebe ``503`` com ``Retry-After`` antes de o corpo ser lido.
+"""
+import time
+from typing import Dict, Tuple
+
+from starlette.responses import JSONResponse
+
+from app.services.admission_control import AdmissionGate, Overloaded, retry_after_seconds
+
+# rota → (classe, prioridade)
+ROUTE_CLASSES: Dict[str, Tuple[str, int]] = {
+    "/api/password/analyze": ("cpu", 0),
+    "/api/password/validate": ("cpu", 0),
+    "/api/phishing/analyze": ("cpu", 0),
+    "/api/password/analyze/batch": ("cpu", 1),
+    "/api/phishing/analyze/batch": ("cpu", 1),
+    "/api/password/stats": ("db", 0),
+    "/api/password/history": ("db", 0),
+    "/api/password/export": ("db", 1),
+}
+
+
+class AdmissionMiddleware:
+    """Passa as rotas de ``ROUTE_CLASSES`` pelo portão da classe; as demais direto."""
+
+    def __init__(self, app, gates: Dict[str, AdmissionGate]):
+        self.app = app
+        self.routes = {
+            path: (gates[cls], priority) for path, (cls, priority) in ROUTE_CLASSES.items() if cls in gates
+        }
+
+    async def __call__(self, scope, receive, send):
+        entry = self.routes.get(scope["path"]) if scope["type"] == "http" else None
+        if entry is None:
+            await self.app(scope, receive, send)
+            return
+
+        gate, priority = entry
+        try:
+            await gate.acquire(priority)
+        except Overloaded as exc:
+            retry_after = retry_after_seconds(exc)
+            response = JSONResponse(
+                {"detail": f"Serviço sobrecarregado. Tente novamente em {retry_after} s."},
+                status_code=503,
+                headers={"Retry-After": str(retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.release(priority, time.perf_counter() - started)
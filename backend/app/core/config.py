@@ -14,6 +14,106 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
     SECRET_KEY: str = "insecure-default-key"
 
+    # Snapshot binário dos dados do validador (python -m app.services.validator_snapshot).
+    # Vazio = app/data/validator_snapshot.bin, se existir; senão usa BLOCKLIST_PATH/.txt.
+    VALIDATOR_SNAPSHOT_PATH: str = ""
+    VALIDATOR_PRELOAD: bool = True           # carrega os dados no startup (senão, na 1ª análise)
+
+    # Políticas de senha (limiares, pesos, checks obrigatórios), por ?policy=<id>.
+    # Vazio = app/data/password_policies.json; sem o arquivo, só a política original.
+    PASSWORD_POLICIES_PATH: str = ""
+
+    # Lista de senhas comuns compilada (python -m app.services.blocklist).
+    # Vazio = app/data/common_passwords.bin, se existir; senão usa o .txt.
+    BLOCKLIST_PATH: str = ""
+    BLOCKLIST_BLOOM: bool = True
+
+    # Índice offline de senhas vazadas (python -m app.services.breach_index).
+    # Vazio = verificação desativada.
+    BREACH_INDEX_PATH: str = ""
+
+    # Limite de requisições por cliente (IP) e rota: "rota=N/s|min|h[:rajada]", separados
+    # por vírgula (vazio = sem limites). 429 + Retry-After quando o balde esvazia.
+    # Desligado por padrão: atrás de um proxy, sem TRUSTED_PROXIES, todo o tráfego
+    # chega do IP do proxy e dividiria um balde só (valores sugeridos em docs/context.md)
+    RATE_LIMITS: str = ""
+    RATE_LIMIT_MAX_CLIENTS: int = 100_000    # baldes guardados (os ociosos saem primeiro)
+    RATE_LIMIT_SHARDS: int = 64
+    # Tabela compartilhada entre workers (vazio = por processo). Prefira tmpfs (/dev/shm/...);
+    # em disco, a tabela é zerada quando o boot id do kernel muda (instantes monotônicos)
+    RATE_LIMIT_SHARED_PATH: str = ""
+    # Proxies reversos (IPs/CIDRs, separados por vírgula) cujo X-Forwarded-For é aceito na
+    # identificação do cliente; vazio = o IP da conexão, sem olhar o cabeçalho
+    TRUSTED_PROXIES: str = ""
+
+    # Controle de admissão: vagas e fila por classe de rota (503 + Retry-After sob sobrecarga)
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_CPU_CONCURRENCY: int = 16      # análises em atendimento (loop + pool de processos)
+    ADMISSION_CPU_QUEUE: int = 128
+    ADMISSION_DB_CONCURRENCY: int = 12       # pool do banco: 5 + 10 de overflow, com folga para a fila write-behind
+    ADMISSION_DB_QUEUE: int = 64
+    ADMISSION_MAX_WAIT_MS: int = 2_000       # prazo na fila (espera estimada acima disso = recusa imediata)
+
+    # Análise individual (/api/password/analyze e /validate): a estimativa de tentativas
+    # roda no event loop e cresce mais que linear com o tamanho — 422 acima do limite
+    PASSWORD_MAX_LENGTH: int = 1_024
+
+    # Análise em lote (/api/password/analyze/batch)
+    BATCH_MAX_ITEMS: int = 10_000            # senhas por requisição
+    BATCH_MAX_PASSWORD_LENGTH: int = 1_024   # caracteres por senha
+    BATCH_STREAM_THRESHOLD: int = 1_000      # acima disso responde em NDJSON
+    BATCH_CHUNK_SIZE: int = 256              # senhas por tarefa do pool
+    BATCH_WORKERS: int = 0                   # processos do pool (0 = nº de CPUs)
+
+    # Cache de resultados do /api/password/analyze (0 entradas = desativado)
+    ANALYZE_CACHE_MAX_ENTRIES: int = 10_000
+    ANALYZE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    ANALYZE_CACHE_TTL_SECONDS: float = 300.0
+
+    # Gravação em lote (write-behind) do /api/password/validate
+    WRITE_BEHIND_BATCH_ROWS: int = 500       # grava ao acumular N registros...
+    WRITE_BEHIND_FLUSH_MS: int = 200         # ...ou a cada M ms
+    WRITE_BEHIND_MAX_PENDING: int = 50_000   # acima disso descarta os mais antigos
+
+    # Partições mensais de senhas_validador (por created_at, UTC)
+    PARTITION_MONTHS_AHEAD: int = 3          # meses criados com antecedência
+    PARTITION_RETENTION_MONTHS: int = 0      # meses guardados, incluindo o atual (0 = tudo)
+    PARTITION_MAINTENANCE_HOURS: float = 6.0  # intervalo da manutenção no processo (0 = só o comando)
+
+    # Histórico e exportação das análises (/api/password/history e /export)
+    HISTORY_MAX_LIMIT: int = 500             # registros por página
+    EXPORT_FETCH_ROWS: int = 1_000           # linhas por busca no cursor do servidor
+
+    # Canal WebSocket de análise em tempo real (/api/password/live)
+    LIVE_DEBOUNCE_MS: int = 150              # silêncio exigido antes de analisar
+    LIVE_MAX_PASSWORD_LENGTH: int = 1_024
+
+    # Verificador de hash (/api/hash/compute)
+    HASH_CHUNK_SIZE: int = 1024 * 1024       # bytes por bloco entregue aos algoritmos
+    HASH_MAX_BYTES: int = 4 * 1024 ** 3      # tamanho máximo do upload (0 = sem limite)
+    HASH_WORKERS: int = 0                    # threads do pool (0 = nº de CPUs)
+
+    # Verificação de manifestos de checksum (/api/hash/manifest/verify)
+    # Vazio = endpoint desativado; caminhos dos manifestos ficam presos a esta pasta.
+    CHECKSUM_ROOT: str = ""
+    CHECKSUM_CACHE_PATH: str = ""            # cache SQLite de digests (vazio = sem cache)
+    CHECKSUM_WORKERS: int = 0                # threads do pool (0 = 2× nº de CPUs)
+    CHECKSUM_MAX_ENTRIES: int = 200_000      # linhas por manifesto
+
+    # Detector de phishing (/api/phishing)
+    PHISHING_BATCH_MAX_ITEMS: int = 100_000  # URLs por lote
+    PHISHING_MAX_URL_LENGTH: int = 4_096
+    PHISHING_MODEL_PATH: str = ""            # pesos do modelo linear (vazio = app/data/phishing_model.json)
+
+    # Lista de bloqueio de domínios/URLs (python -m app.services.domain_blocklist).
+    # Vazio = desativada; o arquivo é relido ao mudar (e no SIGHUP).
+    DOMAIN_BLOCKLIST_PATH: str = ""
+    DOMAIN_BLOCKLIST_WATCH_SECONDS: float = 30.0   # intervalo da checagem do arquivo (0 = só SIGHUP)
+
+    # Métricas Prometheus (GET /metrics)
+    METRICS_ENABLED: bool = True
+    METRICS_CHECK_SAMPLE_EVERY: int = 64     # cronometra os checks em 1 de cada N análises (0 = nunca)
+
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
     def fix_database_url(cls, v):
@@ -0,0 +1,266 @@
+"""
+Métricas Prometheus da API (exposição em GET /metrics).
+
+  - HTTP      : latência por rota (histograma), requisições por rota/método/
+                status e erros (5xx ou exceção), medidos por um middleware ASGI
+                puro — sem BaseHTTPMiddleware, que custa uma task por requisição
+  - validador : duração de cada check (amostrada: 1 a cada
+                METRICS_CHECK_SAMPLE_EVERY análises) e consultas/acertos da
+                blocklist e do índice de vazamentos
+  - banco     : conexões em uso, overflow e tamanho do pool (lidos no scrape)
+                e tempo de espera para obter uma conexão
+  - limites   : requisições aceitas/recusadas pelo limite por cliente, por rota
+  - admissão  : vagas ocupadas, fila, admitidas e recusadas por classe de rota
+
+Cardinalidade baixa por construção: a rota é o template do FastAPI
+(``/api/password/analyze``), nunca o path bruto; o que não casa com nenhuma
+rota vira ``unmatched`` e métodos fora da lista viram ``OTHER``. Nenhum
+rótulo vem de corpo, query string ou cabeçalho — a senha nunca chega aqui.
+
+Os números por requisição são acumulados em ints/floats comuns por rota (o
+middleware roda só na thread do event loop) e convertidos para o formato
+Prometheus no scrape. Com Histogram/Counter do prometheus_client (que tomam
+locks a cada observação) o middleware custava ~6 µs por requisição; assim,
+~3 µs no total (``python -m benchmarks.bench_metrics``).
+"""
+import time
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Callable, Dict, Optional, Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+from prometheus_client.registry import Collector
+from prometheus_client.utils import floatToGoString
+from starlette.responses import Response
+
+_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+_BUCKET_LABELS = _LATENCY_BUCKETS + (float("inf"),)
+_CHECK_BUCKETS = (
+    0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005, 0.0001,
+    0.00025, 0.0005, 0.001, 0.0025, 0.01,
+)
+_POOL_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+_UNMATCHED = "unmatched"
+
+PASSWORD_CHECK_LATENCY = Histogram(
+    "password_check_duration_seconds", "Duração de cada check do validador (amostrada).",
+    ("check",), buckets=_CHECK_BUCKETS,
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds", "Tempo para obter uma conexão do pool (inclui o pre-ping).",
+    buckets=_POOL_WAIT_BUCKETS,
+)
+
+
+# ---------------------------------------------------------------------------
+# Middleware HTTP
+# ---------------------------------------------------------------------------
+class _RouteStats:
+    """Acumuladores de uma combinação (método, rota)."""
+    __slots__ = ("buckets", "total", "statuses", "errors")
+
+    def __init__(self):
+        self.buckets = [0] * (len(_LATENCY_BUCKETS) + 1)   # não cumulativos; último = +Inf
+        self.total = 0.0
+        self.statuses: Dict[int, int] = {}
+        self.errors = 0
+
+
+_ROUTE_STATS: Dict[Tuple[str, str], _RouteStats] = {}
+
+
+class MetricsMiddleware:
+    """Mede latência, status e erros de cada requisição HTTP (WebSocket passa direto)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500   # se a resposta nem começar (exceção), conta como erro
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            # o roteador do FastAPI grava a rota casada no próprio scope
+            route = scope.get("route")
+            path = getattr(route, "path", None) or _UNMATCHED
+            method = scope["method"]
+            if method not in _METHODS:
+                method = "OTHER"
+            stats = _ROUTE_STATS.get((method, path))
+            if stats is None:
+                stats = _ROUTE_STATS[(method, path)] = _RouteStats()
+            stats.buckets[bisect_left(_LATENCY_BUCKETS, elapsed)] += 1
+            stats.total += elapsed
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            if status >= 500:
+                stats.errors += 1
+
+
+class HttpCollector(Collector):
+    """Converte os acumuladores por rota em histograma e contadores no scrape."""
+
+    def collect(self):
+        latency = HistogramMetricFamily(
+            "http_request_duration_seconds", "Latência das requisições HTTP, até o fim do corpo.",
+            labels=("method", "route"),
+        )
+        requests = CounterMetricFamily(
+            "http_requests", "Requisições HTTP atendidas.", labels=("method", "route", "status"),
+        )
+        errors = CounterMetricFamily(
+            "http_request_errors", "Requisições que terminaram em 5xx ou exceção.",
+            labels=("method", "route"),
+        )
+        for (method, route), stats in list(_ROUTE_STATS.items()):
+            cumulative = list(accumulate(stats.buckets))
+            latency.add_metric(
+                [method, route],
+                [(floatToGoString(le), n) for le, n in zip(_BUCKET_LABELS, cumulative)],
+                stats.total,
+            )
+            for status, count in list(stats.statuses.items()):
+                requests.add_metric([method, route, str(status)], count)
+            errors.add_metric([method, route], stats.errors)
+        yield latency
+        yield requests
+        yield errors
+
+
+# ---------------------------------------------------------------------------
+# Validador e banco
+# ---------------------------------------------------------------------------
+_CHECK_OBSERVERS = {}
+
+
+def observe_checks(laps: Dict[str, float]) -> None:
+    """Observer do validador (set_check_observer): uma amostra por check."""
+    for check, seconds in laps.items():
+        observe = _CHECK_OBSERVERS.get(check)
+        if observe is None:
+            observe = _CHECK_OBSERVERS[check] = PASSWORD_CHECK_LATENCY.labels(check).observe
+        observe(seconds)
+
+
+class ValidatorCollector(Collector):
+    """Consultas e acertos da blocklist / índice de vazamentos, lidos no scrape."""
+
+    def __init__(self, lookup_counts: Callable[[], Dict[str, int]]):
+        self._lookup_counts = lookup_counts
+
+    def collect(self):
+        counts = self._lookup_counts()
+        for source in ("blocklist", "breach"):
+            lookups = CounterMetricFamily(
+                f"password_{source}_lookups", f"Consultas à {source} do validador."
+            )
+            lookups.add_metric([], counts[f"{source}_lookups"])
+            hits = CounterMetricFamily(
+                f"password_{source}_hits", f"Senhas encontradas na {source} do validador."
+            )
+            hits.add_metric([], counts[f"{source}_hits"])
+            yield lookups
+            yield hits
+
+
+class PoolCollector(Collector):
+    """Estado do pool de conexões do SQLAlchemy, lido no scrape."""
+
+    def __init__(self, pool):
+        self._pool = pool
+
+    def collect(self):
+        pool = self._pool
+        for name, doc, value in (
+            ("db_pool_size", "Conexões permanentes configuradas no pool.", pool.size()),
+            ("db_pool_checked_out", "Conexões em uso.", pool.checkedout()),
+            ("db_pool_checked_in", "Conexões ociosas no pool.", pool.checkedin()),
+            ("db_pool_overflow", "Conexões além de pool_size (negativo = folga).", pool.overflow()),
+        ):
+            gauge = GaugeMetricFamily(name, doc)
+            gauge.add_metric([], value)
+            yield gauge
+
+
+class RateLimitCollector(Collector):
+    """Requisições aceitas e recusadas (429) pelo limite por cliente, por rota."""
+
+    def __init__(self, counts: Callable[[], Dict[str, Tuple[int, int]]]):
+        self._counts = counts
+
+    def collect(self):
+        requests = CounterMetricFamily(
+            "rate_limit_requests", "Requisições avaliadas pelo limite por cliente.",
+            labels=("route", "outcome"),
+        )
+        for route, (allowed, limited) in self._counts().items():
+            requests.add_metric([route, "allowed"], allowed)
+            requests.add_metric([route, "limited"], limited)
+        yield requests
+
+
+class AdmissionCollector(Collector):
+    """Vagas ocupadas, fila, admitidas e recusadas (503) por classe do controle de admissão."""
+
+    def __init__(self, gate_stats: Callable[[], Dict[str, dict]]):
+        self._gate_stats = gate_stats
+
+    def collect(self):
+        active = GaugeMetricFamily(
+            "admission_active", "Requisições em atendimento por classe.", labels=("class",)
+        )
+        depth = GaugeMetricFamily(
+            "admission_queue_depth", "Requisições esperando vaga por classe.", labels=("class",)
+        )
+        admitted = CounterMetricFamily(
+            "admission_admitted", "Requisições admitidas por classe.", labels=("class",)
+        )
+        shed = CounterMetricFamily(
+            "admission_shed", "Requisições recusadas com 503 por classe e motivo.", labels=("class", "reason")
+        )
+        for cls, stats in self._gate_stats().items():
+            active.add_metric([cls], stats["active"])
+            depth.add_metric([cls], stats["queue_depth"])
+            admitted.add_metric([cls], stats["admitted"])
+            for reason, count in stats["shed"].items():
+                shed.add_metric([cls, reason], count)
+        yield active
+        yield depth
+        yield admitted
+        yield shed
+
+
+def register_collectors(
+    lookup_counts: Callable[[], Dict[str, int]],
+    pool,
+    rate_limit_counts: Optional[Callable[[], Dict[str, Tuple[int, int]]]] = None,
+    admission_stats: Optional[Callable[[], Dict[str, dict]]] = None,
+) -> None:
+    REGISTRY.register(HttpCollector())
+    REGISTRY.register(ValidatorCollector(lookup_counts))
+    REGISTRY.register(PoolCollector(pool))
+    if rate_limit_counts is not None:
+        REGISTRY.register(RateLimitCollector(rate_limit_counts))
+    if admission_stats is not None:
+        REGISTRY.register(AdmissionCollector(admission_stats))
+
+
+def metrics_response() -> Response:
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,88 @@
+"""
+Middleware ASGI do limite de requisições (``services/rate_limiter``).
+
+Roda antes do roteamento: uma rota limitada é reconhecida pelo path exato e
+a requisição recusada nem tem o corpo lido — um lote de 10 mil senhas
+rejeitado não custa o parse do JSON. A resposta é ``429`` com
+``Retry-After`` (segundos, arredondado para cima) e o corpo de erro padrão
+do FastAPI. WebSockets passam direto (o canal ``/live`` tem debounce próprio).
+
+O cliente é o IP da conexão. ``X-Forwarded-For`` só conta quando a conexão vem
+de um proxy em TRUSTED_PROXIES: o cabeçalho é lido da direita para a esquerda
+e vale o primeiro endereço que não é proxy confiável. O primeiro da lista é
+escrito pelo próprio cliente — usá-lo como chave daria um balde novo a cada
+valor inventado.
+"""
+import ipaddress
+import math
+from functools import lru_cache
+from typing import List, Union
+
+from starlette.responses import JSONResponse
+
+from app.services.rate_limiter import RateLimiter
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def parse_trusted_proxies(spec: str) -> List[Network]:
+    """``"10.0.0.0/8, 127.0.0.1"`` → redes; ValueError se mal formado."""
+    try:
+        return [ipaddress.ip_network(item.strip(), strict=False) for item in spec.split(",") if item.strip()]
+    except ValueError as exc:
+        raise ValueError(f"TRUSTED_PROXIES inválido: {exc}") from exc
+
+
+class ClientAddress:
+    """IP do cliente de um scope ASGI, confiando em X-Forwarded-For só a partir de ``trusted``."""
+
+    def __init__(self, trusted: List[Network]):
+        self.trusted = trusted
+
+        @lru_cache(maxsize=1024)
+        def is_trusted(host: str) -> bool:
+            try:
+                address = ipaddress.ip_address(host)
+            except ValueError:
+                return False
+            return any(address in network for network in trusted)
+
+        self._is_trusted = is_trusted   # cache sem referência ao self (sem ciclo)
+
+    def __call__(self, scope) -> str:
+        client = scope.get("client")
+        peer = client[0] if client else "desconhecido"
+        if not self.trusted or not self._is_trusted(peer):
+            return peer
+        hops = [
+            hop.strip()
+            for name, value in scope["headers"] if name == b"x-forwarded-for"
+            for hop in value.decode("latin-1").split(",")
+        ]
+        for hop in reversed(hops):
+            if hop and not self._is_trusted(hop):
+                return hop
+        return hops[0] if hops and hops[0] else peer   # cadeia toda de proxies confiáveis
+
+
+class RateLimitMiddleware:
+    """Aplica ``limiter`` às rotas configuradas, por IP do cliente (ver ``ClientAddress``)."""
+
+    def __init__(self, app, limiter: RateLimiter, trusted_proxies: List[Network]):
+        self.app = app
+        self.limiter = limiter
+        self.client_address = ClientAddress(trusted_proxies)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.limiter.limits:
+            wait = self.limiter.check(scope["path"], self.client_address(scope))
+            if wait > 0:
+                retry_after = max(1, math.ceil(wait))
+                response = JSONResponse(
+                    {"detail": f"Muitas requisições. Tente novamente em {retry_after} s."},
+                    status_code=429,
+                    headers={"Retry-After": str(retry_after)},
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
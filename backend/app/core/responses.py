@@ -0,0 +1,22 @@
+"""
+Respostas HTTP compartilhadas pelos routers.
+"""
+from typing import Any, Iterable, Union
+
+from fastapi.responses import JSONResponse
+
+
+class PreEncodedJSONResponse(JSONResponse):
+    """
+    Corpo JSON já serializado (bytes, ou fragmentos a concatenar).
+
+    Ao retornar uma instância de Response o FastAPI não revalida o dict contra
+    o ``response_model`` nem passa pelo jsonable_encoder — o ``response_model``
+    da rota continua valendo só para a documentação OpenAPI (por isso a
+    herança de JSONResponse: é ela que faz o FastAPI publicar o schema).
+    """
+
+    def render(self, content: Union[bytes, Iterable[bytes], Any]) -> bytes:
+        if isinstance(content, (bytes, bytearray)):
+            return bytes(content)
+        return b"".join(content)
@@ -3,9 +3,11 @@ Configuração da conexão assíncrona com o PostgreSQL usando SQLAlchemy.
 """
 import os
 import ssl
+import time
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from app.core.config import settings
+from app.core.metrics import DB_POOL_WAIT
 
 _is_production = os.getenv("ENVIRONMENT", "development") == "production"
 
@@ -56,6 +58,10 @@ async def get_db() -> AsyncSession:
     """Dependency do FastAPI — injeta uma sessão de banco por request."""
     async with AsyncSessionLocal() as session:
         try:
+            # conexão obtida já aqui (e não na 1ª query) para medir a espera no pool
+            started = time.perf_counter()
+            await session.connection()
+            DB_POOL_WAIT.observe(time.perf_counter() - started)
             yield session
             await session.commit()
         except Exception:
@@ -1,15 +1,91 @@
+import asyncio
+import logging
+import signal
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import password
+from fastapi.responses import JSONResponse
+from app.routers import hash, password, phishing
 from app.core.config import settings, get_allowed_origins
+from app.core.metrics import MetricsMiddleware, metrics_response, observe_checks, register_collectors
+from app.core.admission import AdmissionMiddleware
+from app.core.rate_limit import RateLimitMiddleware, parse_trusted_proxies
+from app.database import engine
+from app.services.batch_validator import shutdown_pool
+from app.services.checksum_manifest import shutdown_pool as shutdown_checksum_pool
+from app.services import domain_blocklist
+from app.services.password_policy import PolicyError, get_policy, reload_policies
+from app.services.admission_control import build_gates
+from app.services.rate_limiter import build_limiter
+from app.services.hash_checker import shutdown_pool as shutdown_hash_pool
+from app.repositories import particoes
+from app.repositories.fila_gravacao import fila_gravacao
+from app.services.password_validator import (
+    data_status,
+    lookup_counts,
+    reload_blocklists,
+    set_check_observer,
+    warm_up,
+)
 import app.models.senha_validador_model  # noqa: F401 — registra o model no metadata
+import app.models.senha_validador_resumo_model  # noqa: F401
+
+
+logger = logging.getLogger(__name__)
+
+
+def _reload_all() -> None:
+    try:
+        reload_policies()
+    except PolicyError:
+        # arquivo de políticas inválido: segue com as atuais e recarrega o resto
+        logger.exception("Falha ao recarregar as políticas de senha")
+    reload_blocklists()   # limpa o cache do /analyze e recicla o pool do lote
+    domain_blocklist.reload_domain_blocklist()
+
+
+def _log_warm_up_failure(future: asyncio.Future) -> None:
+    # o future do executor não é aguardado: sem isto a exceção se perderia
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(
+            "Falha ao carregar os dados do validador; /api/ready segue 503",
+            exc_info=future.exception(),
+        )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan — tabelas criadas pelo Alembic no build do Render."""
+    # kill -HUP <pid do worker> recarrega políticas, blocklist/índice de vazamentos
+    # (e invalida o cache do /analyze) e a lista de domínios sem reiniciar o servidor
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, _reload_all)
+    except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+        pass   # Windows / fora da thread principal
+    get_policy()   # compila as políticas de senha: arquivo inválido falha já no startup
+    fila_gravacao.iniciar()
+    # dados do validador carregados fora do event loop: o servidor já aceita
+    # conexões e /api/ready responde 503 até terminarem
+    if settings.VALIDATOR_PRELOAD:
+        preload = asyncio.get_running_loop().run_in_executor(None, warm_up)
+        preload.add_done_callback(_log_warm_up_failure)
+    # troca da lista de domínios detectada pelo arquivo (build com os.replace)
+    watcher = None
+    if settings.DOMAIN_BLOCKLIST_PATH and settings.DOMAIN_BLOCKLIST_WATCH_SECONDS > 0:
+        watcher = asyncio.create_task(domain_blocklist.watch(settings.DOMAIN_BLOCKLIST_WATCH_SECONDS))
+    # partições mensais de senhas_validador: cria as próximas e aplica a retenção
+    manutencao = None
+    if settings.PARTITION_MAINTENANCE_HOURS > 0:
+        manutencao = asyncio.create_task(particoes.executar_periodicamente(settings.PARTITION_MAINTENANCE_HOURS))
     yield
+    if watcher is not None:
+        watcher.cancel()
+    if manutencao is not None:
+        manutencao.cancel()
+    await fila_gravacao.encerrar()   # drena as análises pendentes no banco
+    shutdown_pool()   # encerra o pool de processos da análise em lote
+    shutdown_hash_pool()
+    shutdown_checksum_pool()
 
 
 app = FastAPI(
@@ -19,6 +95,18 @@ app = FastAPI(
     version="1.0.0",
 )
 
+# Controle de admissão: o mais interno — só ocupa vaga quem passou pelo limite por cliente
+admission_gates = build_gates()
+if admission_gates:
+    app.add_middleware(AdmissionMiddleware, gates=admission_gates)
+
+# Limite por cliente: registrado antes do CORS = roda dentro dele (o 429 leva os cabeçalhos CORS)
+rate_limiter = build_limiter()
+if rate_limiter is not None:
+    app.add_middleware(
+        RateLimitMiddleware, limiter=rate_limiter, trusted_proxies=parse_trusted_proxies(settings.TRUSTED_PROXIES)
+    )
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=get_allowed_origins(),
@@ -27,7 +115,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Métricas: registrado por último = middleware mais externo (mede inclusive o CORS)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    set_check_observer(observe_checks, settings.METRICS_CHECK_SAMPLE_EVERY)
+    register_collectors(
+        lookup_counts,
+        engine.sync_engine.pool,
+        rate_limiter.counts if rate_limiter is not None else None,
+        (lambda: {cls: gate.stats() for cls, gate in admission_gates.items()}) if admission_gates else None,
+    )
+
 app.include_router(password.router)
+app.include_router(hash.router)
+app.include_router(phishing.router)
 
 
 @app.get("/api/tools")
@@ -47,7 +148,7 @@ async def get_tools():
             "description": "Verifique se um arquivo foi adulterado comparando seu hash.",
             "icon": "🔍",
             "route": "/hash",
-            "available": False,
+            "available": True,
         },
         {
             "id": "phishing-detector",
@@ -55,11 +156,36 @@ async def get_tools():
             "description": "Analise URLs suspeitas para identificar tentativas de phishing.",
             "icon": "🎣",
             "route": "/phishing",
-            "available": False,
+            "available": True,
         },
     ]
 
 
+@app.get("/api/ready")
+async def ready():
+    """
+    Readiness: 200 quando os dados do validador (blocklist, índice de
+    vazamentos) estão carregados, 503 enquanto não. Informa a origem e a
+    versão do snapshot em uso e a lista de domínios do detector de
+    phishing. Com VALIDATOR_PRELOAD desligado os dados só
+    carregam na primeira análise, então o serviço é dado como pronto.
+    """
+    status = data_status()
+    is_ready = status["loaded"] or not settings.VALIDATOR_PRELOAD
+    return JSONResponse(
+        {"ready": is_ready, "validator": status, "domain_blocklist": domain_blocklist.status()},
+        status_code=200 if is_ready else 503,
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Exposição Prometheus (texto). 404 com METRICS_ENABLED desligado."""
+    if not settings.METRICS_ENABLED:
+        return JSONResponse({"detail": "Not Found"}, status_code=404)
+    return metrics_response()
+
+
 @app.get("/")
 async def root():
     return {"message": "CyberSec Tool Suite API is running!"}
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import Dict, Optional
+
+
+class HashResponse(BaseModel):
+    size: int                                  # bytes recebidos
+    digests: Dict[str, str]                    # algoritmo → digest em hexadecimal
+    expected_match: Optional[bool] = None      # só quando o digest esperado é informado
+    matched_algorithm: Optional[str] = None    # algoritmo cujo digest bateu
+    elapsed_ms: float
+    throughput_mb_s: float
+
+
+class ManifestVerifyRequest(BaseModel):
+    manifest: str                     # conteúdo do manifesto (sha256sum, BSD --tag, .sfv)
+    manifest_name: str = ""           # nome do arquivo (SHA512SUMS, .sfv) — indica o algoritmo
+    root: str = ""                    # subpasta de CHECKSUM_ROOT onde estão os arquivos
+    algorithm: Optional[str] = None   # força o algoritmo
+    report_ok: bool = False           # emite também os arquivos OK
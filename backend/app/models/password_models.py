@@ -1,22 +1,28 @@
-from pydantic import BaseModel
-from typing import Dict, List
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+from typing import Dict, List, Literal, Optional
+
+from app.core.config import settings
 
 
 class PasswordRequest(BaseModel):
-    password: str
+    password: str = Field(max_length=settings.PASSWORD_MAX_LENGTH)
 
 
 class PasswordChecks(BaseModel):
+    """None = check não executado (política com short_circuit já reprovou a senha)."""
     length_ok: bool
     length_great: bool
     has_uppercase: bool
     has_lowercase: bool
     has_digit: bool
     has_special: bool
-    not_common: bool
+    not_common: Optional[bool]
     no_repeated_chars: bool
-    no_sequential_chars: bool
-    no_keyboard_pattern: bool
+    no_sequential_chars: Optional[bool]
+    no_keyboard_pattern: Optional[bool]
+    not_breached: Optional[bool]
 
 
 class PasswordResponse(BaseModel):
@@ -24,8 +30,57 @@ class PasswordResponse(BaseModel):
     strength_label: str
     strength_color: str
     entropy_bits: float
-    is_common: bool
+    guesses_log10: Optional[float]   # log10 das tentativas estimadas (decomposição em padrões)
+    is_common: Optional[bool]
+    breach_count: Optional[int]
     checks: PasswordChecks
     tips: List[str]
     positive_feedbacks: List[str]
 
+
+class PasswordPolicyInfo(BaseModel):
+    id: str
+    description: str
+    default: bool
+
+
+class PasswordBatchRequest(BaseModel):
+    passwords: List[str]
+
+
+class PasswordBatchResponse(BaseModel):
+    total: int
+    results: List[PasswordResponse]
+
+
+class PasswordHistoryItem(BaseModel):
+    """Análise gravada — só métricas derivadas, nada que identifique o usuário."""
+    created_at: datetime
+    score: int
+    strength_label: str
+    entropy_bits: float
+    is_common: Optional[bool]   # None = não verificada (política com short_circuit)
+    comprimento: int
+    tem_maiuscula: bool
+    tem_minuscula: bool
+    tem_numero: bool
+    tem_especial: bool
+
+
+class PasswordHistoryResponse(BaseModel):
+    items: List[PasswordHistoryItem]
+    next_cursor: Optional[str]   # None = última página
+
+
+class LiveInput(BaseModel):
+    """
+    Frame do canal WebSocket de análise em tempo real.
+      - set    : substitui a senha inteira (``password``)
+      - append : acrescenta ``text`` ao final
+      - delete : remove ``count`` caracteres do final (backspace)
+    """
+    op: Literal["set", "append", "delete"]
+    password: str = ""
+    text: str = ""
+    count: int = 1
+    seq: Optional[int] = None
@@ -0,0 +1,37 @@
+from pydantic import BaseModel
+from typing import Dict, List, Literal, Optional
+
+Verdict = Literal["legitimate", "suspicious", "phishing"]
+
+
+class PhishingRequest(BaseModel):
+    url: str
+
+
+class PhishingResponse(BaseModel):
+    url: str
+    score: float                          # probabilidade de phishing (0–1) do modelo linear
+    verdict: Verdict
+    host: str                             # forma Unicode (punycode decodificado)
+    registrable_domain: Optional[str]     # None para IP ou sufixo público puro
+    public_suffix: Optional[str]
+    brand: Optional[str]                  # marca imitada, citada ou dona do domínio
+    blocklist_match: Optional[str]        # entrada da lista de bloqueio (domínio ou URL)
+    features: Dict[str, float]            # valores de entrada do modelo
+    reasons: List[str]                    # features que mais pesaram no score
+    model_version: str
+
+
+class PhishingBatchRequest(BaseModel):
+    urls: List[str]
+
+
+class PhishingBatchResponse(BaseModel):
+    """Resultado em colunas, na ordem de entrada (índice i = urls[i])."""
+    total: int
+    scores: List[float]
+    verdicts: List[Verdict]
+    domains: List[Optional[str]]          # domínio registrável (ou o host, se IP)
+    blocklisted: List[bool]               # host (ou domínio pai) ou URL na lista de bloqueio
+    model_version: str
+    elapsed_ms: float
@@ -4,24 +4,32 @@ Model SQLAlchemy da tabela senhas_validador.
 Colunas:
   - id              : UUID, chave primária gerada automaticamente
   - created_at      : timestamp com fuso horário do momento do registro
-  - senha_capturada : senha digitada pelo usuário (capturada após 3s de inatividade)
-  - ip_origem       : endereço IP da máquina que fez a requisição
-  - user_agent      : navegador/sistema operacional do usuário
+  - senha_capturada : (legado) senha digitada — não é mais gravada
+  - ip_origem       : (legado) endereço IP — não é mais gravado
+  - user_agent      : (legado) navegador/SO — não é mais gravado
   - score           : pontuação de força da senha (0–5)
   - strength_label  : rótulo textual da força (ex: "Forte")
   - entropy_bits    : entropia calculada em bits
-  - is_common       : indica se a senha está na lista de senhas comuns
+  - is_common       : indica se a senha está na lista de senhas comuns (nulo =
+                      não verificada: a política reprovou a senha antes)
   - comprimento     : quantidade de caracteres da senha
   - tem_maiuscula   : booleano indicando presença de letra maiúscula
   - tem_minuscula   : booleano indicando presença de letra minúscula
   - tem_numero      : booleano indicando presença de número
   - tem_especial    : booleano indicando presença de caractere especial
+
+Índice (created_at, id): ordem total e estável para a paginação por cursor
+(keyset) e para a exportação, sem depender de OFFSET.
+
+Particionada por faixa de created_at, uma partição por mês (migration
+f1a9c3e5b7d2; manutenção em repositories/particoes.py). A PK de uma tabela
+particionada precisa conter a chave de partição, por isso é (id, created_at).
 """
 import uuid
 from datetime import datetime, timezone
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Float, Integer, String, Text
+    Boolean, Column, DateTime, Float, Index, Integer, String, Text
 )
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -30,6 +38,10 @@ from app.database import Base
 
 class SenhaValidador(Base):
     __tablename__ = "senhas_validador"
+    __table_args__ = (
+        Index("ix_senhas_validador_created_at_id", "created_at", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     # ---- Identificação -------------------------------------------------------
     id = Column(
@@ -42,23 +54,24 @@ class SenhaValidador(Base):
 
     created_at = Column(
         DateTime(timezone=True),
+        primary_key=True,
         default=lambda: datetime.now(timezone.utc),
         nullable=False,
-        index=True,
         comment="Data e hora em que a senha foi capturada (UTC)",
     )
 
     # ---- Dados capturados do usuário -----------------------------------------
+    # A fila de gravação persiste só métricas derivadas; as colunas abaixo
+    # ficam nulas em registros novos e existem apenas para dados legados.
     senha_capturada = Column(
         Text,
-        nullable=False,
-        comment="Senha digitada pelo usuário, capturada após 3s de inatividade",
+        nullable=True,
+        comment="Legado — senha digitada pelo usuário; não é mais gravada",
     )
 
     ip_origem = Column(
         String(45),   # suporta IPv4 (15) e IPv6 (45)
         nullable=True,
-        index=True,
         comment="Endereço IP da máquina que enviou a requisição",
     )
 
@@ -89,9 +102,8 @@ class SenhaValidador(Base):
 
     is_common = Column(
         Boolean,
-        nullable=False,
-        default=False,
-        comment="True se a senha constar na lista de senhas mais comuns",
+        nullable=True,
+        comment="True se a senha constar na lista de senhas mais comuns; nulo = não verificada",
     )
 
     # ---- Características da senha -------------------------------------------
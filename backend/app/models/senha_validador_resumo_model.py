@@ -0,0 +1,41 @@
+"""
+Model SQLAlchemy da tabela senhas_validador_resumo_diario.
+
+Rollup mantido pelo SenhaValidadorRepository na mesma transação de cada
+INSERT em senhas_validador — o /api/password/stats lê O(dias × 6) linhas
+daqui em vez de varrer a tabela de análises inteira.
+
+Colunas:
+  - dia   : data (UTC) em que as análises foram registradas
+  - score : pontuação de força (0–5)
+  - total : quantidade de análises naquele dia com aquele score
+"""
+from sqlalchemy import BigInteger, Column, Date, Integer
+
+from app.database import Base
+
+
+class SenhaValidadorResumoDiario(Base):
+    __tablename__ = "senhas_validador_resumo_diario"
+
+    dia = Column(
+        Date,
+        primary_key=True,
+        comment="Data (UTC) de registro das análises",
+    )
+
+    score = Column(
+        Integer,
+        primary_key=True,
+        comment="Pontuação de força da senha de 0 (muito fraca) a 5 (muito forte)",
+    )
+
+    total = Column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment="Quantidade de análises no dia com este score",
+    )
+
+    def __repr__(self) -> str:
+        return f"<SenhaValidadorResumoDiario dia={self.dia} score={self.score} total={self.total}>"
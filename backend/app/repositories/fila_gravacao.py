@@ -0,0 +1,109 @@
+"""
+Fila de gravação em lote (write-behind) das análises de senha.
+
+O /api/password/validate apenas enfileira as métricas da análise e responde
+na hora — sem segurar uma conexão do pool durante a requisição. Uma task de
+fundo agrupa os registros e grava a cada ``lote`` linhas ou ``intervalo_ms``
+milissegundos (o que vier primeiro), com um INSERT multi-linha e um upsert
+agregado do rollup diário, em uma única transação por lote.
+
+A fila é limitada: se o banco não acompanhar, os registros mais antigos são
+descartados (e contados) em vez de acumular memória. No shutdown (lifespan)
+a fila é drenada antes de fechar.
+"""
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Optional
+
+from app.core.config import settings
+from app.database import AsyncSessionLocal
+from app.repositories.senha_validador_repository import SenhaValidadorRepository
+
+logger = logging.getLogger(__name__)
+
+
+class FilaGravacao:
+
+    def __init__(self, lote: int, intervalo_ms: int, max_pendentes: int):
+        self.lote = lote
+        self.intervalo = intervalo_ms / 1000
+        self._pendentes: Deque[dict] = deque(maxlen=max_pendentes)
+        self._sinal = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._encerrando = False
+        self.gravados = 0
+        self.descartados = 0
+        self.falhas = 0
+
+    def iniciar(self) -> None:
+        """Inicia a task de gravação (lifespan; ou sob demanda no 1º registro)."""
+        if self._task is None or self._task.done():
+            self._encerrando = False
+            self._sinal = asyncio.Event()   # vinculado ao event loop atual
+            self._task = asyncio.create_task(self._executar())
+
+    def enfileirar(self, dados: dict) -> None:
+        """Não bloqueia: o registro é gravado pela task de fundo."""
+        if self._task is None or self._task.done():
+            self.iniciar()
+        dados.setdefault("created_at", datetime.now(timezone.utc))   # horário da análise
+        if len(self._pendentes) == self._pendentes.maxlen:
+            self.descartados += 1   # deque com maxlen descarta o mais antigo
+        self._pendentes.append(dados)
+        if len(self._pendentes) >= self.lote:
+            self._sinal.set()
+
+    async def encerrar(self) -> None:
+        """Drena o que estiver pendente e encerra a task (shutdown)."""
+        if self._task is None:
+            return
+        self._encerrando = True
+        self._sinal.set()
+        await self._task
+        self._task = None
+
+    def estatisticas(self) -> dict:
+        return {
+            "pendentes": len(self._pendentes),
+            "gravados": self.gravados,
+            "descartados": self.descartados,
+            "falhas": self.falhas,
+        }
+
+    async def _executar(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._sinal.wait(), timeout=self.intervalo)
+            except asyncio.TimeoutError:
+                pass
+            self._sinal.clear()
+
+            while self._pendentes:
+                n = min(self.lote, len(self._pendentes))
+                registros = [self._pendentes.popleft() for _ in range(n)]
+                await self._gravar(registros)
+                if len(self._pendentes) < self.lote and not self._encerrando:
+                    break   # resto espera o próximo intervalo
+
+            if self._encerrando and not self._pendentes:
+                return
+
+    async def _gravar(self, registros: list[dict]) -> None:
+        try:
+            async with AsyncSessionLocal() as session:
+                async with session.begin():
+                    await SenhaValidadorRepository(session).salvar_lote(registros)
+            self.gravados += len(registros)
+        except Exception:
+            # o lote é perdido — a captura é secundária e não pode travar a fila
+            self.falhas += len(registros)
+            logger.exception("Falha ao gravar lote de %d análises", len(registros))
+
+
+fila_gravacao = FilaGravacao(
+    lote=settings.WRITE_BEHIND_BATCH_ROWS,
+    intervalo_ms=settings.WRITE_BEHIND_FLUSH_MS,
+    max_pendentes=settings.WRITE_BEHIND_MAX_PENDING,
+)
@@ -0,0 +1,150 @@
+"""
+Manutenção das partições mensais de senhas_validador.
+
+A tabela é particionada por faixa de created_at, uma partição por mês (UTC),
+chamada ``senhas_validador_pAAAAMM`` (migration f1a9c3e5b7d2). Sem partição
+para o mês, o INSERT falha — por isso a manutenção cria as partições com
+``PARTITION_MONTHS_AHEAD`` meses de antecedência, e uma falha pontual (banco
+fora, lock ocupado) só é corrigida na próxima rodada, bem antes de o mês
+chegar.
+
+Retenção: com ``PARTITION_RETENTION_MONTHS`` > 0, os meses que terminaram
+antes do corte saem com ``DROP TABLE`` da partição — O(1), sem DELETE em
+massa, sem inchar índices nem gerar trabalho para o vacuum. O rollup diário
+não é apagado: ele guarda só contagens, e o /stats continua somando todas as
+análises já feitas.
+
+Roda numa transação com advisory lock (com vários workers, só um mantém) e
+``lock_timeout`` curto: criar ou remover partição pede lock exclusivo na
+tabela-mãe, e esperar atrás de uma exportação longa travaria os INSERTs
+enfileirados atrás dele. Com o timeout, a partição fica para a próxima rodada.
+
+Uso (a partir de backend/), ex. em um cron quando PARTITION_MAINTENANCE_HOURS=0:
+    python -m app.commands.manter_particoes
+"""
+import asyncio
+import logging
+import re
+from datetime import date, datetime, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+_TABELA = "senhas_validador"
+_NOME = re.compile(rf"^{_TABELA}_p(\d{{4}})(\d{{2}})$")
+_ADVISORY_LOCK = 0x53564D50   # "SVMP": uma manutenção por vez entre os workers
+_LOCK_TIMEOUT = "5s"
+
+
+def inicio_do_mes(dia: date, meses: int = 0) -> date:
+    """Primeiro dia do mês de ``dia`` deslocado de ``meses`` (negativo = para trás)."""
+    indice = dia.year * 12 + dia.month - 1 + meses
+    return date(indice // 12, indice % 12 + 1, 1)
+
+
+def nome_particao(mes: date) -> str:
+    return f"{_TABELA}_p{mes:%Y%m}"
+
+
+async def listar_particoes(session: AsyncSession) -> List[date]:
+    """Meses (primeiro dia) das partições existentes, em ordem."""
+    resultado = await session.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = CAST(:tabela AS regclass)"
+    ), {"tabela": _TABELA})
+    meses = []
+    for (nome,) in resultado:
+        casamento = _NOME.match(nome)
+        if casamento:   # partições fora da convenção não são tocadas
+            meses.append(date(int(casamento[1]), int(casamento[2]), 1))
+    return sorted(meses)
+
+
+async def criar_particoes(session: AsyncSession, hoje: date, meses_a_frente: int) -> List[str]:
+    """Cria as partições que faltam do mês de ``hoje`` até ``meses_a_frente`` meses depois."""
+    existentes = set(await listar_particoes(session))
+    criadas = []
+    for deslocamento in range(meses_a_frente + 1):
+        mes = inicio_do_mes(hoje, deslocamento)
+        if mes in existentes:
+            continue
+        if await _ddl(session, (
+            f"CREATE TABLE IF NOT EXISTS {nome_particao(mes)} PARTITION OF {_TABELA} "
+            f"FOR VALUES FROM ('{mes} 00:00:00+00') TO ('{inicio_do_mes(mes, 1)} 00:00:00+00')"
+        )):
+            criadas.append(nome_particao(mes))
+    return criadas
+
+
+async def remover_expiradas(session: AsyncSession, hoje: date, retencao_meses: int) -> List[str]:
+    """
+    Remove as partições de meses inteiramente anteriores à janela de retenção:
+    com retenção de N meses, ficam o mês corrente e os N-1 anteriores.
+    """
+    corte = inicio_do_mes(hoje, -(retencao_meses - 1))
+    removidas = []
+    for mes in await listar_particoes(session):
+        if mes >= corte:
+            break
+        if await _ddl(session, f"DROP TABLE IF EXISTS {nome_particao(mes)}"):
+            removidas.append(nome_particao(mes))
+    return removidas
+
+
+async def _ddl(session: AsyncSession, comando: str) -> bool:
+    """Executa ``comando`` num savepoint; False (e segue) se falhar — em geral, lock que não veio a tempo."""
+    try:
+        async with session.begin_nested():
+            await session.execute(text(comando))
+        return True
+    except DBAPIError:
+        logger.warning("Manutenção de partições adiada: %s", comando, exc_info=True)
+        return False
+
+
+async def manter_particoes(
+    hoje: Optional[date] = None,
+    meses_a_frente: Optional[int] = None,
+    retencao_meses: Optional[int] = None,
+) -> Optional[Tuple[List[str], List[str]]]:
+    """
+    Uma rodada de manutenção: cria as partições à frente e aplica a retenção.
+    Retorna (criadas, removidas), ou None se outro processo já está mantendo.
+    """
+    hoje = hoje or datetime.now(timezone.utc).date()
+    if meses_a_frente is None:
+        meses_a_frente = settings.PARTITION_MONTHS_AHEAD
+    if retencao_meses is None:
+        retencao_meses = settings.PARTITION_RETENTION_MONTHS
+
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            bloqueado = await session.execute(
+                text("SELECT pg_try_advisory_xact_lock(:chave)"), {"chave": _ADVISORY_LOCK}
+            )
+            if not bloqueado.scalar_one():
+                return None
+            await session.execute(text(f"SET LOCAL lock_timeout = '{_LOCK_TIMEOUT}'"))
+            criadas = await criar_particoes(session, hoje, meses_a_frente)
+            removidas = await remover_expiradas(session, hoje, retencao_meses) if retencao_meses > 0 else []
+    if criadas or removidas:
+        logger.info("Partições de %s: criadas %s, removidas %s", _TABELA, criadas, removidas)
+    return criadas, removidas
+
+
+async def executar_periodicamente(intervalo_horas: float) -> None:
+    """Manutenção no startup e a cada ``intervalo_horas`` (task do lifespan)."""
+    while True:
+        try:
+            await manter_particoes()
+        except Exception:
+            # banco indisponível agora: as partições à frente dão margem até a próxima rodada
+            logger.exception("Falha na manutenção das partições de %s", _TABELA)
+        await asyncio.sleep(intervalo_horas * 3600)
@@ -1,10 +1,65 @@
 """
 Repositório da tabela senhas_validador.
 Responsável por todas as operações de leitura e escrita no banco.
+
+Cada escrita também atualiza o rollup senhas_validador_resumo_diario na mesma
+transação; as estatísticas agregadas são lidas de lá.
+
+Leituras de registros (listagem e exportação) trazem só as colunas derivadas
+da análise — nunca senha_capturada, ip_origem ou user_agent — e percorrem a
+tabela pelo índice (created_at, id): a listagem por cursor (keyset), sem
+OFFSET, e a exportação por um cursor do lado do servidor.
+
+A tabela é particionada por mês em created_at: toda leitura limitada no
+tempo compara created_at diretamente com o limite, para o Postgres descartar
+as partições fora do intervalo (partition pruning) em vez de abrir todas.
 """
+import base64
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional, Sequence
+
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc
+from sqlalchemy import insert, select, func, desc, literal_column, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.models.senha_validador_model import SenhaValidador
+from app.models.senha_validador_resumo_model import SenhaValidadorResumoDiario
+
+
+# Colunas expostas na listagem e na exportação (métricas derivadas apenas)
+COLUNAS_DERIVADAS = (
+    SenhaValidador.created_at,
+    SenhaValidador.score,
+    SenhaValidador.strength_label,
+    SenhaValidador.entropy_bits,
+    SenhaValidador.is_common,
+    SenhaValidador.comprimento,
+    SenhaValidador.tem_maiuscula,
+    SenhaValidador.tem_minuscula,
+    SenhaValidador.tem_numero,
+    SenhaValidador.tem_especial,
+)
+NOMES_DERIVADOS = tuple(coluna.key for coluna in COLUNAS_DERIVADAS)
+
+Cursor = tuple[datetime, uuid.UUID]
+
+
+def codificar_cursor(created_at: datetime, id_: uuid.UUID) -> str:
+    """Cursor opaco (base64 URL-safe) da posição após o registro (created_at, id)."""
+    bruto = f"{created_at.isoformat()}|{id_}".encode("ascii")
+    return base64.urlsafe_b64encode(bruto).decode("ascii").rstrip("=")
+
+
+def decodificar_cursor(cursor: str) -> Cursor:
+    """Inverso de codificar_cursor; ValueError se o cursor for inválido."""
+    try:
+        bruto = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        created_at, id_ = bruto.split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(id_)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Cursor inválido.") from exc
 
 
 class SenhaValidadorRepository:
@@ -18,39 +73,152 @@ class SenhaValidadorRepository:
 
     async def salvar(self, dados: dict) -> SenhaValidador:
         """Persiste um novo registro de análise de senha no banco."""
+        dados.setdefault("created_at", datetime.now(timezone.utc))
         registro = SenhaValidador(**dados)
         self.session.add(registro)
         await self.session.flush()   # obtém o id sem fazer commit (commit feito pelo get_db)
         await self.session.refresh(registro)
+        await self._incrementar_resumo([{
+            "dia": registro.created_at.astimezone(timezone.utc).date(),
+            "score": registro.score,
+            "total": 1,
+        }])
         return registro
 
+    async def salvar_lote(self, registros: list[dict]) -> int:
+        """
+        Persiste vários registros com um INSERT multi-linha e atualiza o rollup
+        diário com um único upsert agregado por (dia, score). Usado pela fila
+        de gravação em lote (write-behind).
+        """
+        if not registros:
+            return 0
+        agora = datetime.now(timezone.utc)
+        for dados in registros:
+            dados.setdefault("created_at", agora)
+        await self.session.execute(insert(SenhaValidador), registros)
+
+        contagem = Counter(
+            (dados["created_at"].astimezone(timezone.utc).date(), dados["score"])
+            for dados in registros
+        )
+        await self._incrementar_resumo([
+            {"dia": dia, "score": score, "total": total}
+            for (dia, score), total in contagem.items()
+        ])
+        return len(registros)
+
+    async def _incrementar_resumo(self, linhas: list[dict]) -> None:
+        """Upsert no rollup diário (mesma transação da escrita)."""
+        stmt = pg_insert(SenhaValidadorResumoDiario).values(linhas)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SenhaValidadorResumoDiario.dia, SenhaValidadorResumoDiario.score],
+            set_={"total": SenhaValidadorResumoDiario.total + stmt.excluded.total},
+        )
+        await self.session.execute(stmt)
+
+    async def recalcular_resumo(self) -> int:
+        """
+        Reconstrói o rollup diário a partir de senhas_validador (backfill).
+        Retorna a quantidade de linhas (dia, score) gravadas.
+
+        Só os dias a partir do registro mais antigo são refeitos: os anteriores
+        vêm de partições já removidas pela retenção e continuam no rollup.
+        """
+        dia = literal_column("(created_at AT TIME ZONE 'UTC')::date")
+        origem = (
+            select(dia.label("dia"), SenhaValidador.score, func.count().label("total"))
+            .group_by(literal_column("1"), SenhaValidador.score)
+        )
+        # bloqueia upserts concorrentes até o commit — evita contagem dupla
+        await self.session.execute(
+            text("LOCK TABLE senhas_validador_resumo_diario IN EXCLUSIVE MODE")
+        )
+        mais_antigo = (
+            await self.session.execute(select(func.min(SenhaValidador.created_at)))
+        ).scalar_one()
+        if mais_antigo is None:
+            return 0
+        await self.session.execute(
+            SenhaValidadorResumoDiario.__table__.delete().where(
+                SenhaValidadorResumoDiario.dia >= mais_antigo.astimezone(timezone.utc).date()
+            )
+        )
+        resultado = await self.session.execute(
+            pg_insert(SenhaValidadorResumoDiario).from_select(["dia", "score", "total"], origem)
+        )
+        return resultado.rowcount
+
     # ------------------------------------------------------------------
     # Leitura
     # ------------------------------------------------------------------
 
-    async def listar(self, limite: int = 50, offset: int = 0) -> list[SenhaValidador]:
-        """Retorna os registros mais recentes (para dashboard/admin)."""
-        resultado = await self.session.execute(
-            select(SenhaValidador)
-            .order_by(desc(SenhaValidador.created_at))
+    async def listar(self, limite: int = 50, apos: Optional[Cursor] = None) -> Sequence[Row]:
+        """
+        Página de registros, do mais recente ao mais antigo (dashboard/admin).
+
+        Paginação por keyset: ``apos`` é o (created_at, id) do último registro
+        da página anterior e a consulta começa direto nele pelo índice — o
+        custo não cresce com a profundidade da página, ao contrário do OFFSET.
+        Cada linha traz ``id`` (para montar o próximo cursor) e as colunas
+        derivadas.
+        """
+        consulta = (
+            select(SenhaValidador.id, *COLUNAS_DERIVADAS)
+            .order_by(desc(SenhaValidador.created_at), desc(SenhaValidador.id))
             .limit(limite)
-            .offset(offset)
         )
-        return resultado.scalars().all()
+        if apos is not None:
+            # a comparação de tuplas não participa do partition pruning; o
+            # limite redundante em created_at descarta os meses mais novos
+            consulta = consulta.where(
+                SenhaValidador.created_at <= apos[0],
+                tuple_(SenhaValidador.created_at, SenhaValidador.id) < tuple_(*apos),
+            )
+        resultado = await self.session.execute(consulta)
+        return resultado.all()
+
+    async def exportar(
+        self,
+        desde: Optional[datetime] = None,
+        ate: Optional[datetime] = None,
+        lote: int = 1_000,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Todas as análises do período [desde, ate), em ordem de created_at, em
+        blocos de ``lote`` linhas. Usa um cursor do lado do servidor
+        (``session.stream``), então a memória fica em um bloco por vez,
+        qualquer que seja o tamanho da tabela.
+        """
+        consulta = (
+            select(*COLUNAS_DERIVADAS)
+            .order_by(SenhaValidador.created_at, SenhaValidador.id)
+            .execution_options(yield_per=lote)
+        )
+        if desde is not None:
+            consulta = consulta.where(SenhaValidador.created_at >= desde)
+        if ate is not None:
+            consulta = consulta.where(SenhaValidador.created_at < ate)
+        resultado = await self.session.stream(consulta)
+        async for bloco in resultado.partitions():
+            yield bloco
 
     async def total(self) -> int:
-        """Retorna o total de senhas analisadas."""
+        """Retorna o total de senhas analisadas (somado do rollup diário)."""
         resultado = await self.session.execute(
-            select(func.count(SenhaValidador.id))
+            select(func.coalesce(func.sum(SenhaValidadorResumoDiario.total), 0))
         )
-        return resultado.scalar_one()
+        return int(resultado.scalar_one())
 
     async def distribuicao_scores(self) -> list[dict]:
         """Retorna a contagem de senhas por score (útil para gráficos)."""
         resultado = await self.session.execute(
-            select(SenhaValidador.score, func.count(SenhaValidador.id).label("total"))
-            .group_by(SenhaValidador.score)
-            .order_by(SenhaValidador.score)
+            select(
+                SenhaValidadorResumoDiario.score,
+                func.sum(SenhaValidadorResumoDiario.total).label("total"),
+            )
+            .group_by(SenhaValidadorResumoDiario.score)
+            .order_by(SenhaValidadorResumoDiario.score)
         )
-        return [{"score": row.score, "total": row.total} for row in resultado]
+        return [{"score": row.score, "total": int(row.total)} for row in resultado]
 
@@ -0,0 +1,134 @@
+import json
+import os
+import time
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.models.hash_models import HashResponse, ManifestVerifyRequest
+from app.services.checksum_manifest import (
+    DigestCache,
+    ManifestError,
+    get_pool,
+    parse_manifest,
+    resolve_path,
+    verify_manifest,
+)
+from app.services.hash_checker import (
+    UploadTooLarge,
+    hash_stream,
+    match_expected,
+    parse_algorithms,
+    parse_expected,
+)
+
+router = APIRouter(prefix="/api/hash", tags=["hash"])
+
+_BINARY_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/octet-stream": {"schema": {"type": "string", "format": "binary"}}},
+    }
+}
+
+
+def _limite_excedido() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"Arquivo maior que o limite de {settings.HASH_MAX_BYTES} bytes.",
+    )
+
+
+@router.post("/compute", response_model=HashResponse, openapi_extra=_BINARY_BODY)
+async def compute(
+    request: Request,
+    algorithms: Optional[str] = None,
+    expected: Optional[str] = None,
+):
+    """
+    Calcula os hashes do arquivo enviado como corpo da requisição
+    (``application/octet-stream``), em passada única e sem guardar o arquivo:
+    o corpo é lido em stream e cada bloco alimenta todos os algoritmos.
+
+    - ``algorithms``: lista separada por vírgula (md5, sha1, sha256, sha512,
+      blake2b, blake2s); vazio = todos
+    - ``expected``: digest esperado em hex; a resposta indica se algum dos
+      digests calculados é igual a ele (comparação em tempo constante)
+    """
+    try:
+        names = parse_algorithms(algorithms)
+        expected_digest = parse_expected(expected) if expected else None
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    # rejeita antes de ler o corpo quando o tamanho já vem declarado
+    declared = request.headers.get("content-length")
+    if settings.HASH_MAX_BYTES and declared and declared.isdigit() \
+            and int(declared) > settings.HASH_MAX_BYTES:
+        raise _limite_excedido()
+
+    started = time.perf_counter()
+    try:
+        hasher = await hash_stream(
+            request.stream(), names, settings.HASH_CHUNK_SIZE, settings.HASH_MAX_BYTES
+        )
+    except UploadTooLarge:
+        raise _limite_excedido()
+    elapsed = time.perf_counter() - started
+
+    matched = None
+    if expected_digest is not None:
+        matched = match_expected(hasher.digests(), expected_digest)
+
+    return {
+        "size": hasher.size,
+        "digests": hasher.hexdigests(),
+        "expected_match": None if expected_digest is None else matched is not None,
+        "matched_algorithm": matched,
+        "elapsed_ms": round(elapsed * 1000, 2),
+        "throughput_mb_s": round(hasher.size / elapsed / 1e6, 2) if elapsed > 0 else 0.0,
+    }
+
+
+@router.post("/manifest/verify")
+async def verify_manifest_route(body: ManifestVerifyRequest):
+    """
+    Verifica um manifesto de checksums (sha256sum/md5sum/b2sum, BSD ``--tag``
+    ou .sfv) contra os arquivos de ``CHECKSUM_ROOT``/``root`` no servidor.
+
+    Responde em NDJSON, à medida que a verificação avança: um evento
+    ``result`` por arquivo com problema (mismatch, missing, error — e os OK
+    com ``report_ok``), ``progress`` periódico e ``summary`` no fim. Arquivos
+    inalterados desde a última verificação saem do cache de digests.
+    """
+    if not settings.CHECKSUM_ROOT:
+        raise HTTPException(status_code=404, detail="Verificação de manifestos desativada.")
+    try:
+        root = resolve_path(settings.CHECKSUM_ROOT, body.root)
+        entries = parse_manifest(body.manifest, body.algorithm, body.manifest_name)
+    except ManifestError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    if len(entries) > settings.CHECKSUM_MAX_ENTRIES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Máximo de {settings.CHECKSUM_MAX_ENTRIES} arquivos por manifesto.",
+        )
+    if not os.path.isdir(root):
+        raise HTTPException(status_code=404, detail="Diretório não encontrado.")
+
+    cache = DigestCache(settings.CHECKSUM_CACHE_PATH) if settings.CHECKSUM_CACHE_PATH else None
+
+    def ndjson():
+        # gerador síncrono: o Starlette o consome em uma thread, fora do event loop
+        try:
+            for event in verify_manifest(
+                entries, root, get_pool(), cache=cache, report_ok=body.report_ok
+            ):
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+        finally:
+            if cache is not None:
+                cache.close()
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
@@ -1,63 +1,197 @@
-from fastapi import APIRouter, Request, Depends
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Request, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.password_models import PasswordRequest, PasswordResponse
-from app.services.password_validator import validate_password
-from app.database import get_db
-from app.repositories.senha_validador_repository import SenhaValidadorRepository
+from app.core.config import settings
+from app.core.responses import PreEncodedJSONResponse
+from app.models.password_models import (
+    LiveInput,
+    PasswordBatchRequest,
+    PasswordBatchResponse,
+    PasswordHistoryResponse,
+    PasswordPolicyInfo,
+    PasswordRequest,
+    PasswordResponse,
+)
+from app.services.password_policy import Policy, PolicyError, get_policy, policy_ids
+from app.services.password_validator import evaluate_password, validate_password_json
+from app.services.batch_validator import iter_validate_batch, validate_batch
+from app.services.live_analysis import LiveAnalysisSession
+from app.services.password_messages import CHECK_NAMES, STRENGTH
+from app.services.result_cache import analysis_cache
+from app.database import AsyncSessionLocal, get_db
+from app.repositories.senha_validador_repository import (
+    NOMES_DERIVADOS,
+    SenhaValidadorRepository,
+    codificar_cursor,
+    decodificar_cursor,
+)
+from app.repositories.fila_gravacao import fila_gravacao
 
 router = APIRouter(prefix="/api/password", tags=["password"])
 
 
-def _extrair_ip(request: Request) -> str:
-    """
-    Extrai o IP real do cliente respeitando proxies reversos.
-    Verifica X-Forwarded-For antes de usar o IP direto da conexão.
-    """
-    forwarded_for = request.headers.get("X-Forwarded-For")
-    if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
-    return request.client.host if request.client else "desconhecido"
+def _politica(policy: Optional[str]) -> Policy:
+    """Política compilada do ?policy= (vazio = padrão); 422 se desconhecida."""
+    try:
+        return get_policy(policy)
+    except PolicyError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
 
 
-@router.post("/analyze", response_model=PasswordResponse)
-async def analyze(body: PasswordRequest):
+@router.get("/policies", response_model=list[PasswordPolicyInfo])
+async def policies():
+    """Políticas de senha disponíveis para o parâmetro ``?policy=``."""
+    default_id = get_policy().id
+    return [
+        {"id": policy_id, "description": get_policy(policy_id).description, "default": policy_id == default_id}
+        for policy_id in policy_ids()
+    ]
+
+
+@router.post("/analyze", response_model=PasswordResponse, response_class=PreEncodedJSONResponse)
+async def analyze(body: PasswordRequest, policy: Optional[str] = None):
     """
     Análise em tempo real — apenas valida a senha, SEM persistir no banco.
     Chamado a cada 400 ms enquanto o usuário digita.
+    O corpo é montado a partir dos fragmentos JSON pré-codificados das
+    mensagens (sem revalidar o modelo); respostas repetidas saem do cache.
+    ``policy``: id da política de senha (vazio = a padrão).
     """
-    return validate_password(body.password)
+    compiled = _politica(policy)
+    content = analysis_cache.get(body.password, compiled.id)
+    if content is None:
+        content = validate_password_json(body.password, compiled)
+        analysis_cache.put(body.password, content, compiled.id)
+    return PreEncodedJSONResponse(content)
 
 
-@router.post("/validate", response_model=PasswordResponse)
-async def validate(
-    request: Request,
-    body: PasswordRequest,
-    db: AsyncSession = Depends(get_db),
-):
+@router.get("/analyze/cache")
+async def analyze_cache_stats():
+    """Contadores do cache do /analyze (acertos, falhas, despejos, tamanho)."""
+    return analysis_cache.stats()
+
+
+@router.websocket("/live")
+async def live(websocket: WebSocket):
+    """
+    Análise em tempo real por WebSocket — uma conexão por sessão de digitação,
+    substituindo o POST /analyze a cada 400 ms. SEM persistir no banco.
+
+    O cliente envia edições incrementais (LiveInput: set / append / delete,
+    com ``seq`` opcional). O servidor só analisa após LIVE_DEBOUNCE_MS sem
+    novos frames — estados intermediários são descartados — e só envia
+    ``{"seq": ..., "result": PasswordResponse}`` quando o resultado muda.
+    """
+    await websocket.accept()
+    session = LiveAnalysisSession(settings.LIVE_MAX_PASSWORD_LENGTH)
+    changed = asyncio.Event()
+    debounce = settings.LIVE_DEBOUNCE_MS / 1000
+
+    async def pusher():
+        while True:
+            await changed.wait()
+            # debounce: espera um intervalo inteiro sem frames novos
+            while True:
+                changed.clear()
+                await asyncio.sleep(debounce)
+                if not changed.is_set():
+                    break
+            result = session.analyze()
+            if result is not None:
+                await websocket.send_json({"seq": session.seq, "result": result})
+
+    push_task = asyncio.create_task(pusher())
+    try:
+        while True:
+            raw = await websocket.receive_text()
+            try:
+                frame = LiveInput.model_validate_json(raw)
+                session.apply(frame.op, frame.password, frame.text, frame.count, frame.seq)
+            except ValidationError as exc:
+                await websocket.send_json({"error": f"Frame inválido: {exc.errors()[0]['msg']}"})
+                continue
+            except ValueError as exc:
+                await websocket.send_json({"seq": frame.seq, "error": str(exc)})
+                continue
+            changed.set()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        push_task.cancel()
+
+
+def _validar_limites_lote(passwords: list[str]) -> None:
+    """Aplica os limites configuráveis do lote (413 se excedidos)."""
+    if len(passwords) > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Lote com {len(passwords)} senhas excede o limite de {settings.BATCH_MAX_ITEMS}.",
+        )
+    if any(len(p) > settings.BATCH_MAX_PASSWORD_LENGTH for p in passwords):
+        raise HTTPException(
+            status_code=413,
+            detail=f"Cada senha deve ter no máximo {settings.BATCH_MAX_PASSWORD_LENGTH} caracteres.",
+        )
+
+
+async def _ndjson(passwords: list[str], policy: Policy):
+    """Uma linha JSON por senha, na ordem de entrada, conforme os blocos ficam prontos."""
+    async for chunk in iter_validate_batch(passwords, policy=policy):
+        yield "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in chunk)
+
+
+@router.post("/analyze/batch", response_model=PasswordBatchResponse)
+async def analyze_batch(request: Request, body: PasswordBatchRequest, policy: Optional[str] = None):
+    """
+    Análise em lote para testes de política — SEM persistir no banco.
+    O processamento roda em um pool de processos, fora do event loop.
+    Lotes grandes (ou com Accept: application/x-ndjson) são transmitidos
+    em NDJSON, um resultado por linha, na ordem de entrada.
+    """
+    compiled = _politica(policy)
+    _validar_limites_lote(body.passwords)
+
+    wants_ndjson = "application/x-ndjson" in request.headers.get("Accept", "")
+    if wants_ndjson or len(body.passwords) > settings.BATCH_STREAM_THRESHOLD:
+        return StreamingResponse(_ndjson(body.passwords, compiled), media_type="application/x-ndjson")
+
+    results = await validate_batch(body.passwords, compiled)
+    return {"total": len(results), "results": results}
+
+
+@router.post("/validate", response_model=PasswordResponse, response_class=PreEncodedJSONResponse)
+async def validate(body: PasswordRequest, policy: Optional[str] = None):
     """
     Captura definitiva — valida E persiste no banco de dados.
     Chamado pelo frontend após 3 segundos de inatividade no input.
+    A gravação é feita em lote pela fila write-behind (a resposta não espera
+    o banco) e guarda apenas métricas derivadas — nunca a senha.
     """
-    result = validate_password(body.password)
+    result = evaluate_password(body.password, _politica(policy))
+    checks = dict(zip(CHECK_NAMES, result.checks))
 
-    repo = SenhaValidadorRepository(db)
-    await repo.salvar({
-        "senha_capturada":  body.password,
-        "ip_origem":        _extrair_ip(request),
-        "user_agent":       request.headers.get("User-Agent"),
-        "score":            result["score"],
-        "strength_label":   result["strength_label"],
-        "entropy_bits":     result["entropy_bits"],
-        "is_common":        result["is_common"],
+    fila_gravacao.enfileirar({
+        "score":            result.score,
+        "strength_label":   STRENGTH[result.score][0],
+        "entropy_bits":     result.entropy_bits,
+        "is_common":        result.is_common,   # None (NULL) = blocklist pulada pela política
         "comprimento":      len(body.password),
-        "tem_maiuscula":    result["checks"]["has_uppercase"],
-        "tem_minuscula":    result["checks"]["has_lowercase"],
-        "tem_numero":       result["checks"]["has_digit"],
-        "tem_especial":     result["checks"]["has_special"],
+        "tem_maiuscula":    checks["has_uppercase"],
+        "tem_minuscula":    checks["has_lowercase"],
+        "tem_numero":       checks["has_digit"],
+        "tem_especial":     checks["has_special"],
     })
 
-    return result
+    return PreEncodedJSONResponse(result.to_json())
 
 
 @router.get("/stats")
@@ -70,5 +204,79 @@ async def stats(db: AsyncSession = Depends(get_db)):
     }
 
 
+@router.get("/history", response_model=PasswordHistoryResponse)
+async def history(
+    limit: int = Query(50, ge=1, le=settings.HISTORY_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Análises gravadas, da mais recente para a mais antiga, paginadas por
+    cursor: passe o ``next_cursor`` da resposta para obter a página seguinte
+    (``null`` = fim). O custo de cada página é o mesmo em qualquer
+    profundidade. Só colunas derivadas da análise.
+    """
+    try:
+        apos = decodificar_cursor(cursor) if cursor else None
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    # uma linha a mais indica se existe próxima página
+    linhas = await SenhaValidadorRepository(db).listar(limit + 1, apos)
+    pagina = linhas[:limit]
+    return {
+        "items": [{nome: getattr(linha, nome) for nome in NOMES_DERIVADOS} for linha in pagina],
+        "next_cursor": (
+            codificar_cursor(pagina[-1].created_at, pagina[-1].id) if len(linhas) > limit else None
+        ),
+    }
+
+
+def _bloco_ndjson(bloco) -> str:
+    return "".join(
+        json.dumps({**linha._asdict(), "created_at": linha.created_at.isoformat()}, ensure_ascii=False)
+        + "\n"
+        for linha in bloco
+    )
+
+
+def _bloco_csv(bloco) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows((linha.created_at.isoformat(), *linha[1:]) for linha in bloco)
+    return buffer.getvalue()
+
+
+@router.get("/export")
+async def export(
+    formato: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+):
+    """
+    Exporta as análises gravadas (``since`` ≤ created_at < ``until``, ambos
+    opcionais) em NDJSON ou CSV, em ordem cronológica. As linhas vêm de um
+    cursor do lado do servidor e são transmitidas em blocos de
+    EXPORT_FETCH_ROWS — memória constante mesmo sobre a tabela inteira.
+    Só colunas derivadas da análise (score, entropia, flags, comprimento,
+    data); senha, IP e User-Agent legados nunca saem.
+    """
+    serializar = _bloco_csv if formato == "csv" else _bloco_ndjson
+
+    async def corpo():
+        if formato == "csv":
+            yield ",".join(NOMES_DERIVADOS) + "\r\n"
+        # sessão própria, aberta enquanto a resposta é transmitida
+        async with AsyncSessionLocal() as session:
+            repo = SenhaValidadorRepository(session)
+            async for bloco in repo.exportar(since, until, settings.EXPORT_FETCH_ROWS):
+                yield serializar(bloco)
+
+    return StreamingResponse(
+        corpo(),
+        media_type="text/csv" if formato == "csv" else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="senhas_validador.{formato}"'},
+    )
+
+
 
 
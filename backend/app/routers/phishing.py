@@ -0,0 +1,65 @@
+import time
+
+from fastapi import APIRouter, HTTPException
+
+from app.core.config import settings
+from app.models.phishing_models import (
+    PhishingBatchRequest,
+    PhishingBatchResponse,
+    PhishingRequest,
+    PhishingResponse,
+)
+from app.services.phishing_detector import analyze_url, model_version, score_batch
+
+router = APIRouter(prefix="/api/phishing", tags=["phishing"])
+
+
+def _validar_url(url: str) -> None:
+    if not url.strip():
+        raise HTTPException(status_code=422, detail="Informe uma URL.")
+    if len(url) > settings.PHISHING_MAX_URL_LENGTH:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Cada URL deve ter no máximo {settings.PHISHING_MAX_URL_LENGTH} caracteres.",
+        )
+
+
+@router.post("/analyze", response_model=PhishingResponse)
+async def analyze(body: PhishingRequest):
+    """
+    Análise léxica de uma URL, sem acessá-la nem consultar serviços externos:
+    domínio registrável, punycode/homóglifos, imitação de marcas, palavras
+    suspeitas e estatísticas da URL, combinados por um modelo linear.
+    Retorna score (0–1), veredito, features e os motivos principais.
+    """
+    _validar_url(body.url)
+    return analyze_url(body.url)
+
+
+@router.post("/analyze/batch", response_model=PhishingBatchResponse)
+def analyze_batch(body: PhishingBatchRequest):
+    """
+    Score de um lote de URLs, com as features extraídas de forma vetorizada
+    (NumPy). Resposta em colunas — ``scores[i]``, ``verdicts[i]``,
+    ``domains[i]`` e ``blocklisted[i]`` correspondem a ``urls[i]``. Função síncrona: o FastAPI a
+    executa no threadpool, fora do event loop.
+    """
+    if len(body.urls) > settings.PHISHING_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Lote com {len(body.urls)} URLs excede o limite de {settings.PHISHING_BATCH_MAX_ITEMS}.",
+        )
+    if any(len(u) > settings.PHISHING_MAX_URL_LENGTH for u in body.urls):
+        raise HTTPException(
+            status_code=413,
+            detail=f"Cada URL deve ter no máximo {settings.PHISHING_MAX_URL_LENGTH} caracteres.",
+        )
+
+    started = time.perf_counter()
+    result = score_batch(body.urls)
+    return {
+        "total": len(body.urls),
+        **result,
+        "model_version": model_version(),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
@@ -0,0 +1,171 @@
+"""
+Controle de admissão: concorrência limitada por classe de rota e fila curta.
+
+Sem isso, num pico cada requisição vira uma task esperando o loop (CPU) ou o
+pool do banco, e a latência de todas cresce junto. Aqui cada classe (``cpu``,
+``db``) tem um portão com ``limit`` requisições em atendimento e uma fila de
+espera de no máximo ``queue_size``:
+
+  - prioridade: a fila é um heap (prioridade, chegada); rotas baratas
+    (prioridade 0) passam na frente das caras (lote, exportação) e, com a
+    fila cheia, tomam o lugar da mais cara/mais nova — que recebe 503
+  - prazo: ninguém espera mais que ``max_wait``. Na chegada, a espera é
+    estimada (trabalho à frente na fila ÷ limite, com o tempo médio de
+    atendimento de cada prioridade); se passar do prazo, a recusa é
+    imediata em vez de ocupar a fila para estourar depois
+  - recusa: ``Overloaded`` com a estimativa de espera, que o middleware
+    devolve como 503 + ``Retry-After``
+
+Roda só na thread do event loop (sem locks). A vaga de quem sai é repassada
+direto ao próximo da fila, sem voltar a disputa.
+"""
+import asyncio
+import heapq
+import itertools
+import math
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+_EWMA_ALPHA = 0.1
+SHED_REASONS = ("deadline", "queue_full", "displaced", "timeout")
+
+
+class Overloaded(Exception):
+    """Requisição recusada pelo controle de admissão (``retry_after`` em segundos)."""
+
+    def __init__(self, retry_after: float, reason: str):
+        super().__init__(reason)
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "future", "timer", "done")
+
+    def __init__(self, priority: int, seq: int, future: asyncio.Future):
+        self.priority = priority
+        self.seq = seq
+        self.future = future
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.done = False   # saiu da fila (atendido, recusado ou cancelado); o heap remove depois
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class AdmissionGate:
+    """Até ``limit`` requisições em atendimento; as demais esperam na fila por prioridade."""
+
+    def __init__(self, name: str, limit: int, queue_size: int, max_wait: float, priorities: int = 2):
+        self.name = name
+        self.limit = max(1, limit)
+        self.queue_size = max(0, queue_size)
+        self.max_wait = max_wait
+        self.active = 0
+        self.admitted = 0
+        self.shed: Dict[str, int] = dict.fromkeys(SHED_REASONS, 0)
+        self._heap: List[_Waiter] = []
+        self._depth = [0] * priorities
+        self._service = [0.0] * priorities   # tempo médio de atendimento (EWMA) por prioridade
+        self._seq = itertools.count()
+
+    @property
+    def depth(self) -> int:
+        return sum(self._depth)
+
+    def estimate(self, priority: int) -> float:
+        """Espera estimada de uma chegada agora: trabalho à frente na fila + um atendimento, ÷ limite."""
+        ahead = sum(self._depth[p] * self._service[p] for p in range(priority + 1))
+        return (ahead + self._service[priority]) / self.limit
+
+    def _refuse(self, reason: str, priority: int) -> Overloaded:
+        self.shed[reason] += 1
+        return Overloaded(self.estimate(priority), reason)
+
+    async def acquire(self, priority: int = 0) -> None:
+        """Espera uma vaga; ``Overloaded`` se a fila estiver cheia ou o prazo não couber."""
+        if self.active < self.limit and not self.depth:
+            self.active += 1
+            self.admitted += 1
+            return
+        if self.estimate(priority) > self.max_wait:
+            raise self._refuse("deadline", priority)
+        if self.depth >= self.queue_size:
+            worst = max((w for w in self._heap if not w.done), default=None)
+            if worst is None or worst.priority <= priority:
+                raise self._refuse("queue_full", priority)
+            self._drop(worst, "displaced")
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(priority, next(self._seq), loop.create_future())
+        waiter.timer = loop.call_later(self.max_wait, self._drop, waiter, "timeout")
+        heapq.heappush(self._heap, waiter)
+        self._depth[priority] += 1
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            # cliente desconectou na fila; se a vaga já tinha sido repassada, devolve
+            if not waiter.done:
+                self._leave(waiter)
+            elif not waiter.future.cancelled() and waiter.future.exception() is None:
+                self.release()
+            raise
+        self.admitted += 1
+
+    def _leave(self, waiter: _Waiter) -> None:
+        waiter.done = True
+        self._depth[waiter.priority] -= 1
+        waiter.timer.cancel()
+
+    def _drop(self, waiter: _Waiter, reason: str) -> None:
+        """Tira ``waiter`` da fila com 503 (prazo estourado ou desalojado por uma mais barata)."""
+        if waiter.done:
+            return
+        self._leave(waiter)
+        if not waiter.future.done():
+            waiter.future.set_exception(self._refuse(reason, waiter.priority))
+
+    def release(self, priority: Optional[int] = None, elapsed: Optional[float] = None) -> None:
+        """Fim de um atendimento: repassa a vaga ao próximo da fila (ou a libera)."""
+        if priority is not None and elapsed is not None:
+            current = self._service[priority]
+            self._service[priority] = elapsed if not current else current + _EWMA_ALPHA * (elapsed - current)
+        heap = self._heap
+        while heap:
+            waiter = heapq.heappop(heap)
+            if waiter.done:
+                continue
+            self._leave(waiter)
+            if waiter.future.done():   # task cancelada antes de sair da fila
+                continue
+            waiter.future.set_result(None)
+            return
+        self.active -= 1
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queue_size": self.queue_size,
+            "queue_depth": self.depth,
+            "admitted": self.admitted,
+            "shed": dict(self.shed),
+            "service_ms": [round(s * 1000, 2) for s in self._service],
+        }
+
+
+def retry_after_seconds(exc: Overloaded) -> int:
+    """Valor do cabeçalho Retry-After (segundos inteiros, no mínimo 1)."""
+    return max(1, math.ceil(exc.retry_after))
+
+
+def build_gates() -> Dict[str, AdmissionGate]:
+    """Portões das classes ``cpu`` e ``db`` (vazio com ADMISSION_ENABLED desligado)."""
+    if not settings.ADMISSION_ENABLED:
+        return {}
+    max_wait = settings.ADMISSION_MAX_WAIT_MS / 1000
+    return {
+        "cpu": AdmissionGate("cpu", settings.ADMISSION_CPU_CONCURRENCY, settings.ADMISSION_CPU_QUEUE, max_wait),
+        "db": AdmissionGate("db", settings.ADMISSION_DB_CONCURRENCY, settings.ADMISSION_DB_QUEUE, max_wait),
+    }
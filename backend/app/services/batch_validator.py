@@ -0,0 +1,92 @@
+"""
+Análise de senhas em lote, distribuída em um ProcessPoolExecutor.
+
+validate_password é CPU-bound: rodar milhares de chamadas dentro do handler
+bloquearia o event loop. Aqui a lista é fatiada em blocos enviados a um pool
+de processos (um por núcleo, por padrão), e os resultados voltam na ordem de
+entrada, bloco a bloco — o router pode devolver tudo de uma vez ou ir
+transmitindo à medida que os blocos ficam prontos.
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, List, Optional, Sequence
+
+from app.core.config import settings
+from app.services.password_policy import Policy
+from app.services.password_validator import on_blocklists_reload, validate_password
+
+_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _validate_chunk(passwords: Sequence[str], policy: Optional[Policy] = None) -> List[dict]:
+    """Executado no processo worker (a política compilada vai junto, serializada)."""
+    return [validate_password(p, policy) for p in passwords]
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Pool criado sob demanda na primeira análise em lote (por worker do uvicorn)."""
+    global _POOL
+    if _POOL is None:
+        workers = settings.BATCH_WORKERS or os.cpu_count() or 1
+        # spawn: não herda o estado do event loop/threads do processo pai
+        _POOL = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _POOL
+
+
+def shutdown_pool() -> None:
+    """Encerra o pool (chamado no lifespan do FastAPI)."""
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=True, cancel_futures=True)
+        _POOL = None
+
+
+def _recycle_pool() -> None:
+    """
+    Blocklist recarregada: os workers têm cópias antigas. Tarefas em andamento
+    terminam no pool velho; o próximo lote cria um pool novo.
+    """
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=False)
+        _POOL = None
+
+
+on_blocklists_reload(_recycle_pool)
+
+
+async def iter_validate_batch(
+    passwords: Sequence[str], chunk_size: Optional[int] = None, policy: Optional[Policy] = None
+) -> AsyncIterator[List[dict]]:
+    """
+    Gera os resultados em blocos, na mesma ordem de ``passwords``.
+
+    Todos os blocos são enviados ao pool de imediato; cada um é entregue
+    assim que ele e todos os anteriores estiverem prontos.
+    """
+    chunk_size = chunk_size or settings.BATCH_CHUNK_SIZE
+    loop = asyncio.get_running_loop()
+    pool = get_pool()
+    futures = [
+        loop.run_in_executor(pool, _validate_chunk, passwords[i : i + chunk_size], policy)
+        for i in range(0, len(passwords), chunk_size)
+    ]
+    try:
+        for future in futures:
+            yield await future
+    finally:
+        # cliente desconectou no meio do stream: descarta o que ainda não rodou
+        for future in futures:
+            future.cancel()
+
+
+async def validate_batch(passwords: Sequence[str], policy: Optional[Policy] = None) -> List[dict]:
+    """Resultados completos do lote, na ordem de entrada."""
+    results: List[dict] = []
+    async for chunk in iter_validate_batch(passwords, policy=policy):
+        results.extend(chunk)
+    return results
@@ -0,0 +1,246 @@
+"""
+Lista de bloqueio de senhas comuns compacta e compartilhada via mmap.
+
+Um ``set[str]`` com dezenas de milhões de senhas custa vários GB por worker
+do uvicorn. Aqui a lista é compilada uma única vez em um arquivo binário de
+registros fixos (hash de 8 bytes por senha, ordenados) e aberta com ``mmap``
+somente leitura — todos os workers compartilham o mesmo page cache e a
+consulta não cria nenhum objeto Python por entrada.
+
+Formato do arquivo (little-endian, exceto as chaves):
+  - cabeçalho  : magic ``CSBL``, versão, tamanho da chave, total de chaves,
+                 bits e nº de funções do filtro de Bloom (32 bytes)
+  - fanout     : 257 × uint64 — índice do primeiro registro de cada
+                 primeiro byte (como o ``.idx`` do git)
+  - registros  : N × 8 bytes, chaves big-endian ordenadas (ordem de bytes ==
+                 ordem numérica), sem duplicatas
+  - bloom      : filtro de Bloom opcional (``ceil(m / 8)`` bytes)
+
+Consulta: Bloom (rejeita a maioria das ausências sem tocar nos registros)
+→ fanout → busca binária em ~N/256 registros. O(log n), sem alocações
+além das fatias de 8 bytes da comparação.
+
+Uso (a partir de backend/):
+    python -m app.services.blocklist app/data/common_passwords.txt app/data/common_passwords.bin
+"""
+import argparse
+import hashlib
+import math
+import mmap
+import os
+import struct
+import tempfile
+from typing import Container, Iterable, NamedTuple, Optional, Set
+
+_MAGIC = b"CSBL"
+_VERSION = 1
+_KEY_SIZE = 8
+_HEADER = struct.Struct("<4sHHQQI4x")   # 32 bytes
+_FANOUT = struct.Struct("<257Q")
+_DEFAULT_BLOOM_BITS_PER_KEY = 10          # ~1% de falsos positivos com k=7
+
+
+class BlocklistLayout(NamedTuple):
+    """Posições das seções dentro do buffer mapeado (para consultas vetorizadas)."""
+    buffer: mmap.mmap
+    records: int      # offset dos registros (count × _KEY_SIZE bytes, ordenados)
+    count: int
+    bloom: int        # offset do filtro de Bloom
+    bloom_m: int      # bits do filtro (0 = ausente ou desativado)
+    bloom_k: int
+
+
+def _key(word: str) -> bytes:
+    """Chave de 8 bytes da senha normalizada (minúsculas)."""
+    return hashlib.blake2b(
+        word.lower().encode("utf-8", "surrogatepass"), digest_size=_KEY_SIZE
+    ).digest()
+
+
+def _bloom_positions(key: bytes, m: int, k: int):
+    """Double hashing (Kirsch–Mitzenmacher) a partir das metades da chave."""
+    h1 = int.from_bytes(key[:4], "little")
+    h2 = int.from_bytes(key[4:], "little") | 1
+    return ((h1 + i * h2) % m for i in range(k))
+
+
+def _iter_words(path: str) -> Iterable[str]:
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            word = line.strip()
+            if word:
+                yield word
+
+
+# ---------------------------------------------------------------------------
+# Build (offline)
+# ---------------------------------------------------------------------------
+
+def build_blocklist(
+    words: Iterable[str],
+    dest_path: str,
+    bloom_bits_per_key: int = _DEFAULT_BLOOM_BITS_PER_KEY,
+) -> int:
+    """
+    Compila as senhas em ``dest_path`` e retorna o total de chaves distintas.
+
+    A ordenação é particionada pelo primeiro byte da chave (256 arquivos
+    temporários), então a memória do build fica em ~N/256 chaves por vez,
+    independente do tamanho da lista.
+    """
+    dest_dir = os.path.dirname(os.path.abspath(dest_path))
+    with tempfile.TemporaryDirectory(dir=dest_dir) as tmp:
+        # ---- passo 1: particiona por primeiro byte -------------------------
+        buckets = [open(os.path.join(tmp, f"{b:02x}"), "wb") for b in range(256)]
+        try:
+            for word in words:
+                key = _key(word)
+                buckets[key[0]].write(key)
+        finally:
+            for bucket in buckets:
+                bucket.close()
+
+        # ---- passo 2: ordena cada partição e grava os registros ------------
+        records_path = os.path.join(tmp, "records")
+        fanout = [0] * 257
+        count = 0
+        with open(records_path, "wb") as out:
+            for b in range(256):
+                fanout[b] = count
+                with open(os.path.join(tmp, f"{b:02x}"), "rb") as f:
+                    data = f.read()
+                keys = sorted({data[i : i + _KEY_SIZE] for i in range(0, len(data), _KEY_SIZE)})
+                out.write(b"".join(keys))
+                count += len(keys)
+        fanout[256] = count
+
+        # ---- passo 3: filtro de Bloom ---------------------------------------
+        bloom_m = count * bloom_bits_per_key if bloom_bits_per_key > 0 else 0
+        bloom_k = max(1, round(bloom_bits_per_key * math.log(2))) if bloom_m else 0
+        bloom = bytearray((bloom_m + 7) // 8)
+        if bloom_m:
+            with open(records_path, "rb") as f:
+                while True:
+                    key = f.read(_KEY_SIZE)
+                    if not key:
+                        break
+                    for pos in _bloom_positions(key, bloom_m, bloom_k):
+                        bloom[pos >> 3] |= 1 << (pos & 7)
+
+        # ---- passo 4: monta o arquivo final e troca atomicamente -----------
+        partial = os.path.join(tmp, "blocklist.bin")
+        with open(partial, "wb") as out, open(records_path, "rb") as records:
+            out.write(_HEADER.pack(_MAGIC, _VERSION, _KEY_SIZE, count, bloom_m, bloom_k))
+            out.write(_FANOUT.pack(*fanout))
+            while True:
+                chunk = records.read(1 << 20)
+                if not chunk:
+                    break
+                out.write(chunk)
+            out.write(bloom)
+        os.replace(partial, dest_path)
+
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Lookup (mmap)
+# ---------------------------------------------------------------------------
+
+class MmapBlocklist:
+    """Consulta ``palavra in blocklist`` sobre o arquivo compilado, via mmap."""
+
+    def __init__(self, path: str, use_bloom: bool = True, offset: int = 0):
+        """``offset``: início da blocklist dentro do arquivo (seção de um snapshot)."""
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, key_size, count, bloom_m, bloom_k = _HEADER.unpack_from(self._mm, offset)
+        if magic != _MAGIC or version != _VERSION or key_size != _KEY_SIZE:
+            self._mm.close()
+            raise ValueError(f"Arquivo de blocklist inválido ou de versão incompatível: {path}")
+
+        self._count = count
+        self._fanout = _FANOUT.unpack_from(self._mm, offset + _HEADER.size)
+        self._records = offset + _HEADER.size + _FANOUT.size
+        self._bloom = self._records + count * _KEY_SIZE
+        self._bloom_m = bloom_m if use_bloom else 0
+        self._bloom_k = bloom_k
+
+    def __len__(self) -> int:
+        return self._count
+
+    def layout(self) -> BlocklistLayout:
+        return BlocklistLayout(
+            self._mm, self._records, self._count, self._bloom, self._bloom_m, self._bloom_k
+        )
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        key = _key(word)
+        mm = self._mm
+
+        if self._bloom_m:
+            base = self._bloom
+            for pos in _bloom_positions(key, self._bloom_m, self._bloom_k):
+                if not mm[base + (pos >> 3)] >> (pos & 7) & 1:
+                    return False
+
+        lo = self._fanout[key[0]]
+        hi = self._fanout[key[0] + 1]
+        records = self._records
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            off = records + mid * _KEY_SIZE
+            probe = mm[off : off + _KEY_SIZE]
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+def load_common_passwords(
+    txt_path: str, bin_path: Optional[str], use_bloom: bool = True
+) -> Container[str]:
+    """
+    Backend da lista de senhas comuns.
+
+    Usa o arquivo compilado (mmap) quando existir; caso contrário cai no
+    ``set`` em memória montado a partir do .txt (suficiente para listas
+    pequenas). Arquivo ausente → conjunto vazio (nada é marcado como comum).
+    """
+    if bin_path and os.path.exists(bin_path):
+        return MmapBlocklist(bin_path, use_bloom=use_bloom)
+
+    words: Set[str] = set()
+    try:
+        for word in _iter_words(txt_path):
+            words.add(word.lower())
+    except FileNotFoundError:
+        pass
+    return words
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Compila a lista de senhas comuns para o formato mmap.")
+    parser.add_argument("source", help="arquivo texto, uma senha por linha")
+    parser.add_argument("dest", help="arquivo binário de saída")
+    parser.add_argument(
+        "--bloom-bits", type=int, default=_DEFAULT_BLOOM_BITS_PER_KEY,
+        help="bits do filtro de Bloom por chave (0 desativa)",
+    )
+    args = parser.parse_args(argv)
+    total = build_blocklist(_iter_words(args.source), args.dest, args.bloom_bits)
+    print(f"{total} senhas distintas gravadas em {args.dest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Índice offline de senhas vazadas, no estilo da range API do HIBP.
+
+Um dump ``HASH:CONTAGEM`` (SHA-1 ou NTLM, como os distribuídos pelo Have I
+Been Pwned) é convertido uma única vez em um índice binário particionado
+pelo prefixo de 5 caracteres hex (20 bits) do hash. A consulta lê duas
+entradas da tabela de offsets e faz busca binária só dentro do bucket —
+poucas páginas do arquivo, via ``mmap``, sem carregar o corpus na memória.
+
+Formato do arquivo:
+  - cabeçalho : magic ``CSBI``, versão, algoritmo, tamanho do registro,
+                total de registros (32 bytes, little-endian)
+  - offsets   : (2^20 + 1) × uint64 — índice do primeiro registro de cada
+                prefixo de 5 hex
+  - registros : sufixo do hash (a partir do 3º byte, big-endian) + uint32
+                com a contagem de ocorrências, ordenados por hash
+
+Uso (a partir de backend/):
+    python -m app.services.breach_index pwned-passwords-sha1-ordered-by-hash.txt breach.idx
+    python -m app.services.breach_index --algorithm ntlm pwned-passwords-ntlm.txt breach-ntlm.idx
+"""
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+from typing import Iterable, Optional, Tuple
+
+_MAGIC = b"CSBI"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHHH4xQ8x")   # 32 bytes
+_PREFIX_BITS = 20                         # 5 caracteres hex
+_BUCKETS = 1 << _PREFIX_BITS
+_OFFSET = struct.Struct("<Q")
+_COUNT = struct.Struct("<I")
+_SUFFIX_START = 2                         # bytes 0–1 + nibble alto do 3º = prefixo
+
+# código no cabeçalho → (nome, tamanho do digest)
+_ALGORITHMS = {1: ("sha1", 20), 2: ("ntlm", 16)}
+_ALGORITHM_CODES = {name: code for code, (name, _) in _ALGORITHMS.items()}
+
+
+# ---------------------------------------------------------------------------
+# Hashes
+# ---------------------------------------------------------------------------
+
+def _md4(data: bytes) -> bytes:
+    """MD4 (RFC 1320) em Python puro — o OpenSSL 3 não expõe mais o md4."""
+    mask = 0xFFFFFFFF
+
+    def rotl(x, n):
+        return ((x << n) | (x >> (32 - n))) & mask
+
+    msg = data + b"\x80" + b"\x00" * ((55 - len(data)) % 64) + struct.pack("<Q", len(data) * 8)
+    a, b, c, d = 0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476
+
+    for off in range(0, len(msg), 64):
+        x = struct.unpack("<16I", msg[off : off + 64])
+        aa, bb, cc, dd = a, b, c, d
+        for i in (0, 4, 8, 12):
+            a = rotl((a + ((b & c) | (~b & d)) + x[i]) & mask, 3)
+            d = rotl((d + ((a & b) | (~a & c)) + x[i + 1]) & mask, 7)
+            c = rotl((c + ((d & a) | (~d & b)) + x[i + 2]) & mask, 11)
+            b = rotl((b + ((c & d) | (~c & a)) + x[i + 3]) & mask, 19)
+        for i in (0, 1, 2, 3):
+            a = rotl((a + ((b & c) | (b & d) | (c & d)) + x[i] + 0x5A827999) & mask, 3)
+            d = rotl((d + ((a & b) | (a & c) | (b & c)) + x[i + 4] + 0x5A827999) & mask, 5)
+            c = rotl((c + ((d & a) | (d & b) | (a & b)) + x[i + 8] + 0x5A827999) & mask, 9)
+            b = rotl((b + ((c & d) | (c & a) | (d & a)) + x[i + 12] + 0x5A827999) & mask, 13)
+        for i in (0, 2, 1, 3):
+            a = rotl((a + (b ^ c ^ d) + x[i] + 0x6ED9EBA1) & mask, 3)
+            d = rotl((d + (a ^ b ^ c) + x[i + 8] + 0x6ED9EBA1) & mask, 9)
+            c = rotl((c + (d ^ a ^ b) + x[i + 4] + 0x6ED9EBA1) & mask, 11)
+            b = rotl((b + (c ^ d ^ a) + x[i + 12] + 0x6ED9EBA1) & mask, 15)
+        a, b, c, d = (a + aa) & mask, (b + bb) & mask, (c + cc) & mask, (d + dd) & mask
+
+    return struct.pack("<4I", a, b, c, d)
+
+
+def _digest(password: str, algorithm: str) -> bytes:
+    if algorithm == "sha1":
+        return hashlib.sha1(password.encode("utf-8", "surrogatepass")).digest()
+    data = password.encode("utf-16-le", "surrogatepass")
+    try:
+        return hashlib.new("md4", data).digest()
+    except ValueError:
+        return _md4(data)
+
+
+def _prefix(digest: bytes) -> int:
+    """Os 20 bits iniciais do hash (os 5 caracteres hex da range API)."""
+    return (digest[0] << 12) | (digest[1] << 4) | (digest[2] >> 4)
+
+
+# ---------------------------------------------------------------------------
+# Build (offline)
+# ---------------------------------------------------------------------------
+
+def _iter_dump(path: str) -> Iterable[Tuple[bytes, int]]:
+    """Lê linhas ``HASH:CONTAGEM`` (contagem opcional, padrão 1)."""
+    with open(path, "r", encoding="ascii", errors="ignore") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            digest_hex, _, count = line.partition(":")
+            yield bytes.fromhex(digest_hex), int(count) if count else 1
+
+
+def build_breach_index(
+    entries: Iterable[Tuple[bytes, int]], dest_path: str, algorithm: str = "sha1"
+) -> int:
+    """
+    Grava o índice em ``dest_path`` e retorna o total de hashes distintos.
+
+    Os hashes precisam chegar ordenados (o formato "ordered by hash" do HIBP);
+    linhas repetidas do mesmo hash têm as contagens somadas. O build é de
+    passagem única e memória constante.
+    """
+    code = _ALGORITHM_CODES[algorithm]
+    digest_size = _ALGORITHMS[code][1]
+    record_size = digest_size - _SUFFIX_START + _COUNT.size
+    offsets_size = (_BUCKETS + 1) * _OFFSET.size
+    partial = f"{dest_path}.partial"
+
+    count = 0
+    prev: Optional[bytes] = None
+    prev_count = 0
+    bucket = 0   # próximo prefixo cujo offset ainda não foi gravado
+
+    try:
+        with open(partial, "wb") as out:
+            out.write(b"\x00" * (_HEADER.size + offsets_size))   # preenchido no final
+            offsets = bytearray(offsets_size)
+
+            def flush(digest: bytes, occurrences: int) -> None:
+                nonlocal count, bucket
+                prefix = _prefix(digest)
+                while bucket <= prefix:
+                    _OFFSET.pack_into(offsets, bucket * _OFFSET.size, count)
+                    bucket += 1
+                out.write(digest[_SUFFIX_START:])
+                out.write(_COUNT.pack(min(occurrences, 0xFFFFFFFF)))
+                count += 1
+
+            for digest, occurrences in entries:
+                if len(digest) != digest_size:
+                    raise ValueError(f"Hash com tamanho inválido para {algorithm}: {digest.hex()}")
+                if prev is not None:
+                    if digest == prev:
+                        prev_count += occurrences
+                        continue
+                    if digest < prev:
+                        raise ValueError(
+                            "O dump precisa estar ordenado por hash "
+                            "(use o formato 'ordered by hash' ou `sort -t: -k1,1`)."
+                        )
+                    flush(prev, prev_count)
+                prev, prev_count = digest, occurrences
+            if prev is not None:
+                flush(prev, prev_count)
+
+            while bucket <= _BUCKETS:
+                _OFFSET.pack_into(offsets, bucket * _OFFSET.size, count)
+                bucket += 1
+
+            out.seek(0)
+            out.write(_HEADER.pack(_MAGIC, _VERSION, code, digest_size, record_size, count))
+            out.write(offsets)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+
+    os.replace(partial, dest_path)
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Lookup (mmap)
+# ---------------------------------------------------------------------------
+
+class BreachIndex:
+    """Consulta quantas vezes uma senha aparece no corpus de vazamentos."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, code, digest_size, record_size, count = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION or code not in _ALGORITHMS:
+            self._mm.close()
+            raise ValueError(f"Índice de vazamentos inválido ou de versão incompatível: {path}")
+
+        self.algorithm = _ALGORITHMS[code][0]
+        self._count = count
+        self._record_size = record_size
+        self._suffix_size = digest_size - _SUFFIX_START
+        self._records = _HEADER.size + (_BUCKETS + 1) * _OFFSET.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def count_digest(self, digest: bytes) -> int:
+        """Contagem de ocorrências do hash (0 se ausente)."""
+        mm = self._mm
+        prefix = _prefix(digest)
+        lo, hi = struct.unpack_from("<2Q", mm, _HEADER.size + prefix * _OFFSET.size)
+
+        suffix = digest[_SUFFIX_START:]
+        size = self._suffix_size
+        record_size = self._record_size
+        base = self._records
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            off = base + mid * record_size
+            probe = mm[off : off + size]
+            if probe < suffix:
+                lo = mid + 1
+            elif probe > suffix:
+                hi = mid
+            else:
+                return _COUNT.unpack_from(mm, off + size)[0]
+        return 0
+
+    def count(self, password: str) -> int:
+        """Quantas vezes a senha aparece no corpus (0 se nunca vazou)."""
+        return self.count_digest(_digest(password, self.algorithm))
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+def load_breach_index(path: Optional[str]) -> Optional[BreachIndex]:
+    """Abre o índice configurado; ``None`` se não houver (verificação desativada)."""
+    if path and os.path.exists(path):
+        return BreachIndex(path)
+    return None
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Gera o índice offline de senhas vazadas.")
+    parser.add_argument("source", help="dump HASH:CONTAGEM ordenado por hash")
+    parser.add_argument("dest", help="arquivo de índice de saída")
+    parser.add_argument("--algorithm", choices=sorted(_ALGORITHM_CODES), default="sha1")
+    args = parser.parse_args(argv)
+    total = build_breach_index(_iter_dump(args.source), args.dest, args.algorithm)
+    print(f"{total} hashes indexados em {args.dest}")
+
+
+if __name__ == "__main__":
+    main()
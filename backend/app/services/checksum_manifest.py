@@ -0,0 +1,473 @@
+"""
+Verificação de manifestos de checksum contra uma árvore de diretórios.
+
+Formatos aceitos (detectados por linha):
+  - GNU    : ``<hex>  caminho`` / ``<hex> *caminho`` (sha256sum, md5sum, b2sum...)
+  - BSD    : ``SHA256 (caminho) = <hex>`` (``--tag``)
+  - SFV    : ``caminho CRC32`` (arquivos .sfv; ``;`` inicia comentário)
+
+O algoritmo vem do argumento explícito, da linha (BSD), do nome do manifesto
+(``SHA512SUMS``, ``*.b2``, ``*.sfv``...) ou, por último, do tamanho do digest.
+
+Os arquivos são distribuídos em um pool de threads (hashlib, zlib.crc32 e a
+leitura do disco soltam o GIL), dos maiores para os menores — o arquivo de
+vários GB começa primeiro em vez de ficar sozinho no fim. Cada thread lê com
+``readinto`` em um buffer próprio reaproveitado e passa fatias (memoryview)
+ao hash, sem cópia. Resultados com problema e o progresso (inclusive dentro
+de arquivos grandes) saem como eventos à medida que acontecem.
+
+Com um cache (SQLite), arquivos cujo (caminho, tamanho, mtime) não mudou
+desde a última verificação reaproveitam o digest calculado antes.
+
+Uso (a partir de backend/):
+    python -m app.services.checksum_manifest SHA256SUMS --root /srv/espelho \\
+        --cache ~/.cache/checksums.db
+"""
+import argparse
+import hmac
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+from app.services.hash_checker import ALGORITHMS
+
+CRC32 = "crc32"
+_BUFFER_SIZE = 1024 * 1024
+_CACHE_BATCH = 256
+
+_HEX_LENGTHS = {8: CRC32, 32: "md5", 40: "sha1", 64: "sha256", 128: "sha512"}
+# trecho do nome do manifesto → algoritmo (ordem importa: "sha512" antes de "sha1")
+_NAME_HINTS = (
+    ("blake2b", "blake2b"), ("blake2s", "blake2s"), ("b2", "blake2b"),
+    ("sha512", "sha512"), ("sha256", "sha256"), ("sha1", "sha1"), ("md5", "md5"),
+    ("sfv", CRC32), ("crc", CRC32),
+)
+_BSD_LINE = re.compile(
+    r"^(?P<algo>[A-Za-z0-9-]+) ?\((?P<path>.*)\) ?= ?(?P<digest>[0-9a-fA-F]+)$"
+)
+_GNU_LINE = re.compile(r"^(?P<digest>[0-9a-fA-F]+) [ *](?P<path>.+)$")
+_SFV_LINE = re.compile(r"^(?P<path>.+?)\s+(?P<digest>[0-9a-fA-F]{8})$")
+
+_POOL: Optional[ThreadPoolExecutor] = None
+
+
+class ManifestError(ValueError):
+    """Manifesto ilegível, algoritmo desconhecido ou caminho fora da raiz."""
+
+
+class ManifestEntry(NamedTuple):
+    path: str           # como está no manifesto (relativo à raiz)
+    algorithm: str
+    expected: bytes
+
+
+def default_workers() -> int:
+    """Threads por verificação: 2× núcleos — metade esperando disco, metade calculando."""
+    return settings.CHECKSUM_WORKERS or 2 * (os.cpu_count() or 1)
+
+
+def get_pool() -> ThreadPoolExecutor:
+    """Pool compartilhado pelas verificações da API, criado sob demanda."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadPoolExecutor(max_workers=default_workers(), thread_name_prefix="checksum")
+    return _POOL
+
+
+def shutdown_pool() -> None:
+    """Encerra o pool (chamado no lifespan do FastAPI)."""
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=True, cancel_futures=True)
+        _POOL = None
+
+
+# ---------------------------------------------------------------------------
+# Leitura do manifesto
+# ---------------------------------------------------------------------------
+
+def _normalize_algorithm(name: str) -> str:
+    algorithm = name.strip().lower().replace("-", "")
+    if algorithm not in ALGORITHMS and algorithm != CRC32:
+        raise ManifestError(f"Algoritmo não suportado no manifesto: {name}")
+    return algorithm
+
+
+def _hint_from_name(manifest_name: str) -> Optional[str]:
+    lowered = os.path.basename(manifest_name).lower()
+    for fragment, algorithm in _NAME_HINTS:
+        if fragment in lowered:
+            return algorithm
+    return None
+
+
+def _unescape(path: str) -> str:
+    """Nomes com ``\\`` ou quebra de linha vêm escapados no formato GNU."""
+    return path.replace("\\\\", "\x00").replace("\\n", "\n").replace("\x00", "\\")
+
+
+def parse_manifest(
+    text: str, algorithm: Optional[str] = None, manifest_name: str = ""
+) -> List[ManifestEntry]:
+    """Entradas do manifesto, na ordem do arquivo. ManifestError se ilegível."""
+    forced = _normalize_algorithm(algorithm) if algorithm else None
+    hint = forced or _hint_from_name(manifest_name)
+    sfv = hint == CRC32
+    entries: List[ManifestEntry] = []
+
+    for number, raw in enumerate(text.splitlines(), 1):
+        line = raw.rstrip("\r")
+        if not line.strip() or line.startswith((";", "#")):
+            continue
+        escaped = line.startswith("\\")
+        body = line[1:] if escaped else line
+
+        match = _BSD_LINE.match(body)
+        if match and not sfv:
+            line_algorithm = forced or _normalize_algorithm(match["algo"])
+        else:
+            match = (_SFV_LINE if sfv else _GNU_LINE).match(body)
+            if match is None:
+                raise ManifestError(f"Linha {number} do manifesto não reconhecida: {line[:80]!r}")
+            line_algorithm = hint or _HEX_LENGTHS.get(len(match["digest"]))
+            if line_algorithm is None:
+                raise ManifestError(f"Linha {number}: tamanho de digest desconhecido.")
+
+        digest = match["digest"]
+        if len(digest) % 2:
+            raise ManifestError(f"Linha {number}: digest com número ímpar de dígitos.")
+        path = _unescape(match["path"]) if escaped else match["path"]
+        entries.append(ManifestEntry(path, line_algorithm, bytes.fromhex(digest)))
+    return entries
+
+
+def resolve_path(root: str, relative: str) -> str:
+    """Caminho absoluto de ``relative`` sob ``root``; ManifestError se escapar dela."""
+    root_real = os.path.realpath(root)
+    full = os.path.realpath(os.path.join(root_real, relative))
+    if os.path.commonpath([full, root_real]) != root_real:
+        raise ManifestError(f"Caminho fora da raiz: {relative}")
+    return full
+
+
+# ---------------------------------------------------------------------------
+# Cálculo
+# ---------------------------------------------------------------------------
+_LOCAL = threading.local()
+
+
+class _Run:
+    """Estado compartilhado entre as threads de uma verificação."""
+    __slots__ = ("bytes_done", "cancelled")
+
+    def __init__(self):
+        self.bytes_done = 0
+        self.cancelled = False
+
+
+class _Cancelled(Exception):
+    pass
+
+
+def hash_file(path: str, algorithm: str, run: Optional[_Run] = None) -> bytes:
+    """Digest de ``path`` lido com readinto no buffer da thread (sem cópias)."""
+    buffer = getattr(_LOCAL, "buffer", None)
+    if buffer is None:
+        buffer = _LOCAL.buffer = memoryview(bytearray(_BUFFER_SIZE))
+    crc = 0
+    hasher = None if algorithm == CRC32 else ALGORITHMS[algorithm]()
+
+    with open(path, "rb", buffering=0) as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            if hasher is None:
+                crc = zlib.crc32(buffer[:n], crc)
+            else:
+                hasher.update(buffer[:n])
+            if run is not None:
+                run.bytes_done += n   # só para o progresso; corrida entre threads é tolerável
+                if run.cancelled:
+                    raise _Cancelled()
+    return crc.to_bytes(4, "big") if hasher is None else hasher.digest()
+
+
+class DigestCache:
+    """(caminho, algoritmo) → (tamanho, mtime_ns, digest), persistido em SQLite."""
+
+    def __init__(self, path: str):
+        # o gerador da API pode avançar em threads diferentes (uma por vez)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS digests ("
+            " path TEXT NOT NULL, algorithm TEXT NOT NULL, size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL, digest BLOB NOT NULL,"
+            " PRIMARY KEY (path, algorithm))"
+        )
+        self._pending: List[Tuple[str, str, int, int, bytes]] = []
+
+    def get(self, path: str, algorithm: str, size: int, mtime_ns: int) -> Optional[bytes]:
+        row = self._db.execute(
+            "SELECT digest FROM digests"
+            " WHERE path = ? AND algorithm = ? AND size = ? AND mtime_ns = ?",
+            (path, algorithm, size, mtime_ns),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, path: str, algorithm: str, size: int, mtime_ns: int, digest: bytes) -> None:
+        self._pending.append((path, algorithm, size, mtime_ns, digest))
+        if len(self._pending) >= _CACHE_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?)", self._pending
+                )
+            self._pending.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._db.close()
+
+
+# ---------------------------------------------------------------------------
+# Verificação
+# ---------------------------------------------------------------------------
+
+def _result(entry: ManifestEntry, status: str, size: int, actual: Optional[bytes] = None,
+            cached: bool = False, error: Optional[str] = None) -> dict:
+    return {
+        "event": "result",
+        "path": entry.path,
+        "status": status,   # ok | mismatch | missing | error
+        "algorithm": entry.algorithm,
+        "size": size,
+        "expected": entry.expected.hex(),
+        "actual": actual.hex() if actual is not None else None,
+        "cached": cached,
+        "error": error,
+    }
+
+
+def verify_manifest(
+    entries: Iterable[ManifestEntry],
+    root: str,
+    pool: Optional[Executor] = None,
+    workers: int = 0,
+    cache: Optional[DigestCache] = None,
+    report_ok: bool = False,
+    progress_interval: float = 0.5,
+) -> Iterator[dict]:
+    """
+    Verifica ``entries`` sob ``root`` e gera eventos à medida que acontecem:
+      - ``result``   : arquivo com problema (mismatch, missing, error) — e os
+                       ``ok`` também, se ``report_ok``
+      - ``progress`` : a cada ``progress_interval`` s (arquivos e bytes)
+      - ``summary``  : totais, no fim
+
+    Sem ``pool``, cria um com ``workers`` (ou default_workers()) threads só
+    para esta chamada; no máximo 4 arquivos por thread ficam em voo.
+    Fechar o gerador no meio (cliente desconectou) interrompe as leituras.
+    """
+    started = time.perf_counter()
+    own_pool = pool is None
+    if own_pool:
+        pool = ThreadPoolExecutor(
+            max_workers=workers or default_workers(), thread_name_prefix="checksum"
+        )
+    run = _Run()
+    counts = {"ok": 0, "mismatch": 0, "missing": 0, "error": 0}
+    cached_files = 0
+    done = 0
+    bytes_total = 0
+    bytes_cached = 0
+    bytes_hashed = 0
+
+    def finish(entry: ManifestEntry, status: str, *args, **kwargs) -> Optional[dict]:
+        nonlocal done
+        done += 1
+        counts[status] += 1
+        if status != "ok" or report_ok:
+            return _result(entry, status, *args, **kwargs)
+        return None
+
+    jobs: List[Tuple[int, ManifestEntry, str, int]] = []   # (tamanho, entrada, caminho, mtime)
+    in_flight: Dict[Future, Tuple[int, ManifestEntry, str, int]] = {}
+    try:
+        # 1) stat + cache: o que falta ou não mudou sai antes de qualquer leitura
+        entries = list(entries)
+        total = len(entries)
+        for entry in entries:
+            try:
+                full = resolve_path(root, entry.path)
+                st = os.stat(full)
+            except ManifestError as exc:
+                event = finish(entry, "error", 0, error=str(exc))
+            except FileNotFoundError:
+                event = finish(entry, "missing", 0)
+            except OSError as exc:
+                event = finish(entry, "error", 0, error=exc.strerror or str(exc))
+            else:
+                bytes_total += st.st_size
+                digest = None
+                if cache is not None:
+                    digest = cache.get(full, entry.algorithm, st.st_size, st.st_mtime_ns)
+                if digest is None:
+                    jobs.append((st.st_size, entry, full, st.st_mtime_ns))
+                    continue
+                cached_files += 1
+                bytes_cached += st.st_size
+                ok = hmac.compare_digest(digest, entry.expected)
+                event = finish(entry, "ok" if ok else "mismatch", st.st_size, digest, cached=True)
+            if event is not None:
+                yield event
+
+        # 2) leitura: maiores primeiro, no máximo 4 arquivos por thread em voo
+        jobs.sort(key=lambda job: job[0], reverse=True)
+        window = 4 * (workers or default_workers())
+        next_job = 0
+        last_progress = time.perf_counter()
+
+        def progress() -> dict:
+            return {
+                "event": "progress",
+                "done": done,
+                "total": total,
+                "bytes_done": bytes_cached + run.bytes_done,
+                "bytes_total": bytes_total,
+            }
+
+        while next_job < len(jobs) or in_flight:
+            while next_job < len(jobs) and len(in_flight) < window:
+                job = jobs[next_job]
+                next_job += 1
+                in_flight[pool.submit(hash_file, job[2], job[1].algorithm, run)] = job
+
+            finished, _ = wait(in_flight, timeout=progress_interval, return_when=FIRST_COMPLETED)
+            for future in finished:
+                size, entry, full, mtime_ns = in_flight.pop(future)
+                try:
+                    digest = future.result()
+                except FileNotFoundError:
+                    event = finish(entry, "missing", size)
+                except OSError as exc:
+                    event = finish(entry, "error", size, error=exc.strerror or str(exc))
+                else:
+                    bytes_hashed += size
+                    if cache is not None:
+                        cache.put(full, entry.algorithm, size, mtime_ns, digest)
+                    ok = hmac.compare_digest(digest, entry.expected)
+                    event = finish(entry, "ok" if ok else "mismatch", size, digest)
+                if event is not None:
+                    yield event
+
+            now = time.perf_counter()
+            if now - last_progress >= progress_interval:
+                last_progress = now
+                yield progress()
+    finally:
+        run.cancelled = True   # gerador fechado no meio: threads param no próximo bloco
+        for future in in_flight:
+            future.cancel()
+        if cache is not None:
+            cache.flush()
+        if own_pool:
+            pool.shutdown(wait=True)
+
+    elapsed = time.perf_counter() - started
+    yield {
+        "event": "summary",
+        "total": total,
+        **counts,
+        "cached": cached_files,
+        "bytes_total": bytes_total,
+        "bytes_hashed": bytes_hashed,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_mb_s": round(bytes_hashed / elapsed / 1e6, 2) if elapsed > 0 else 0.0,
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Verifica um manifesto de checksums (sha256sum, md5sum, b2sum, BSD, .sfv)."
+    )
+    parser.add_argument("manifest", help="arquivo de manifesto ('-' = entrada padrão)")
+    parser.add_argument("--root", help="diretório base dos caminhos (padrão: pasta do manifesto)")
+    parser.add_argument(
+        "--algorithm",
+        help="força o algoritmo (md5, sha1, sha256, sha512, blake2b, blake2s, crc32)",
+    )
+    parser.add_argument("--workers", type=int, default=0, help="threads (0 = 2× núcleos)")
+    parser.add_argument(
+        "--cache", help="arquivo SQLite do cache (caminho, tamanho, mtime) → digest"
+    )
+    parser.add_argument("--json", action="store_true", help="eventos em NDJSON na saída padrão")
+    parser.add_argument("--verbose", action="store_true", help="lista também os arquivos OK")
+    args = parser.parse_args(argv)
+
+    if args.manifest == "-":
+        text, root = sys.stdin.read(), args.root or "."
+    else:
+        with open(args.manifest, encoding="utf-8", errors="surrogateescape") as f:
+            text = f.read()
+        root = args.root or os.path.dirname(os.path.abspath(args.manifest))
+    try:
+        entries = parse_manifest(text, args.algorithm, args.manifest)
+    except ManifestError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    cache = DigestCache(args.cache) if args.cache else None
+    summary: dict = {}
+    try:
+        events = verify_manifest(
+            entries, root, workers=args.workers, cache=cache, report_ok=args.verbose or args.json
+        )
+        for event in events:
+            if args.json:
+                print(json.dumps(event, ensure_ascii=False), flush=True)
+            elif event["event"] == "result":
+                label = {"ok": "OK", "mismatch": "FALHOU", "missing": "AUSENTE", "error": "ERRO"}
+                detail = f" ({event['error']})" if event["error"] else ""
+                print(f"{event['path']}: {label[event['status']]}{detail}", flush=True)
+            elif event["event"] == "progress" and sys.stderr.isatty():
+                total_bytes = event["bytes_total"] or 1
+                print(f"\r{event['done']}/{event['total']} arquivos, "
+                      f"{event['bytes_done'] / total_bytes:.1%}", end="", file=sys.stderr)
+            if event["event"] == "summary":
+                summary = event
+    finally:
+        if cache is not None:
+            cache.close()
+
+    if not args.json:
+        if sys.stderr.isatty():
+            print(file=sys.stderr)
+        print(
+            f"{summary['total']} arquivos: {summary['ok']} OK, {summary['mismatch']} com falha, "
+            f"{summary['missing']} ausentes, {summary['error']} com erro "
+            f"({summary['cached']} do cache, {summary['throughput_mb_s']} MB/s)"
+        )
+    return 0 if summary["ok"] == summary["total"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+"""
+Lista de bloqueio de domínios e URLs para o detector de phishing.
+
+Feeds públicos (URLhaus, listas de hosts, filtros de adblock) somam milhões
+de entradas; em um ``set[str]`` isso custa centenas de MB por worker. A lista
+reaproveita o formato compilado de ``blocklist`` (chaves de 8 bytes
+ordenadas + filtro de Bloom, aberto com ``mmap`` somente leitura), então
+todos os workers do uvicorn dividem o mesmo page cache.
+
+Entradas (chaves de ``blocklist._key``):
+  - ``d:<domínio>`` — bloqueia o domínio e todos os subdomínios; a consulta
+    sobe pelos domínios pais do host até o registrável
+    (``a.evil.example.com`` → ``evil.example.com`` → ``example.com``)
+  - ``u:<host><caminho>[?query]`` — uma URL específica (sem esquema, porta,
+    fragmento nem "/" final), para páginas maliciosas em hosts legítimos
+
+Hosts IDN entram e são consultados na forma ``xn--``.
+
+Feeds aceitos, uma entrada por linha (``#`` e ``!`` iniciam comentários):
+  - domínio ou URL: ``evil.com``, ``https://site.com/login.php``
+  - arquivo hosts : ``0.0.0.0 evil.com``
+  - adblock       : ``||evil.com^``
+
+Recarga: o build grava o arquivo novo ao lado e o troca com ``os.replace``;
+a API percebe a troca (inode/mtime/tamanho, a cada
+``DOMAIN_BLOCKLIST_WATCH_SECONDS``) ou recebe SIGHUP, abre o arquivo novo e
+troca a referência de uma vez. Consultas em andamento seguem com a lista que
+já pegaram; o mmap antigo é liberado pela contagem de referências assim que
+a última termina (o cache de hosts não referencia a instância, sem ciclo).
+
+Uso (a partir de backend/):
+    python -m app.services.domain_blocklist feeds/*.txt -o app/data/domain_blocklist.bin
+"""
+import argparse
+import asyncio
+import logging
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.blocklist import _DEFAULT_BLOOM_BITS_PER_KEY, MmapBlocklist, _key, build_blocklist
+from app.services.public_suffix import suffix_length, to_ascii_label
+from app.services.url_parser import split_url
+
+logger = logging.getLogger(__name__)
+
+_DOMAIN_PREFIX = "d:"
+_URL_PREFIX = "u:"
+_HOST_CACHE_SIZE = 65_536
+
+# primeira coluna de um arquivo hosts (o domínio vem na segunda)
+_HOSTS_FILE_ADDRESSES = frozenset(("0.0.0.0", "127.0.0.1", "::", "::1"))
+_IGNORED_HOSTS = frozenset(("localhost", "localhost.localdomain", "local", "broadcasthost"))
+
+
+def normalize_host(host: str) -> str:
+    """Host em minúsculas, sem pontos nas pontas e com rótulos IDN em ``xn--``."""
+    host = host.strip().strip(".").lower()
+    if not host.isascii():
+        host = ".".join(to_ascii_label(label) for label in host.split("."))
+    return host
+
+
+def url_key(host: str, rest: str) -> Optional[str]:
+    """
+    Forma canônica da URL para entradas ``u:`` (host + caminho + query, sem
+    fragmento nem "/" final); None quando a URL é só o host.
+    """
+    rest = rest.partition("#")[0]
+    if "?" not in rest:
+        rest = rest.rstrip("/")
+    if not rest:
+        return None
+    return normalize_host(host) + rest
+
+
+def _candidates(host: str) -> List[str]:
+    """O host e seus domínios pais até o registrável (IPs: só o próprio)."""
+    if host.startswith("[") or host.replace(".", "").isdigit():
+        return [host]
+    labels = host.split(".")
+    keep = max(len(labels) - suffix_length(labels), 1)
+    return [".".join(labels[i:]) for i in range(keep)]
+
+
+def iter_feed_entries(lines: Iterable[str]) -> Iterator[str]:
+    """Chaves (``d:``/``u:``) das linhas de um feed; linhas inválidas são ignoradas."""
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] in "#!;[":
+            continue
+        fields = line.split()
+        entry = fields[0]
+        if entry in _HOSTS_FILE_ADDRESSES:
+            if len(fields) < 2:
+                continue
+            entry = fields[1]
+        if entry.startswith("||"):
+            entry = entry[2:].split("^", 1)[0].split("$", 1)[0]
+        if entry.startswith("*."):
+            entry = entry[2:]
+        _, _, host, _, rest = split_url(entry)
+        host = normalize_host(host)
+        if not host or host in _IGNORED_HOSTS:
+            continue
+        key = url_key(host, rest)
+        yield _URL_PREFIX + key if key else _DOMAIN_PREFIX + host
+
+
+def _iter_feeds(paths: Sequence[str]) -> Iterator[str]:
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            yield from iter_feed_entries(f)
+
+
+def _host_matcher(entries: MmapBlocklist) -> Callable[[str], Optional[str]]:
+    """
+    Consulta de host com cache LRU: entrada que bloqueia ``host`` (ele mesmo ou
+    um domínio pai), ou None. A closure referencia só a lista, não a
+    DomainBlocklist — um ``lru_cache`` do método ligado formaria um ciclo, e a
+    lista trocada (com o mmap) só seria liberada pelo coletor de ciclos.
+    """
+    @lru_cache(maxsize=_HOST_CACHE_SIZE)
+    def match_host(host: str) -> Optional[str]:
+        for candidate in _candidates(normalize_host(host)):
+            if _DOMAIN_PREFIX + candidate in entries:
+                return candidate
+        return None
+    return match_host
+
+
+class DomainBlocklist:
+    """Lista compilada aberta via mmap: consulta de host (com cache) e de URLs em lote."""
+
+    def __init__(self, path: str, use_bloom: bool = True):
+        stat = os.stat(path)
+        self.path = path
+        self.signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        self.loaded_at = time.time()
+        self._list = MmapBlocklist(path, use_bloom=use_bloom)
+
+        # visões NumPy sobre o mmap (sem cópia) para as consultas em lote
+        layout = self._list.layout()
+        self._keys = np.frombuffer(layout.buffer, dtype="S8", count=layout.count, offset=layout.records)
+        self._bloom_m, self._bloom_k = layout.bloom_m, layout.bloom_k
+        self._bloom = np.frombuffer(
+            layout.buffer, dtype=np.uint8, count=(layout.bloom_m + 7) // 8, offset=layout.bloom
+        ) if layout.bloom_m else None
+
+        # cache por instância: a troca da lista descarta o cache junto (ver _host_matcher)
+        self.match_host = _host_matcher(self._list)
+
+    def __len__(self) -> int:
+        return len(self._list)
+
+    def contains_many(self, words: Sequence[str]) -> np.ndarray:
+        """``word in lista`` para cada palavra, com Bloom e busca binária em NumPy."""
+        n = len(words)
+        hits = np.zeros(n, dtype=bool)
+        if n == 0 or len(self._keys) == 0:
+            return hits
+        raw = b"".join(map(_key, words))
+        keys = np.frombuffer(raw, dtype="S8")
+        maybe = self._bloom_mask(raw, n)
+        candidates = keys[maybe]
+        found = np.minimum(np.searchsorted(self._keys, candidates), len(self._keys) - 1)
+        hits[maybe] = self._keys[found] == candidates
+        return hits
+
+    def _bloom_mask(self, raw: bytes, n: int) -> np.ndarray:
+        """Chaves (concatenadas em ``raw``) que passam pelo filtro de Bloom."""
+        if self._bloom is None:
+            return np.ones(n, dtype=bool)
+        # mesmas posições de blocklist._bloom_positions, para todas as chaves de uma vez
+        halves = np.frombuffer(raw, dtype="<u4").reshape(n, 2).astype(np.uint64)
+        steps = np.arange(self._bloom_k, dtype=np.uint64)
+        pos = (halves[:, :1] + steps * (halves[:, 1:] | np.uint64(1))) % np.uint64(self._bloom_m)
+        return ((self._bloom[pos >> np.uint64(3)] >> (pos & np.uint64(7))) & 1).all(axis=1)
+
+    def match_urls(self, parsed: Sequence[Tuple]) -> np.ndarray:
+        """URL bloqueada (entrada ``u:``) para cada resultado de ``split_url``."""
+        keys, rows = [], []
+        for i, (_, _, host, _, rest) in enumerate(parsed):
+            key = url_key(host, rest)
+            if key:
+                keys.append(_URL_PREFIX + key)
+                rows.append(i)
+        hits = np.zeros(len(parsed), dtype=bool)
+        if keys:
+            hits[rows] = self.contains_many(keys)
+        return hits
+
+    def match_url(self, url: str) -> Optional[str]:
+        """Entrada que bloqueia ``url`` (domínio pai ou a própria URL), ou None."""
+        _, _, host, _, rest = split_url(url.strip())
+        matched = self.match_host(host)
+        if matched is None:
+            key = url_key(host, rest)
+            if key and _URL_PREFIX + key in self._list:
+                matched = key
+        return matched
+
+
+# ---------------------------------------------------------------------------
+# Lista em uso (troca atômica)
+# ---------------------------------------------------------------------------
+
+_CURRENT: Optional[DomainBlocklist] = None
+_LOADED = False
+_LOCK = threading.Lock()
+
+
+def _open() -> None:
+    global _CURRENT, _LOADED
+    path = settings.DOMAIN_BLOCKLIST_PATH
+    # abre a nova antes de trocar: arquivo inválido mantém a lista anterior
+    opened = DomainBlocklist(path, settings.BLOCKLIST_BLOOM) if path and os.path.exists(path) else None
+    _CURRENT = opened
+    _LOADED = True
+
+
+def current() -> Optional[DomainBlocklist]:
+    """Lista em uso (aberta no primeiro uso); None sem ``DOMAIN_BLOCKLIST_PATH``."""
+    if not _LOADED:
+        with _LOCK:
+            if not _LOADED:
+                _open()
+    return _CURRENT
+
+
+def reload_domain_blocklist() -> None:
+    """Reabre o arquivo e troca a lista em uso (handler do SIGHUP)."""
+    with _LOCK:
+        _open()
+
+
+def status() -> dict:
+    blocklist = current()
+    if blocklist is None:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        "path": blocklist.path,
+        "entries": len(blocklist),
+        "loaded_at": blocklist.loaded_at,
+    }
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+async def watch(interval: float) -> None:
+    """Recarrega a lista quando o arquivo é trocado (tarefa do lifespan)."""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        signature = _file_signature(settings.DOMAIN_BLOCKLIST_PATH)
+        loaded = current()
+        if signature != (loaded.signature if loaded else None):
+            try:
+                await loop.run_in_executor(None, reload_domain_blocklist)
+            except Exception:
+                # arquivo a meio caminho ou inválido: segue com a lista atual e tenta de novo
+                logger.exception("Falha ao recarregar a lista de domínios %s", settings.DOMAIN_BLOCKLIST_PATH)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Compila feeds de domínios/URLs para o formato mmap.")
+    parser.add_argument("feeds", nargs="+", help="arquivos de feed (domínios, hosts, adblock ou URLs)")
+    parser.add_argument("-o", "--output", required=True, help="arquivo binário de saída")
+    parser.add_argument(
+        "--bloom-bits", type=int, default=_DEFAULT_BLOOM_BITS_PER_KEY,
+        help="bits do filtro de Bloom por chave (0 desativa)",
+    )
+    args = parser.parse_args(argv)
+    total = build_blocklist(_iter_feeds(args.feeds), args.output, args.bloom_bits)
+    print(f"{total} entradas distintas gravadas em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,543 @@
+"""
+Estimativa do número de tentativas necessárias para adivinhar uma senha.
+
+``log2(charset ^ comprimento)`` supõe que cada caractere é sorteado ao acaso,
+e por isso trata ``Password2024!`` como forte. Aqui a senha é decomposta em
+padrões que um atacante testa primeiro — palavras de dicionário (inclusive
+invertidas e em l33t), repetições, sequências, caminhos no teclado e datas —
+e uma programação dinâmica escolhe a cobertura que minimiza o total de
+tentativas (mesma ideia do zxcvbn). Trechos não cobertos contam como força
+bruta, 10 tentativas por caractere.
+
+As tabelas fixas (grafo de adjacência do teclado, substituições l33t,
+datas) são montadas na importação; a trie do dicionário, que cresce com as
+listas de palavras, no primeiro uso (ou vem pronta do snapshot do validador). Cada matcher percorre a
+senha uma vez, com janelas limitadas (tamanho máximo de palavra, de data,
+de bloco repetido, de caminho no teclado), então cada posição gera um número
+limitado de matches, de custo limitado; a DP é linear no número de matches
+— o custo total é linear no comprimento da senha.
+"""
+import math
+import os
+import re
+import threading
+from datetime import date
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+_DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+_RANKED_DICTIONARY_FILE = os.path.join(_DATA_DIR, "guess_dictionary.txt")
+_COMMON_PASSWORDS_FILE = os.path.join(_DATA_DIR, "common_passwords.txt")
+
+# A lista de senhas comuns pode ter milhões de linhas; só as primeiras entram
+# na trie (a ordem do arquivo é a ordem de popularidade).
+_MAX_COMMON_WORDS = 30_000
+_MAX_WORD_LENGTH = 24
+
+_BRUTEFORCE_LOG10 = 1.0            # 10 tentativas por caractere
+_MIN_GUESSES_SINGLE_CHAR = 10
+_MIN_GUESSES_MULTI_CHAR = 50
+_TOKEN_PENALTY_LOG10 = math.log10(2)   # custo de "qual padrão vem a seguir"
+
+_REFERENCE_YEAR = date.today().year
+_MIN_YEAR_SPACE = 20
+_MAX_REPEAT_UNIT = 8
+# caminhos no teclado mais longos viram trechos consecutivos (como as palavras,
+# que param em _MAX_WORD_LENGTH): a contagem de curvas cresce como comb(n, k)
+_MAX_SPATIAL_LENGTH = 24
+
+
+class GuessMatch(NamedTuple):
+    """Trecho [start, end) da senha explicado por um padrão."""
+    start: int
+    end: int
+    kind: str
+    token: str
+    guesses: float
+
+
+class GuessEstimate(NamedTuple):
+    guesses_log10: float
+    sequence: Tuple[GuessMatch, ...]   # cobertura ótima (sem os trechos de força bruta)
+
+
+# ---------------------------------------------------------------------------
+# Tabelas pré-calculadas
+# ---------------------------------------------------------------------------
+
+def _read_words(path: str, limit: Optional[int] = None) -> List[str]:
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        lines = (line.strip().lower() for line in f)
+        return [w for w in islice(lines, limit) if w]
+
+
+def build_dictionary_trie(common_passwords_path: str = _COMMON_PASSWORDS_FILE) -> dict:
+    """Trie de dicionário; a chave ``""`` de um nó guarda o rank da palavra."""
+    trie: dict = {}
+    rank = 0
+    for word in _read_words(_RANKED_DICTIONARY_FILE) + _read_words(
+        common_passwords_path, _MAX_COMMON_WORDS
+    ):
+        if len(word) > _MAX_WORD_LENGTH:
+            continue
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        if "" not in node:
+            rank += 1
+            node[""] = rank
+    return trie
+
+
+# A trie depende do tamanho das listas: é montada (ou lida do snapshot do
+# validador) no primeiro uso, não na importação.
+_TRIE: Optional[dict] = None
+_TRIE_LOADER: Callable[[], dict] = build_dictionary_trie
+_TRIE_LOCK = threading.Lock()
+
+
+def set_dictionary_source(loader: Callable[[], dict]) -> None:
+    """Troca a origem da trie (ex.: seção do snapshot); carregada no próximo uso."""
+    global _TRIE, _TRIE_LOADER
+    with _TRIE_LOCK:
+        _TRIE_LOADER = loader
+        _TRIE = None
+
+
+def dictionary_loaded() -> bool:
+    return _TRIE is not None
+
+
+def _dictionary_trie() -> dict:
+    global _TRIE
+    trie = _TRIE
+    if trie is None:
+        with _TRIE_LOCK:
+            if _TRIE is None:
+                _TRIE = _TRIE_LOADER()
+            trie = _TRIE
+    return trie
+
+
+# caractere digitado → letras que ele pode estar substituindo
+_L33T_TABLE: Dict[str, Tuple[str, ...]] = {
+    "4": ("a",), "@": ("a",), "8": ("b",), "(": ("c",), "{": ("c",), "[": ("c",),
+    "<": ("c",), "3": ("e",), "6": ("g",), "9": ("g",), "1": ("i", "l"), "!": ("i",),
+    "|": ("i", "l"), "7": ("l", "t"), "0": ("o",), "$": ("s",), "5": ("s",),
+    "+": ("t",), "%": ("x",), "2": ("z",),
+}
+
+_KEYBOARD_ROWS = ("`1234567890-=", " qwertyuiop[]\\", " asdfghjkl;'", " zxcvbnm,./")
+_KEYBOARD_ROWS_SHIFTED = ("~!@#$%^&*()_+", " QWERTYUIOP{}|", ' ASDFGHJKL:"', " ZXCVBNM<>?")
+# teclado "inclinado": cada linha começa meia tecla à direita da anterior
+_KEYBOARD_DIRECTIONS = ((-1, 0), (0, -1), (1, -1), (1, 0), (0, 1), (-1, 1))
+
+
+def _build_keyboard() -> Tuple[Dict[str, Tuple[int, int]], Dict[Tuple[int, int], str], set]:
+    position: Dict[str, Tuple[int, int]] = {}
+    key_at: Dict[Tuple[int, int], str] = {}
+    shifted = set()
+    for y, (row, row_shifted) in enumerate(zip(_KEYBOARD_ROWS, _KEYBOARD_ROWS_SHIFTED)):
+        for x, (ch, ch_shifted) in enumerate(zip(row, row_shifted)):
+            if ch == " ":
+                continue
+            position[ch] = position[ch_shifted] = (x, y)
+            key_at[(x, y)] = ch
+            shifted.add(ch_shifted)
+    return position, key_at, shifted
+
+
+_KEY_POSITION, _KEY_AT, _SHIFTED_KEYS = _build_keyboard()
+_KEYBOARD_STARTING_POSITIONS = len(_KEY_AT)
+_KEYBOARD_AVERAGE_DEGREE = sum(
+    sum((x + dx, y + dy) in _KEY_AT for dx, dy in _KEYBOARD_DIRECTIONS)
+    for x, y in _KEY_AT
+) / len(_KEY_AT)
+
+
+def _adjacent_direction(a: str, b: str) -> Optional[int]:
+    """Índice da direção de ``a`` para ``b`` no teclado (None se não vizinhos)."""
+    pa = _KEY_POSITION.get(a)
+    pb = _KEY_POSITION.get(b)
+    if pa is None or pb is None:
+        return None
+    delta = (pb[0] - pa[0], pb[1] - pa[1])
+    try:
+        return _KEYBOARD_DIRECTIONS.index(delta)
+    except ValueError:
+        return None
+
+
+_DATE_WITH_SEPARATOR = re.compile(r"(\d{1,4})([\s/\\_.-])(\d{1,2})\2(\d{1,4})")
+_YEAR = re.compile(r"19\d\d|20\d\d")
+
+
+# ---------------------------------------------------------------------------
+# Variações (maiúsculas, l33t) e combinatória
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=4096)
+def _n_choose_k(n: int, k: int) -> int:
+    return math.comb(n, k)
+
+
+def _uppercase_variations(token: str) -> float:
+    upper = sum(ch.isupper() for ch in token)
+    if upper == 0 or token.lower() == token:
+        return 1
+    lower = sum(ch.islower() for ch in token)
+    # só a primeira, só a última ou todas maiúsculas: atacantes testam primeiro
+    if lower == 0 or (upper == 1 and (token[0].isupper() or token[-1].isupper())):
+        return 2
+    return sum(_n_choose_k(upper + lower, i) for i in range(1, min(upper, lower) + 1))
+
+
+def _l33t_variations(token: str, word: str) -> float:
+    variations = 1
+    subs: Dict[Tuple[str, str], int] = {}
+    for typed, letter in zip(token.lower(), word):
+        if typed != letter:
+            subs[(typed, letter)] = subs.get((typed, letter), 0) + 1
+    for (typed, letter), subbed in subs.items():
+        unsubbed = word.count(letter) - subbed
+        if unsubbed <= 0:
+            variations *= 2
+        else:
+            variations *= sum(
+                _n_choose_k(subbed + unsubbed, i) for i in range(1, min(subbed, unsubbed) + 1)
+            )
+    return variations
+
+
+# ---------------------------------------------------------------------------
+# Matchers
+# ---------------------------------------------------------------------------
+
+def _walk_trie(trie: dict, text: str, start: int, l33t: bool = True):
+    """Palavras do dicionário que começam em ``start`` (com substituições l33t)."""
+    stack = [(trie, start, "")]
+    limit = min(len(text), start + _MAX_WORD_LENGTH)
+    while stack:
+        node, j, word = stack.pop()
+        if "" in node and j > start:
+            yield j, word, node[""]
+        if j >= limit:
+            continue
+        ch = text[j]
+        child = node.get(ch)
+        if child is not None:
+            stack.append((child, j + 1, word + ch))
+        if l33t:
+            for letter in _L33T_TABLE.get(ch, ()):
+                child = node.get(letter)
+                if child is not None:
+                    stack.append((child, j + 1, word + letter))
+
+
+def _dictionary_matches(password: str, lowered: str) -> List[GuessMatch]:
+    """
+    Melhor palavra para cada trecho [i, j). Listas de senhas têm várias
+    entradas parecidas ("1111", "111111"...); só a mais barata interessa à DP.
+    """
+    matches = []
+    n = len(password)
+    reversed_lowered = lowered[::-1]
+    trie = _dictionary_trie()
+    for i in range(n):
+        best: Dict[int, GuessMatch] = {}
+        for j, word, rank in _walk_trie(trie, lowered, i):
+            token = password[i:j]
+            l33t = word != lowered[i:j]
+            guesses = rank if token == lowered[i:j] else rank * _uppercase_variations(token)
+            if l33t:
+                guesses *= _l33t_variations(token, word)
+            if j not in best or guesses < best[j].guesses:
+                best[j] = GuessMatch(i, j, "l33t" if l33t else "dictionary", token, guesses)
+        matches.extend(best.values())
+        for j, word, rank in _walk_trie(trie, reversed_lowered, i, l33t=False):
+            if j - i < 3 or word == lowered[n - j : n - i]:
+                continue   # invertidas: 3+ letras e não palíndromas
+            start, end = n - j, n - i
+            token = password[start:end]
+            guesses = rank * _uppercase_variations(token) * 2
+            matches.append(GuessMatch(start, end, "reversed", token, guesses))
+    return matches
+
+
+def _repeat_matches(password: str) -> List[GuessMatch]:
+    """Blocos de até ``_MAX_REPEAT_UNIT`` caracteres repetidos em sequência."""
+    matches = []
+    n = len(password)
+    for size in range(1, _MAX_REPEAT_UNIT + 1):
+        i = 0
+        while i + 2 * size <= n:
+            unit = password[i : i + size]
+            end = i + size
+            while password[end : end + size] == unit:
+                end += size
+            if end - i >= 2 * size:
+                count = (end - i) // size
+                base = 10 ** _unit_guesses_log10(unit)
+                matches.append(GuessMatch(i, end, "repeat", password[i:end], base * count))
+                i = end - size + 1
+            else:
+                i += 1
+    return matches
+
+
+@lru_cache(maxsize=4096)
+def _unit_guesses_log10(unit: str) -> float:
+    """Custo do bloco que se repete (ele mesmo decomposto em padrões)."""
+    return estimate_guesses(unit).guesses_log10
+
+
+def _sequence_matches(password: str) -> List[GuessMatch]:
+    """Trechos com passo constante entre códigos (abc, 2468, zyx), 3+ caracteres."""
+    matches = []
+    n = len(password)
+    i = 0
+    while i < n - 2:
+        delta = ord(password[i + 1]) - ord(password[i])
+        if delta == 0 or abs(delta) > 5:
+            i += 1
+            continue
+        j = i + 2
+        while j < n and ord(password[j]) - ord(password[j - 1]) == delta:
+            j += 1
+        if j - i >= 3:
+            token = password[i:j]
+            first = token[0]
+            if first in "aAzZ019":
+                base = 4
+            elif first.isdigit():
+                base = 10
+            else:
+                base = 26
+            if delta < 0:
+                base *= 2
+            matches.append(GuessMatch(i, j, "sequence", token, base * len(token)))
+            i = j - 1
+        else:
+            i += 1
+    return matches
+
+
+@lru_cache(maxsize=4096)
+def _spatial_guesses(length: int, turns: int, shifted: int) -> float:
+    s = _KEYBOARD_STARTING_POSITIONS
+    d = _KEYBOARD_AVERAGE_DEGREE
+    guesses = 0.0
+    for i in range(2, length + 1):
+        for j in range(1, min(turns, i - 1) + 1):
+            guesses += _n_choose_k(i - 1, j - 1) * s * d ** j
+    if shifted:
+        unshifted = length - shifted
+        if unshifted == 0:
+            guesses *= 2
+        else:
+            guesses *= sum(
+                _n_choose_k(shifted + unshifted, i)
+                for i in range(1, min(shifted, unshifted) + 1)
+            )
+    return guesses
+
+
+def _spatial_matches(password: str) -> List[GuessMatch]:
+    """
+    Caminhos de teclas vizinhas no QWERTY (qwerty, zxcvb, 1qaz2wsx...), com no
+    máximo ``_MAX_SPATIAL_LENGTH`` teclas por trecho.
+    """
+    matches = []
+    n = len(password)
+    i = 0
+    while i < n - 2:
+        j = i + 1
+        turns = 0
+        last_direction = None
+        shifted = int(password[i] in _SHIFTED_KEYS)
+        while j < n and j - i < _MAX_SPATIAL_LENGTH:
+            direction = _adjacent_direction(password[j - 1], password[j])
+            if direction is None:
+                break
+            if direction != last_direction:
+                turns += 1
+                last_direction = direction
+            shifted += password[j] in _SHIFTED_KEYS
+            j += 1
+        if j - i >= 3:
+            token = password[i:j]
+            matches.append(
+                GuessMatch(i, j, "spatial", token, _spatial_guesses(j - i, turns, shifted))
+            )
+            # cortado no limite: o resto do caminho começa logo depois, sem sobrepor
+            i = j if j - i == _MAX_SPATIAL_LENGTH else j - 1
+        else:
+            i += 1
+    return matches
+
+
+def _two_digit_year(year: int) -> int:
+    if year > 99:
+        return year
+    return year + (1900 if year > 50 else 2000)
+
+
+def _valid_date(day: int, month: int, year: int) -> bool:
+    return 1 <= day <= 31 and 1 <= month <= 12 and 1000 <= year <= 2050
+
+
+def _date_guesses(year: int, separator: bool) -> float:
+    guesses = max(abs(year - _REFERENCE_YEAR), _MIN_YEAR_SPACE) * 365
+    return guesses * 4 if separator else guesses
+
+
+# onde cortar 4–8 dígitos em três partes (dia, mês, ano em alguma ordem)
+_DATE_SPLITS = {
+    4: ((1, 2), (2, 3)),                    # 1/9/91, 19/1/1
+    5: ((1, 3), (2, 3)),                    # 1/11/91, 11/1/91
+    6: ((1, 2), (2, 4), (4, 5)),            # 1/1/1991, 11/11/91, 1991/1/1
+    7: ((1, 3), (2, 3), (4, 5), (4, 6)),    # 1/11/1991, 11/1/1991, 1991/11/1, 1991/1/11
+    8: ((2, 4), (4, 6)),                    # 11/11/1991, 1991/11/11
+}
+
+
+def _build_date_tables() -> Tuple[Dict[str, int], frozenset]:
+    """Anos válidos (texto → ano) e pares (dia, mês) válidos em qualquer ordem."""
+    years = {f"{y:02d}": _two_digit_year(y) for y in range(100)}
+    years.update({str(y): y for y in range(1000, 2051)})
+    parts = [str(v) for v in range(1, 10)] + [f"{v:02d}" for v in range(1, 32)]
+    pairs = frozenset(
+        (x, y) for x in parts for y in parts
+        if _valid_date(int(x), int(y), 2000) or _valid_date(int(y), int(x), 2000)
+    )
+    return years, pairs
+
+
+_DATE_YEARS, _DAY_MONTH_PAIRS = _build_date_tables()
+
+
+def _digits_as_date(token: str) -> Optional[int]:
+    """Ano da data representada por 4–8 dígitos seguidos (ddmmaa, aaaammdd...)."""
+    for k, m in _DATE_SPLITS[len(token)]:
+        # ano no fim ou no início
+        year = _DATE_YEARS.get(token[m:])
+        if year is not None and (token[:k], token[k:m]) in _DAY_MONTH_PAIRS:
+            return year
+        year = _DATE_YEARS.get(token[:k])
+        if year is not None and (token[k:m], token[m:]) in _DAY_MONTH_PAIRS:
+            return year
+    return None
+
+
+def _date_matches(password: str) -> List[GuessMatch]:
+    matches = []
+    n = len(password)
+    for i in range(n):
+        if not password[i].isdigit():
+            continue
+        # sem separador: 4 a 8 dígitos
+        for j in range(i + 4, min(n, i + 8) + 1):
+            token = password[i:j]
+            if not token.isdigit():
+                break
+            year = _digits_as_date(token)
+            if year is not None:
+                matches.append(GuessMatch(i, j, "date", token, _date_guesses(year, False)))
+        # com separador: 6 a 10 caracteres
+        for j in range(i + 6, min(n, i + 10) + 1):
+            token = password[i:j]
+            m = _DATE_WITH_SEPARATOR.fullmatch(token)
+            if m is None:
+                continue
+            first, _, middle, last = m.groups()
+            for day, month, year in (
+                (first, middle, last), (middle, first, last), (last, middle, first),
+            ):
+                y = _two_digit_year(int(year))
+                if len(year) in (2, 4) and _valid_date(int(day), int(month), y):
+                    matches.append(GuessMatch(i, j, "date", token, _date_guesses(y, True)))
+                    break
+        if i == 0 or not password[i - 1].isdigit():
+            j = i
+            while j < n and password[j].isdigit():
+                j += 1
+            for m in _YEAR.finditer(password, i, j):
+                year = int(m.group())
+                guesses = max(abs(year - _REFERENCE_YEAR), _MIN_YEAR_SPACE)
+                matches.append(GuessMatch(m.start(), m.end(), "year", m.group(), guesses))
+    return matches
+
+
+# ---------------------------------------------------------------------------
+# Cobertura mínima (programação dinâmica)
+# ---------------------------------------------------------------------------
+
+def _min_guesses(match: GuessMatch, password_length: int) -> float:
+    """Subpadrões não podem valer menos que um chute de força bruta curto."""
+    if match.end - match.start == password_length:
+        return max(match.guesses, 1)
+    floor = _MIN_GUESSES_SINGLE_CHAR if match.end - match.start == 1 else _MIN_GUESSES_MULTI_CHAR
+    return max(match.guesses, floor)
+
+
+def estimate_guesses(password: str) -> GuessEstimate:
+    """
+    Menor número estimado de tentativas (log10) para chegar a ``password``.
+
+    ``best[k]``  : melhor custo para o prefixo de tamanho k
+    ``brute[k]`` : melhor custo para o prefixo terminando em força bruta —
+                   estender o trecho de força bruta não paga nova penalidade.
+    """
+    n = len(password)
+    if n == 0:
+        return GuessEstimate(0.0, ())
+
+    ending_at: List[List[GuessMatch]] = [[] for _ in range(n + 1)]
+    lowered = password.lower()
+    if len(lowered) == n:   # lower() pode mudar o tamanho (ex.: "İ")
+        for match in _dictionary_matches(password, lowered):
+            ending_at[match.end].append(match)
+    for matcher in (_repeat_matches, _sequence_matches, _spatial_matches, _date_matches):
+        for match in matcher(password):
+            ending_at[match.end].append(match)
+
+    inf = float("inf")
+    best = [0.0] + [inf] * n
+    brute = [inf] * (n + 1)
+    back: List[Optional[GuessMatch]] = [None] * (n + 1)
+    for k in range(1, n + 1):
+        brute[k] = min(brute[k - 1], best[k - 1] + _TOKEN_PENALTY_LOG10) + _BRUTEFORCE_LOG10
+        best[k] = brute[k]
+        for match in ending_at[k]:
+            cost = (
+                best[match.start]
+                + math.log10(_min_guesses(match, n))
+                + _TOKEN_PENALTY_LOG10
+            )
+            if cost < best[k]:
+                best[k] = cost
+                back[k] = match
+
+    # reconstrói a cobertura; ``in_brute`` indica se estamos dentro de um
+    # trecho de força bruta (brute[k]) ou no melhor caminho geral (best[k])
+    sequence = []
+    k = n
+    in_brute = back[n] is None
+    while k > 0:
+        if not in_brute:
+            match = back[k]
+            if match is None:
+                in_brute = True
+                continue
+            sequence.append(match)
+            k = match.start
+            in_brute = back[k] is None
+        else:
+            in_brute = brute[k - 1] <= best[k - 1] + _TOKEN_PENALTY_LOG10
+            k -= 1
+    sequence.reverse()
+    # a penalidade só faz sentido a partir do segundo padrão
+    return GuessEstimate(max(best[n] - _TOKEN_PENALTY_LOG10, 0.0), tuple(sequence))
@@ -0,0 +1,158 @@
+"""
+Cálculo de hashes em passada única sobre um stream de bytes.
+
+O upload é consumido em blocos de ~HASH_CHUNK_SIZE e cada bloco alimenta
+todos os algoritmos pedidos (MD5, SHA-1, SHA-256, SHA-512, BLAKE2b/2s) de
+uma vez — o arquivo nunca é lido duas vezes nem guardado inteiro na memória.
+
+O hashlib solta o GIL em blocos grandes, então cada algoritmo roda em uma
+thread do pool: o tempo por bloco é o do algoritmo mais lento, não a soma.
+Enquanto um bloco é processado o próximo já está sendo recebido, e no máximo
+dois blocos por requisição existem ao mesmo tempo (memória constante,
+independente do tamanho do arquivo).
+
+A comparação com o digest esperado usa ``hmac.compare_digest`` (tempo
+constante) contra todos os digests calculados, sem parar no primeiro.
+"""
+import asyncio
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterable, Callable, Dict, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+ALGORITHMS: Dict[str, Callable[[], "hashlib._Hash"]] = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "sha512": hashlib.sha512,
+    "blake2b": hashlib.blake2b,
+    "blake2s": hashlib.blake2s,
+}
+
+_POOL: Optional[ThreadPoolExecutor] = None
+
+
+class UploadTooLarge(Exception):
+    """O stream passou de HASH_MAX_BYTES."""
+
+
+def get_pool() -> ThreadPoolExecutor:
+    """Pool de threads criado sob demanda no primeiro cálculo."""
+    global _POOL
+    if _POOL is None:
+        workers = settings.HASH_WORKERS or os.cpu_count() or 1
+        _POOL = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hash")
+    return _POOL
+
+
+def shutdown_pool() -> None:
+    """Encerra o pool (chamado no lifespan do FastAPI)."""
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=True, cancel_futures=True)
+        _POOL = None
+
+
+def parse_algorithms(spec: Optional[str]) -> Tuple[str, ...]:
+    """``"sha256,md5"`` → ("sha256", "md5"); vazio = todos. ValueError se desconhecido."""
+    if not spec:
+        return tuple(ALGORITHMS)
+    names = tuple(dict.fromkeys(
+        n.strip().lower().replace("-", "") for n in spec.split(",") if n.strip()
+    ))
+    unknown = [n for n in names if n not in ALGORITHMS]
+    if unknown or not names:
+        raise ValueError(
+            f"Algoritmo(s) não suportado(s): {', '.join(unknown) or spec}. "
+            f"Use: {', '.join(ALGORITHMS)}."
+        )
+    return names
+
+
+def parse_expected(expected: str) -> bytes:
+    """Digest esperado em hexadecimal (espaços e ``:`` ignorados) → bytes."""
+    cleaned = "".join(expected.split()).replace(":", "")
+    try:
+        return bytes.fromhex(cleaned)
+    except ValueError:
+        raise ValueError("O digest esperado deve estar em hexadecimal.") from None
+
+
+def match_expected(digests: Dict[str, bytes], expected: bytes) -> Optional[str]:
+    """Algoritmo cujo digest é igual a ``expected`` (tempo constante), ou None."""
+    matched = None
+    for name, digest in digests.items():
+        # sem curto-circuito: todos os digests são comparados
+        if hmac.compare_digest(digest, expected) and matched is None:
+            matched = name
+    return matched
+
+
+class MultiHasher:
+    """Um objeto de hash por algoritmo, alimentados com os mesmos blocos."""
+
+    def __init__(self, algorithms: Sequence[str]):
+        self._hashers = {name: ALGORITHMS[name]() for name in algorithms}
+        self.size = 0
+
+    def update(self, chunk) -> None:
+        """Alimenta todos os algoritmos na thread atual."""
+        for hasher in self._hashers.values():
+            hasher.update(chunk)
+        self.size += len(chunk)
+
+    def update_in_pool(self, chunk, pool: ThreadPoolExecutor) -> "asyncio.Future":
+        """Um algoritmo por thread; o future termina quando todos consumirem o bloco."""
+        loop = asyncio.get_running_loop()
+        self.size += len(chunk)
+        return asyncio.gather(*(
+            loop.run_in_executor(pool, hasher.update, chunk) for hasher in self._hashers.values()
+        ))
+
+    def digests(self) -> Dict[str, bytes]:
+        return {name: hasher.digest() for name, hasher in self._hashers.items()}
+
+    def hexdigests(self) -> Dict[str, str]:
+        return {name: hasher.hexdigest() for name, hasher in self._hashers.items()}
+
+
+async def hash_stream(
+    stream: AsyncIterable[bytes],
+    algorithms: Sequence[str],
+    chunk_size: int,
+    max_bytes: int = 0,
+) -> MultiHasher:
+    """
+    Consome ``stream`` calculando todos os ``algorithms`` em passada única.
+    Levanta UploadTooLarge se passar de ``max_bytes`` (0 = sem limite).
+    """
+    pool = get_pool()
+    hasher = MultiHasher(algorithms)
+    buffer = bytearray()
+    pending = None   # bloco anterior ainda nas threads
+    received = 0
+    try:
+        async for data in stream:
+            received += len(data)
+            if max_bytes and received > max_bytes:
+                raise UploadTooLarge(received)
+            buffer += data
+            if len(buffer) >= chunk_size:
+                if pending is not None:
+                    await pending   # os hashers precisam receber os blocos em ordem
+                # o bloco cheio vai inteiro para as threads; um novo começa a encher
+                pending = hasher.update_in_pool(buffer, pool)
+                buffer = bytearray()
+        if pending is not None:
+            await pending
+            pending = None
+        if buffer:
+            await hasher.update_in_pool(buffer, pool)
+    finally:
+        if pending is not None:
+            # erro no meio do stream: espera as threads liberarem o bloco antes de propagar
+            await asyncio.gather(pending, return_exceptions=True)
+    return hasher
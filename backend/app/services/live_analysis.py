@@ -0,0 +1,56 @@
+"""
+Estado de uma sessão de digitação do canal WebSocket de análise em tempo real.
+
+A sessão mantém um IncrementalAnalyzer com o estado de cada prefixo da senha
+atual: append custa O(1) por caractere, delete só descarta prefixos e set
+reaproveita o prefixo em comum. Só devolve um novo resultado quando algum
+campo exibido (score, entropia, tentativas, dicas, checks...) mudou em relação
+ao último resultado enviado — o resto do tráfego é suprimido.
+Lógica pura: o router cuida do socket, do debounce e do descarte de frames.
+"""
+from typing import Optional
+
+from app.services.password_validator import IncrementalAnalyzer
+
+
+class LiveAnalysisSession:
+
+    def __init__(self, max_length: int):
+        self.max_length = max_length
+        self.analyzer = IncrementalAnalyzer()
+        self.seq: Optional[int] = None    # seq do último frame aplicado
+        self._last_result: Optional[dict] = None
+
+    def apply(self, op: str, password: str = "", text: str = "", count: int = 1,
+              seq: Optional[int] = None) -> None:
+        """Aplica uma edição; ValueError se o resultado violar os limites."""
+        analyzer = self.analyzer
+        if op == "set":
+            self._check_length(len(password))
+            analyzer.set(password)
+        elif op == "append":
+            self._check_length(len(analyzer) + len(text))
+            analyzer.append(text)
+        elif op == "delete":
+            if count < 0:
+                raise ValueError("count deve ser >= 0.")
+            analyzer.delete(count)
+        else:
+            raise ValueError(f"Operação desconhecida: {op}")
+        self.seq = seq
+
+    def _check_length(self, length: int) -> None:
+        if length > self.max_length:
+            raise ValueError(f"A senha deve ter no máximo {self.max_length} caracteres.")
+
+    @property
+    def password(self) -> str:
+        return self.analyzer.password
+
+    def analyze(self) -> Optional[dict]:
+        """Resultado da senha atual, ou None se é igual ao último enviado."""
+        result = self.analyzer.result()
+        if result == self._last_result:
+            return None
+        self._last_result = result
+        return result
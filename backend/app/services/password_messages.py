@@ -0,0 +1,128 @@
+"""
+Tabela de mensagens do validador de senha, com os fragmentos JSON já codificados.
+
+Quase toda a resposta do /analyze sai de um conjunto pequeno e fixo de
+textos: rótulo e cor por score e uma dica ou feedback positivo por resultado
+de cada check. Em vez de montar essas strings a cada chamada e deixar o
+FastAPI revalidar e serializar o dict inteiro, o validador devolve só os ids
+das mensagens (e os poucos parâmetros variáveis); aqui cada id vira texto ou,
+no caminho rápido, os bytes JSON calculados uma única vez na importação.
+"""
+import json
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+# ---------------------------------------------------------------------------
+# Rótulo e cor por score (0–5)
+# ---------------------------------------------------------------------------
+STRENGTH: Tuple[Tuple[str, str], ...] = (
+    ("Muito Fraca", "#ef4444"),   # vermelho
+    ("Muito Fraca", "#ef4444"),
+    ("Fraca", "#f97316"),         # laranja
+    ("Razoável", "#eab308"),      # amarelo
+    ("Forte", "#22c55e"),         # verde
+    ("Muito Forte", "#06b6d4"),   # ciano
+)
+
+# ---------------------------------------------------------------------------
+# Dicas e feedbacks positivos, por resultado de check
+# ---------------------------------------------------------------------------
+# Mensagens com {0}, {1}... recebem parâmetros (comprimento, padrão encontrado,
+# entropia, limiares da política...); as demais são fixas e têm os bytes JSON
+# pré-calculados. As parametrizadas se repetem muito (mesmos limiares, mesmo
+# padrão de teclado), então os bytes delas ficam num cache LRU.
+MESSAGES: Dict[str, str] = {
+    "length_short": "Use pelo menos {0} caracteres. Senhas longas são muito mais difíceis de quebrar.",
+    "length_ok": "Considere usar {0} ou mais caracteres para máxima segurança.",
+    "length_great": "Comprimento excelente ({0} caracteres)!",
+    "upper_missing": "Adicione letras maiúsculas (A-Z) para aumentar a complexidade.",
+    "upper_ok": "Contém letras maiúsculas.",
+    "lower_missing": "Adicione letras minúsculas (a-z).",
+    "lower_ok": "Contém letras minúsculas.",
+    "digit_missing": "Inclua pelo menos um número (0-9).",
+    "digit_ok": "Contém números.",
+    "special_missing": "Adicione caracteres especiais como !@#$%^&*() para dificultar ataques de força bruta.",
+    "special_ok": "Contém caracteres especiais.",
+    "common": "Essa senha está na lista das mais usadas e será a primeira tentativa em qualquer ataque de dicionário. Escolha outra senha completamente diferente.",
+    "not_common": "Não está na lista das senhas mais comuns.",
+    "breached": "Essa senha já apareceu {0} vez(es) em vazamentos de dados conhecidos. Atacantes usam essas listas em ataques de credential stuffing — não a utilize.",
+    "not_breached": "Não aparece em vazamentos de dados conhecidos.",
+    "repeated": "Evite caracteres repetidos em sequência (ex: 'aaa', '111'), pois reduzem drasticamente a entropia.",
+    "no_repeated": "Sem repetições excessivas de caracteres.",
+    "sequential": "Evite sequências óbvias como 'abc', '123', 'xyz' (sua senha contém '{0}'). Atacantes testam essas combinações primeiro.",
+    "no_sequential": "Sem sequências alfanuméricas óbvias.",
+    "keyboard": "Evite padrões de teclado como 'qwerty', 'asdf' (sua senha contém '{0}'). São muito fáceis de adivinhar.",
+    "no_keyboard": "Sem padrões de teclado detectados.",
+    "entropy_low": "A entropia estimada é {0} bits. O ideal é ≥ {1} bits para resistir a ataques modernos.",
+    "predictable": "Apesar da entropia de {0} bits, a senha segue padrões previsíveis (palavras, datas, sequências) e cairia em cerca de 10^{1:.0f} tentativas. Prefira várias palavras aleatórias.",
+    "entropy_high": "Entropia alta: {0} bits.",
+}
+
+# Uma mensagem na resposta: id + parâmetros do template (vazio se fixa)
+Message = Tuple[str, tuple]
+
+
+def _encode(value) -> bytes:
+    """Mesma codificação do json.dumps compacto usado nas respostas."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+_ENCODED: Dict[str, bytes] = {
+    msg_id: _encode(text) for msg_id, text in MESSAGES.items() if "{" not in text
+}
+
+
+def render(message: Message) -> str:
+    msg_id, params = message
+    text = MESSAGES[msg_id]
+    return text.format(*params) if params else text
+
+
+@lru_cache(maxsize=4096)
+def _encode_rendered(message: Message) -> bytes:
+    return _encode(render(message))
+
+
+def encode(message: Message) -> bytes:
+    """Bytes JSON da mensagem — pré-calculados se ela for fixa, senão do LRU."""
+    if message[1]:
+        return _encode_rendered(message)
+    return _ENCODED[message[0]]
+
+
+def encode_list(messages: Sequence[Message]) -> bytes:
+    return b"[" + b",".join(encode(m) for m in messages) + b"]"
+
+
+# ---------------------------------------------------------------------------
+# Fragmentos estruturais da resposta
+# ---------------------------------------------------------------------------
+CHECK_NAMES: Tuple[str, ...] = (
+    "length_ok",
+    "length_great",
+    "has_uppercase",
+    "has_lowercase",
+    "has_digit",
+    "has_special",
+    "not_common",
+    "no_repeated_chars",
+    "no_sequential_chars",
+    "no_keyboard_pattern",
+    "not_breached",
+)
+
+# b'{"score":N,"strength_label":"...","strength_color":"...","entropy_bits":'
+SCORE_HEAD: Tuple[bytes, ...] = tuple(
+    _encode({"score": score, "strength_label": label, "strength_color": color})[:-1]
+    + b',"entropy_bits":'
+    for score, (label, color) in enumerate(STRENGTH)
+)
+
+
+@lru_cache(maxsize=1 << (len(CHECK_NAMES) + 1))
+def encode_checks(checks: Tuple[Optional[bool], ...]) -> bytes:
+    """
+    Objeto ``checks`` codificado — 2^11 combinações de bool, mais as poucas com
+    ``None`` (check pulado por uma política com short_circuit).
+    """
+    return _encode(dict(zip(CHECK_NAMES, checks)))
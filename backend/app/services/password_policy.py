@@ -0,0 +1,275 @@
+"""
+Políticas de senha declaradas em arquivo e compiladas para o validador.
+
+Cada política define limiares (comprimento, entropia, tentativas), os pontos
+de cada check no score, checks obrigatórios e a ordem das etapas custosas.
+O arquivo (``app/data/password_policies.json`` ou PASSWORD_POLICIES_PATH) é
+lido uma vez; cada política vira um ``Policy`` imutável, já validado e com
+tudo pré-resolvido (índices dos checks, pesos, ordem das etapas), guardado
+por id. A política ``default`` reproduz exatamente o comportamento original.
+
+Formato::
+
+    {
+      "default_policy": "default",
+      "policies": {
+        "default": {...},
+        "empresa": {"extends": "default", "length": {"min": 14}, "required": ["not_common"]}
+      }
+    }
+
+Chaves de uma política (todas opcionais; o que faltar vem de ``extends`` ou
+dos valores originais do validador):
+  - ``length``         : ``min`` (check length_ok), ``great`` (length_great) e
+                         ``points`` — pares [comprimento mínimo, pontos]
+  - ``weights``        : pontos de cada check aprovado (nomes de CHECK_NAMES)
+  - ``entropy``        : ``min`` em bits e ``weight`` (pontos se atingido)
+  - ``guesses``        : ``min_log10`` (abaixo disso a dica é "previsível") e ``weight``
+  - ``points_per_star``: pontos brutos por unidade do score 0–5
+  - ``required``       : checks obrigatórios (CHECK_NAMES, ``min_entropy``,
+                         ``min_guesses``); se algum falha, o score fica em
+                         no máximo ``reject_score``
+  - ``short_circuit``  : com um obrigatório reprovado o resultado já está
+                         decidido — as etapas custosas restantes não rodam e
+                         os campos delas saem como ``null``
+  - ``order``          : ordem das etapas custosas (``patterns``,
+                         ``blocklist``, ``breach``, ``guesses``); as omitidas
+                         seguem por custo
+
+Checks baratos (comprimento, classes de caracteres, repetições, entropia)
+saem da varredura única da senha e rodam sempre, antes das etapas custosas.
+"""
+import json
+import os
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+from app.services.password_messages import CHECK_NAMES
+
+_DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+_POLICIES_FILE = settings.PASSWORD_POLICIES_PATH or os.path.join(_DATA_DIR, "password_policies.json")
+
+DEFAULT_POLICY_ID = "default"
+
+# Etapas custosas, da mais barata para a mais cara (ordem padrão de execução)
+COSTLY_STAGES = ("patterns", "blocklist", "breach", "guesses")
+_REQUIRABLE = CHECK_NAMES + ("min_entropy", "min_guesses")
+
+# Valores originais do validador (NIST SP 800-63B / OWASP)
+_BASE_SPEC: dict = {
+    "description": "",
+    "length": {"min": 12, "great": 16, "points": [[8, 1], [12, 1], [16, 1]]},
+    "weights": {
+        "has_uppercase": 1, "has_lowercase": 1, "has_digit": 1, "has_special": 1,
+        "not_common": 1, "no_repeated_chars": 0.5, "no_sequential_chars": 0.5,
+        "no_keyboard_pattern": 0.5,
+    },
+    "entropy": {"min": 50, "weight": 0.5},
+    "guesses": {"min_log10": 10, "weight": 0},
+    "points_per_star": 2,
+    "required": [],
+    "reject_score": 1,
+    "short_circuit": False,
+    "order": [],
+}
+_NESTED = ("length", "entropy", "guesses")
+_MERGED = _NESTED + ("weights",)   # dicts combinados chave a chave no extends
+
+
+class PolicyError(ValueError):
+    """Arquivo de políticas inválido ou política desconhecida."""
+
+
+class Policy(NamedTuple):
+    """Política compilada: limiares, pesos e plano de execução já resolvidos."""
+    id: str
+    description: str
+    min_length: int
+    great_length: int
+    length_points: Tuple[Tuple[int, float], ...]
+    weights: Tuple[Tuple[int, float], ...]    # (índice em CHECK_NAMES, pontos), só pesos ≠ 0
+    min_entropy: float
+    entropy_weight: float
+    min_guesses_log10: float
+    guesses_weight: float
+    points_per_star: float
+    stages: Tuple[str, ...]                   # etapas custosas, na ordem de execução
+    required: Tuple[int, ...]                 # índices em CHECK_NAMES obrigatórios
+    require_entropy: bool
+    require_guesses: bool
+    reject_score: int
+    short_circuit: bool
+
+    @property
+    def has_requirements(self) -> bool:
+        return bool(self.required) or self.require_entropy or self.require_guesses
+
+
+# ---------------------------------------------------------------------------
+# Compilação
+# ---------------------------------------------------------------------------
+
+def _merge(base: dict, override: dict) -> dict:
+    merged = {**base, **override}
+    for key in _MERGED:
+        if key in override:
+            merged[key] = {**base.get(key, {}), **override[key]}
+    return merged
+
+
+def _resolve(policy_id: str, specs: Dict[str, dict], seen: Tuple[str, ...] = ()) -> dict:
+    """Especificação completa da política, com a cadeia de ``extends`` aplicada."""
+    if policy_id in seen:
+        raise PolicyError(f"Herança circular entre políticas: {' → '.join(seen + (policy_id,))}")
+    spec = specs.get(policy_id)
+    if not isinstance(spec, dict):
+        raise PolicyError(f"Política '{policy_id}' não encontrada.")
+    parent = spec.get("extends")
+    base = _resolve(parent, specs, seen + (policy_id,)) if parent else _BASE_SPEC
+    return _merge(base, {k: v for k, v in spec.items() if k != "extends"})
+
+
+def _number(value, name: str, policy_id: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise PolicyError(f"Política '{policy_id}': '{name}' deve ser numérico.")
+    return value
+
+
+def compile_policy(policy_id: str, spec: dict) -> Policy:
+    """Valida a especificação (já com ``extends`` resolvido) e monta o ``Policy``."""
+    unknown = set(spec) - set(_BASE_SPEC)
+    if unknown:
+        raise PolicyError(f"Política '{policy_id}': chaves desconhecidas {sorted(unknown)}.")
+    for key in _NESTED:
+        extra = set(spec[key]) - set(_BASE_SPEC[key])
+        if extra:
+            raise PolicyError(f"Política '{policy_id}': chaves desconhecidas em '{key}': {sorted(extra)}.")
+
+    length, entropy, guesses = spec["length"], spec["entropy"], spec["guesses"]
+    min_length = _number(length["min"], "length.min", policy_id)
+    great_length = _number(length["great"], "length.great", policy_id)
+    if great_length < min_length:
+        raise PolicyError(f"Política '{policy_id}': length.great menor que length.min.")
+    pairs = length["points"]
+    if not isinstance(pairs, list) or any(not isinstance(p, list) or len(p) != 2 for p in pairs):
+        raise PolicyError(f"Política '{policy_id}': length.points deve ser uma lista de pares.")
+    length_points = tuple(
+        (_number(threshold, "length.points", policy_id), _number(points, "length.points", policy_id))
+        for threshold, points in pairs
+    )
+
+    weights = []
+    for name, points in spec["weights"].items():
+        if name not in CHECK_NAMES:
+            raise PolicyError(f"Política '{policy_id}': check desconhecido em weights: '{name}'.")
+        if _number(points, f"weights.{name}", policy_id):
+            weights.append((CHECK_NAMES.index(name), points))
+
+    required = spec["required"]
+    for name in required:
+        if name not in _REQUIRABLE:
+            raise PolicyError(f"Política '{policy_id}': check obrigatório desconhecido: '{name}'.")
+
+    order = spec["order"]
+    for name in order:
+        if name not in COSTLY_STAGES:
+            raise PolicyError(
+                f"Política '{policy_id}': etapa desconhecida em order: '{name}' "
+                f"(use {', '.join(COSTLY_STAGES)})."
+            )
+    stages = tuple(dict.fromkeys(list(order) + list(COSTLY_STAGES)))
+
+    points_per_star = _number(spec["points_per_star"], "points_per_star", policy_id)
+    if points_per_star <= 0:
+        raise PolicyError(f"Política '{policy_id}': points_per_star deve ser positivo.")
+    reject_score = spec["reject_score"]
+    if isinstance(reject_score, bool) or not isinstance(reject_score, int) or not 0 <= reject_score <= 5:
+        raise PolicyError(f"Política '{policy_id}': reject_score deve ser um inteiro de 0 a 5.")
+
+    return Policy(
+        id=policy_id,
+        description=str(spec["description"]),
+        min_length=min_length,
+        great_length=great_length,
+        length_points=length_points,
+        weights=tuple(weights),
+        min_entropy=_number(entropy["min"], "entropy.min", policy_id),
+        entropy_weight=_number(entropy["weight"], "entropy.weight", policy_id),
+        min_guesses_log10=_number(guesses["min_log10"], "guesses.min_log10", policy_id),
+        guesses_weight=_number(guesses["weight"], "guesses.weight", policy_id),
+        points_per_star=points_per_star,
+        stages=stages,
+        required=tuple(CHECK_NAMES.index(name) for name in required if name in CHECK_NAMES),
+        require_entropy="min_entropy" in required,
+        require_guesses="min_guesses" in required,
+        reject_score=reject_score,
+        short_circuit=bool(spec["short_circuit"]),
+    )
+
+
+def load_policies(path: str = _POLICIES_FILE) -> Tuple[Dict[str, Policy], str]:
+    """
+    Compila todas as políticas do arquivo; retorna (políticas por id, id da
+    padrão). Sem arquivo, só a política ``default`` original.
+    """
+    if not os.path.exists(path):
+        return {DEFAULT_POLICY_ID: compile_policy(DEFAULT_POLICY_ID, _BASE_SPEC)}, DEFAULT_POLICY_ID
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except ValueError as exc:
+        raise PolicyError(f"Arquivo de políticas inválido ({path}): {exc}")
+    specs = data.get("policies") if isinstance(data, dict) else None
+    if not isinstance(specs, dict) or not specs:
+        raise PolicyError(f"Arquivo de políticas sem 'policies': {path}")
+
+    policies = {policy_id: compile_policy(policy_id, _resolve(policy_id, specs)) for policy_id in specs}
+    default_id = data.get("default_policy", DEFAULT_POLICY_ID)
+    if default_id not in policies:
+        raise PolicyError(f"default_policy '{default_id}' não está em 'policies'.")
+    return policies, default_id
+
+
+# ---------------------------------------------------------------------------
+# Políticas em uso
+# ---------------------------------------------------------------------------
+
+_POLICIES: Optional[Dict[str, Policy]] = None
+_DEFAULT_ID = DEFAULT_POLICY_ID
+_LOCK = threading.Lock()
+
+
+def _loaded() -> Dict[str, Policy]:
+    global _POLICIES, _DEFAULT_ID
+    if _POLICIES is None:
+        with _LOCK:
+            if _POLICIES is None:
+                policies, _DEFAULT_ID = load_policies()
+                _POLICIES = policies
+    return _POLICIES
+
+
+def get_policy(policy_id: Optional[str] = None) -> Policy:
+    """Política compilada pelo id (None/vazio = a padrão); PolicyError se não existir."""
+    policies = _loaded()
+    policy = policies.get(policy_id or _DEFAULT_ID)
+    if policy is None:
+        raise PolicyError(f"Política de senha desconhecida: '{policy_id}'.")
+    return policy
+
+
+def default_policy() -> Policy:
+    return get_policy(None)
+
+
+def policy_ids() -> List[str]:
+    return sorted(_loaded())
+
+
+def reload_policies() -> None:
+    """Relê o arquivo; um arquivo inválido mantém as políticas atuais (PolicyError)."""
+    global _POLICIES, _DEFAULT_ID
+    policies, default_id = load_policies()
+    with _LOCK:
+        _POLICIES, _DEFAULT_ID = policies, default_id
@@ -1,24 +1,187 @@
-import re
+import itertools
 import math
 import os
-from typing import Set
+import threading
+import time
+from typing import Callable, Container, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.blocklist import MmapBlocklist, load_common_passwords
+from app.services.breach_index import load_breach_index
+from app.services.guess_estimator import (
+    build_dictionary_trie,
+    dictionary_loaded,
+    estimate_guesses,
+    set_dictionary_source,
+)
+from app.services.password_messages import (
+    CHECK_NAMES,
+    SCORE_HEAD,
+    STRENGTH,
+    Message,
+    encode_checks,
+    encode_list,
+    render,
+)
+from app.services.password_policy import Policy, default_policy
+from app.services.pattern_matcher import AhoCorasick, PatternMatch
+from app.services.validator_snapshot import open_snapshot
 
 # ---------------------------------------------------------------------------
-# Load common passwords list at module level (O(1) lookup)
+# Validator data (common-password list, breach index, guess dictionary)
 # ---------------------------------------------------------------------------
-_COMMON_PASSWORDS: Set[str] = set()
-
+# Nothing size-dependent is loaded at import time. On first use (or from the
+# startup warm-up) the prebuilt snapshot is opened: its blocklist section is
+# queried in place through mmap and the guess dictionary is unmarshalled on
+# its own first use. Without a snapshot, the standalone compiled blocklist or
+# an in-memory set built from the text file is used instead.
 _DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 _COMMON_PASSWORDS_FILE = os.path.join(_DATA_DIR, "common_passwords.txt")
+_COMMON_PASSWORDS_BIN = settings.BLOCKLIST_PATH or os.path.join(_DATA_DIR, "common_passwords.bin")
+_SNAPSHOT_FILE = settings.VALIDATOR_SNAPSHOT_PATH or os.path.join(_DATA_DIR, "validator_snapshot.bin")
+
+_COMMON_PASSWORDS: Container[str] = frozenset()
+# Offline breach corpus (HIBP-style hash-prefix index); None = check disabled.
+_BREACH_INDEX = None
+_DATA_INFO: Dict[str, object] = {"loaded": False}
+_DATA_LOADED = False
+_DATA_LOCK = threading.Lock()
+
+_RELOAD_LISTENERS: List[Callable[[], None]] = []
+
+
+def on_blocklists_reload(callback: Callable[[], None]) -> None:
+    """Register a callback run after every reload_blocklists() (cache invalidation)."""
+    _RELOAD_LISTENERS.append(callback)
+
+
+def _load_data() -> None:
+    """Open the snapshot (or the fallbacks) and swap the module globals."""
+    global _COMMON_PASSWORDS, _BREACH_INDEX, _DATA_INFO, _DATA_LOADED
+    started = time.perf_counter()
+    snapshot = open_snapshot(_SNAPSHOT_FILE)
+    if snapshot is not None:
+        common = snapshot.blocklist(use_bloom=settings.BLOCKLIST_BLOOM)
+        set_dictionary_source(snapshot.guess_trie)
+        info = {
+            "source": "snapshot",
+            "version": snapshot.version,
+            "built_at": snapshot.created_at.isoformat(),
+        }
+    else:
+        common = load_common_passwords(
+            _COMMON_PASSWORDS_FILE, _COMMON_PASSWORDS_BIN, use_bloom=settings.BLOCKLIST_BLOOM
+        )
+        set_dictionary_source(build_dictionary_trie)
+        info = {
+            "source": "blocklist" if isinstance(common, MmapBlocklist) else "text",
+            "version": None,
+            "built_at": None,
+        }
+    _COMMON_PASSWORDS = common
+    _BREACH_INDEX = load_breach_index(settings.BREACH_INDEX_PATH)
+    _DATA_INFO = {
+        "loaded": True,
+        **info,
+        "common_passwords": len(common),
+        "breach_index": _BREACH_INDEX is not None,
+        "load_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+    _DATA_LOADED = True
+
+
+def ensure_data_loaded() -> None:
+    """Load the validator data once (first request or startup warm-up)."""
+    if not _DATA_LOADED:
+        with _DATA_LOCK:
+            if not _DATA_LOADED:
+                _load_data()
+
+
+def warm_up() -> None:
+    """Startup preload: validator data plus the guess dictionary trie."""
+    ensure_data_loaded()
+    estimate_guesses("warm-up")
+
+
+def data_status() -> dict:
+    """Readiness info: loaded?, source (snapshot/blocklist/text), version, sizes."""
+    return {**_DATA_INFO, "guess_dictionary_loaded": dictionary_loaded()}
+
+
+def reload_blocklists() -> None:
+    """
+    Re-open the snapshot / common-password list and the breach index from disk.
+    The new objects are swapped in atomically; in-flight lookups keep using
+    the old mmaps, which are closed once no longer referenced.
+    """
+    with _DATA_LOCK:
+        _load_data()
+    for callback in _RELOAD_LISTENERS:
+        callback()
+
+
+# ---------------------------------------------------------------------------
+# Instrumentation (exported as Prometheus metrics by app/core/metrics.py)
+# ---------------------------------------------------------------------------
+# Lookup/hit counters are plain ints bumped on every evaluation (a few ns);
+# they are only read at scrape time. Per-check timing is sampled: one in
+# every N evaluations runs with a lap timer and reports to the observer,
+# the others pass a no-op timer.
+_LOOKUP_COUNTS = [0, 0, 0, 0]   # blocklist lookups, hits, breach lookups, hits
+
+_CheckObserver = Callable[[Dict[str, float]], None]
+_CHECK_OBSERVER: Optional[_CheckObserver] = None
+_CHECK_SAMPLE_EVERY = 0
+_CHECK_CALLS = itertools.count()
+
+
+class _NoTimer:
+    __slots__ = ()
+
+    def lap(self, check: str) -> None:
+        pass
+
+
+class _CheckTimer:
+    """Seconds spent per check, measured between consecutive ``lap`` calls."""
+    __slots__ = ("laps", "_last")
+
+    def __init__(self):
+        self.laps: Dict[str, float] = {}
+        self._last = time.perf_counter()
+
+    def lap(self, check: str) -> None:
+        now = time.perf_counter()
+        self.laps[check] = self.laps.get(check, 0.0) + now - self._last
+        self._last = now
+
+
+_NO_TIMER = _NoTimer()
+
+
+def set_check_observer(observer: Optional[_CheckObserver], sample_every: int = 64) -> None:
+    """
+    Report per-check durations ({check: seconds}) of one in every
+    ``sample_every`` evaluations to ``observer``; None or 0 disables it.
+    """
+    global _CHECK_OBSERVER, _CHECK_SAMPLE_EVERY
+    _CHECK_SAMPLE_EVERY = max(0, sample_every)
+    _CHECK_OBSERVER = observer if _CHECK_SAMPLE_EVERY else None
+
+
+def lookup_counts() -> Dict[str, int]:
+    """Blocklist / breach-index lookups and hits since startup."""
+    blocklist, blocklist_hits, breach, breach_hits = _LOOKUP_COUNTS
+    return {
+        "blocklist_lookups": blocklist,
+        "blocklist_hits": blocklist_hits,
+        "breach_lookups": breach,
+        "breach_hits": breach_hits,
+    }
 
-try:
-    with open(_COMMON_PASSWORDS_FILE, "r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            word = line.strip().lower()
-            if word:
-                _COMMON_PASSWORDS.add(word)
-except FileNotFoundError:
-    pass  # file is optional; will still flag as not-common if missing
 
 # ---------------------------------------------------------------------------
 # Known sequential patterns (keyboard rows, numeric sequences, alpha runs)
@@ -38,191 +201,904 @@ _KEYBOARD_PATTERNS = [
     "!@#$%^&*()", "password", "passw0rd", "p@ssword",
 ]
 
+# Kinds reported by the pattern automaton.
+_SEQUENTIAL = "sequential"
+_KEYBOARD = "keyboard"
+
 
-def _charset_size(password: str) -> int:
+def _pattern_entries():
+    """Every 3-char window of the sequential runs (both directions) + keyboard patterns."""
+    for pattern in _SEQUENTIAL_PATTERNS:
+        for i in range(len(pattern) - 2):
+            chunk = pattern[i : i + 3]
+            yield chunk, _SEQUENTIAL
+            yield chunk[::-1], _SEQUENTIAL
+    for kp in _KEYBOARD_PATTERNS:
+        yield kp, _KEYBOARD
+
+
+# Compiled once at import time: one linear pass answers both checks.
+_PATTERN_MATCHER = AhoCorasick(_pattern_entries())
+
+
+# ---------------------------------------------------------------------------
+# Single-pass character-class scanner
+# ---------------------------------------------------------------------------
+# Class indexes used by _CHAR_CLASS / _CharScan counters.
+_UPPER, _LOWER, _DIGIT = 0, 1, 2
+
+_CHAR_CLASS = {}
+for _ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+    _CHAR_CLASS[_ch] = _UPPER
+for _ch in "abcdefghijklmnopqrstuvwxyz":
+    _CHAR_CLASS[_ch] = _LOWER
+for _ch in "0123456789":
+    _CHAR_CLASS[_ch] = _DIGIT
+del _ch
+
+
+class _CharScan(NamedTuple):
+    """Character-class counters and run lengths gathered in one traversal."""
+    length: int
+    upper: int
+    lower: int
+    digit: int
+    special: int
+    max_run: int
+
+    @property
+    def has_upper(self) -> bool:
+        return self.upper > 0
+
+    @property
+    def has_lower(self) -> bool:
+        return self.lower > 0
+
+    @property
+    def has_digit(self) -> bool:
+        return self.digit > 0
+
+    @property
+    def has_special(self) -> bool:
+        return self.special > 0
+
+
+def _scan(password: str) -> _CharScan:
+    """
+    Walk the password once and collect every character-class flag/count.
+
+    Semantics match the regexes this replaces: upper/lower are ASCII only,
+    digits follow ``\\d`` (any Unicode decimal, so a non-ASCII digit is also
+    special) and runs follow ``(.)\\1{2,}`` (newlines never form a run).
+    """
+    counts = [0, 0, 0]
+    special = 0
+    max_run = 0
+    run = 0
+    prev = None
+    get_class = _CHAR_CLASS.get
+
+    for ch in password:
+        cls = get_class(ch)
+        if cls is None:
+            special += 1
+            if ch.isdecimal():
+                counts[_DIGIT] += 1
+        else:
+            counts[cls] += 1
+
+        if ch == prev:
+            run += 1
+        else:
+            prev = ch
+            run = 1
+        if run > max_run and ch != "\n":
+            max_run = run
+
+    return _CharScan(
+        len(password), counts[_UPPER], counts[_LOWER], counts[_DIGIT], special, max_run
+    )
+
+
+def _charset_size(password: str, scan: Optional[_CharScan] = None) -> int:
     """Estimate charset size based on character classes used."""
+    if scan is None:
+        scan = _scan(password)
     size = 0
-    if re.search(r"[a-z]", password):
+    if scan.has_lower:
         size += 26
-    if re.search(r"[A-Z]", password):
+    if scan.has_upper:
         size += 26
-    if re.search(r"\d", password):
+    if scan.has_digit:
         size += 10
-    if re.search(r"[^a-zA-Z0-9]", password):
+    if scan.has_special:
         size += 32  # approx. printable special chars
     return max(size, 1)
 
 
-def _calc_entropy(password: str) -> float:
+def _calc_entropy(password: str, scan: Optional[_CharScan] = None) -> float:
     """Shannon-style entropy: log2(charset^length)."""
-    charset = _charset_size(password)
+    charset = _charset_size(password, scan)
     return round(math.log2(charset) * len(password), 2)
 
 
-def _has_repeated_chars(password: str) -> bool:
+def _has_repeated_chars(password: str, scan: Optional[_CharScan] = None) -> bool:
     """Returns True if there are 3+ consecutive repeated characters."""
-    return bool(re.search(r"(.)\1{2,}", password))
+    if scan is None:
+        scan = _scan(password)
+    return scan.max_run >= 3
+
+
+def _breach_count(password: str) -> int:
+    """Occurrences of the password in the offline breach corpus (0 if none/disabled)."""
+    ensure_data_loaded()
+    if _BREACH_INDEX is None:
+        return 0
+    return _BREACH_INDEX.count(password)
+
+
+def _find_patterns(password: str) -> Dict[str, PatternMatch]:
+    """First sequential/keyboard match (pattern + position in the lowercased password)."""
+    return _PATTERN_MATCHER.first_by_kind(password.lower())
 
 
-def _has_sequential_chars(password: str) -> bool:
+def _has_sequential_chars(
+    password: str, found: Optional[Dict[str, PatternMatch]] = None
+) -> bool:
     """Returns True if the password contains a sequential run of 3+ chars."""
-    lower = password.lower()
-    for pattern in _SEQUENTIAL_PATTERNS:
-        for i in range(len(pattern) - 2):
-            chunk = pattern[i : i + 3]
-            if chunk in lower or chunk[::-1] in lower:
-                return True
-    return False
+    if found is None:
+        found = _find_patterns(password)
+    return _SEQUENTIAL in found
 
 
-def _has_keyboard_pattern(password: str) -> bool:
+def _has_keyboard_pattern(
+    password: str, found: Optional[Dict[str, PatternMatch]] = None
+) -> bool:
     """Returns True if the password contains known keyboard patterns."""
-    lower = password.lower()
-    for kp in _KEYBOARD_PATTERNS:
-        if kp in lower:
-            return True
-    return False
+    if found is None:
+        found = _find_patterns(password)
+    return _KEYBOARD in found
 
 
-def validate_password(password: str) -> dict:
+class PasswordEvaluation(NamedTuple):
     """
-    Validate a password against NIST SP 800-63B and OWASP recommendations.
-    Returns a dict matching PasswordResponse.
+    Outcome of every check, before any text is produced.
+
+    Tips and positive feedbacks are message ids (+ template params) from
+    ``password_messages.MESSAGES``; ``to_dict()`` renders the PasswordResponse
+    dict and ``to_json()`` concatenates the pre-encoded JSON fragments.
+    Fields of checks skipped by a short-circuiting policy are None (null).
     """
-    # ---- individual checks ------------------------------------------------
-    length = len(password)
-    length_ok = length >= 12
-    length_great = length >= 16
-    has_upper = bool(re.search(r"[A-Z]", password))
-    has_lower = bool(re.search(r"[a-z]", password))
-    has_digit = bool(re.search(r"\d", password))
-    has_special = bool(re.search(r"[^a-zA-Z0-9]", password))
-    is_common = password.lower() in _COMMON_PASSWORDS
-    not_common = not is_common
-    no_repeated = not _has_repeated_chars(password)
-    no_sequential = not _has_sequential_chars(password)
-    no_keyboard = not _has_keyboard_pattern(password)
+    score: int
+    entropy_bits: float
+    guesses_log10: Optional[float]
+    is_common: Optional[bool]
+    breach_count: Optional[int]
+    checks: Tuple[Optional[bool], ...]   # in password_messages.CHECK_NAMES order
+    tips: Tuple[Message, ...]
+    positives: Tuple[Message, ...]
 
-    entropy = _calc_entropy(password)
+    def to_dict(self) -> dict:
+        label, color = STRENGTH[self.score]
+        return {
+            "score": self.score,
+            "strength_label": label,
+            "strength_color": color,
+            "entropy_bits": self.entropy_bits,
+            "guesses_log10": self.guesses_log10,
+            "is_common": self.is_common,
+            "breach_count": self.breach_count,
+            "checks": dict(zip(CHECK_NAMES, self.checks)),
+            "tips": [render(m) for m in self.tips],
+            "positive_feedbacks": [render(m) for m in self.positives],
+        }
 
-    # ---- score (0–10, displayed as 0–5 stars / bar) -----------------------
-    raw_score = 0
+    def to_json(self) -> bytes:
+        """Same bytes as compact ``json.dumps(self.to_dict(), ensure_ascii=False)``."""
+        return b"".join((
+            SCORE_HEAD[self.score],
+            repr(self.entropy_bits).encode(),
+            b',"guesses_log10":',
+            b"null" if self.guesses_log10 is None else repr(self.guesses_log10).encode(),
+            _IS_COMMON_JSON[self.is_common],
+            b',"breach_count":',
+            b"null" if self.breach_count is None else str(self.breach_count).encode(),
+            b',"checks":',
+            encode_checks(self.checks),
+            b',"tips":',
+            encode_list(self.tips),
+            b',"positive_feedbacks":',
+            encode_list(self.positives),
+            b"}",
+        ))
 
-    if length >= 8:
-        raw_score += 1
-    if length >= 12:
-        raw_score += 1
-    if length >= 16:
-        raw_score += 1
-    if has_upper:
-        raw_score += 1
-    if has_lower:
-        raw_score += 1
-    if has_digit:
-        raw_score += 1
-    if has_special:
-        raw_score += 1
-    if not_common:
-        raw_score += 1
-    if no_repeated:
-        raw_score += 0.5
-    if no_sequential:
-        raw_score += 0.5
-    if no_keyboard:
-        raw_score += 0.5
-    if entropy >= 50:
-        raw_score += 0.5
-
-    # Normalise to 0–5
-    score = min(5, round(raw_score / 2))
-
-    # ---- labels & colors ---------------------------------------------------
-    if score <= 1:
-        label, color = "Muito Fraca", "#ef4444"   # red
-    elif score == 2:
-        label, color = "Fraca", "#f97316"          # orange
-    elif score == 3:
-        label, color = "Razoável", "#eab308"        # yellow
-    elif score == 4:
-        label, color = "Forte", "#22c55e"           # green
-    else:
-        label, color = "Muito Forte", "#06b6d4"     # cyan
 
-    # ---- tips (what to improve) -------------------------------------------
-    tips = []
-    positive = []
+_IS_COMMON_JSON = {
+    True: b',"is_common":true',
+    False: b',"is_common":false',
+    None: b',"is_common":null',
+}
+
+
+def evaluate_password(password: str, policy: Optional[Policy] = None) -> PasswordEvaluation:
+    """Run the checks of ``policy`` (None = default) on ``password`` (see PasswordEvaluation)."""
+    if _CHECK_OBSERVER is not None and next(_CHECK_CALLS) % _CHECK_SAMPLE_EVERY == 0:
+        return _evaluate_timed(password, policy)
+    return _evaluate(password, _scan(password), None, policy=policy)
+
+
+def _evaluate_timed(password: str, policy: Optional[Policy] = None) -> PasswordEvaluation:
+    """evaluate_password with a lap timer; durations go to the check observer."""
+    timer = _CheckTimer()
+    scan = _scan(password)
+    timer.lap("scan")
+    result = _evaluate(password, scan, None, timer, policy)
+    observer = _CHECK_OBSERVER
+    if observer is not None:
+        observer(timer.laps)
+    return result
+
+
+def validate_password(password: str, policy: Optional[Policy] = None) -> dict:
+    """
+    Validate a password against NIST SP 800-63B and OWASP recommendations
+    (or the thresholds of ``policy``). Returns a dict matching PasswordResponse.
+    """
+    return evaluate_password(password, policy).to_dict()
 
-    if not length_ok:
-        tips.append("Use pelo menos 12 caracteres. Senhas longas são muito mais difíceis de quebrar.")
-    elif not length_great:
-        tips.append("Considere usar 16 ou mais caracteres para máxima segurança.")
+
+def validate_password_json(password: str, policy: Optional[Policy] = None) -> bytes:
+    """validate_password() already serialized as a PasswordResponse JSON body."""
+    return evaluate_password(password, policy).to_json()
+
+
+def _build_result(
+    password: str, scan: _CharScan, patterns: Dict[str, PatternMatch]
+) -> dict:
+    """Score, labels and tips from the scanner/automaton output for ``password``."""
+    return _evaluate(password, scan, patterns).to_dict()
+
+
+# Positions in password_messages.CHECK_NAMES
+(_LENGTH_OK, _LENGTH_GREAT, _HAS_UPPER, _HAS_LOWER, _HAS_DIGIT, _HAS_SPECIAL,
+ _NOT_COMMON, _NO_REPEATED, _NO_SEQUENTIAL, _NO_KEYBOARD, _NOT_BREACHED) = range(len(CHECK_NAMES))
+
+
+def _violates(
+    checks: List[Optional[bool]], entropy: float, guesses_log10: Optional[float], policy: Policy
+) -> bool:
+    """True once a required check of ``policy`` has failed (skipped checks don't count)."""
+    for i in policy.required:
+        if checks[i] is False:
+            return True
+    if policy.require_entropy and entropy < policy.min_entropy:
+        return True
+    return (
+        policy.require_guesses and guesses_log10 is not None
+        and guesses_log10 < policy.min_guesses_log10
+    )
+
+
+def _messages(
+    length: int,
+    checks: Sequence[Optional[bool]],
+    entropy: float,
+    guesses_log10: Optional[float],
+    is_common: Optional[bool],
+    breach_count: Optional[int],
+    breach_enabled: bool,
+    patterns: Optional[Dict[str, PatternMatch]],
+    policy: Policy,
+) -> Tuple[Tuple[Message, ...], Tuple[Message, ...]]:
+    """Tips (what to improve) and positive feedbacks, in CHECK_NAMES order."""
+    tips: List[Message] = []
+    positive: List[Message] = []
+
+    if not checks[_LENGTH_OK]:
+        tips.append(("length_short", (policy.min_length,)))
+    elif not checks[_LENGTH_GREAT]:
+        tips.append(("length_ok", (policy.great_length,)))
     else:
-        positive.append(f"Comprimento excelente ({length} caracteres)!")
+        positive.append(("length_great", (length,)))
 
-    if not has_upper:
-        tips.append("Adicione letras maiúsculas (A-Z) para aumentar a complexidade.")
+    if not checks[_HAS_UPPER]:
+        tips.append(("upper_missing", ()))
     else:
-        positive.append("Contém letras maiúsculas.")
+        positive.append(("upper_ok", ()))
 
-    if not has_lower:
-        tips.append("Adicione letras minúsculas (a-z).")
+    if not checks[_HAS_LOWER]:
+        tips.append(("lower_missing", ()))
     else:
-        positive.append("Contém letras minúsculas.")
+        positive.append(("lower_ok", ()))
 
-    if not has_digit:
-        tips.append("Inclua pelo menos um número (0-9).")
+    if not checks[_HAS_DIGIT]:
+        tips.append(("digit_missing", ()))
     else:
-        positive.append("Contém números.")
+        positive.append(("digit_ok", ()))
 
-    if not has_special:
-        tips.append("Adicione caracteres especiais como !@#$%^&*() para dificultar ataques de força bruta.")
+    if not checks[_HAS_SPECIAL]:
+        tips.append(("special_missing", ()))
     else:
-        positive.append("Contém caracteres especiais.")
+        positive.append(("special_ok", ()))
 
     if is_common:
-        tips.append("Essa senha está na lista das mais usadas e será a primeira tentativa em qualquer ataque de dicionário. Escolha outra senha completamente diferente.")
-    else:
-        positive.append("Não está na lista das senhas mais comuns.")
+        tips.append(("common", ()))
+    elif is_common is not None:
+        positive.append(("not_common", ()))
 
-    if not no_repeated:
-        tips.append("Evite caracteres repetidos em sequência (ex: 'aaa', '111'), pois reduzem drasticamente a entropia.")
+    if breach_count:
+        tips.append(("breached", (breach_count,)))
+    elif breach_count is not None and breach_enabled:
+        positive.append(("not_breached", ()))
+
+    if not checks[_NO_REPEATED]:
+        tips.append(("repeated", ()))
     else:
-        positive.append("Sem repetições excessivas de caracteres.")
+        positive.append(("no_repeated", ()))
+
+    if checks[_NO_SEQUENTIAL] is False:
+        tips.append(("sequential", (patterns[_SEQUENTIAL].pattern,)))
+    elif checks[_NO_SEQUENTIAL]:
+        positive.append(("no_sequential", ()))
+
+    if checks[_NO_KEYBOARD] is False:
+        tips.append(("keyboard", (patterns[_KEYBOARD].pattern,)))
+    elif checks[_NO_KEYBOARD]:
+        positive.append(("no_keyboard", ()))
 
-    if not no_sequential:
-        tips.append("Evite sequências óbvias como 'abc', '123', 'xyz'. Atacantes testam essas combinações primeiro.")
+    if entropy < policy.min_entropy:
+        tips.append(("entropy_low", (entropy, policy.min_entropy)))
+    elif guesses_log10 is not None and guesses_log10 < policy.min_guesses_log10:
+        tips.append(("predictable", (entropy, guesses_log10)))
     else:
-        positive.append("Sem sequências alfanuméricas óbvias.")
+        positive.append(("entropy_high", (entropy,)))
+
+    return tuple(tips), tuple(positive)
+
+
+def _evaluate(
+    password: str,
+    scan: _CharScan,
+    patterns: Optional[Dict[str, PatternMatch]],
+    timer=_NO_TIMER,
+    policy: Optional[Policy] = None,
+) -> PasswordEvaluation:
+    """
+    Run the compiled pipeline of ``policy``: the cheap checks from the single
+    scan first, then the costly stages in the policy's order. A
+    short-circuiting policy stops as soon as a required check fails — the
+    remaining stages are skipped and reported as None. ``patterns`` may come
+    precomputed (incremental analysis); otherwise the automaton runs in its
+    stage.
+    """
+    ensure_data_loaded()
+    if policy is None:
+        policy = default_policy()
+    counts = _LOOKUP_COUNTS
+
+    # ---- cheap checks (single scan) ----------------------------------------
+    length = scan.length
+    checks: List[Optional[bool]] = [None] * len(CHECK_NAMES)
+    checks[_LENGTH_OK] = length >= policy.min_length
+    checks[_LENGTH_GREAT] = length >= policy.great_length
+    checks[_HAS_UPPER] = scan.has_upper
+    checks[_HAS_LOWER] = scan.has_lower
+    checks[_HAS_DIGIT] = scan.has_digit
+    checks[_HAS_SPECIAL] = scan.has_special
+    checks[_NO_REPEATED] = not _has_repeated_chars(password, scan)
+    entropy = _calc_entropy(password, scan)
+    timer.lap("entropy")
+
+    # ---- costly stages, in policy order ------------------------------------
+    is_common = None
+    breach_count = None
+    guesses_log10 = None
+    short_circuit = policy.short_circuit
+    decided = short_circuit and _violates(checks, entropy, None, policy)
+    for stage in policy.stages:
+        if decided:
+            break
+        if stage == "patterns":
+            if patterns is None:
+                patterns = _find_patterns(password)
+            checks[_NO_SEQUENTIAL] = not _has_sequential_chars(password, patterns)
+            checks[_NO_KEYBOARD] = not _has_keyboard_pattern(password, patterns)
+        elif stage == "blocklist":
+            is_common = password.lower() in _COMMON_PASSWORDS
+            checks[_NOT_COMMON] = not is_common
+            counts[0] += 1
+            counts[1] += is_common
+        elif stage == "breach":
+            breach_count = _breach_count(password)
+            checks[_NOT_BREACHED] = breach_count == 0
+            if _BREACH_INDEX is not None:
+                counts[2] += 1
+                counts[3] += breach_count > 0
+        else:
+            # Pattern-aware estimate (dictionary, l33t, dates, keyboard walks...);
+            # entropy_bits stays as the naive charset^length upper bound.
+            guesses_log10 = round(estimate_guesses(password).guesses_log10, 2)
+        timer.lap(stage)
+        if short_circuit:
+            decided = _violates(checks, entropy, guesses_log10, policy)
+
+    # ---- score (0–10 with the default weights, displayed as 0–5) -----------
+    raw_score = 0
+    for threshold, points in policy.length_points:
+        if length >= threshold:
+            raw_score += points
+    for i, points in policy.weights:
+        if checks[i]:
+            raw_score += points
+    if entropy >= policy.min_entropy:
+        raw_score += policy.entropy_weight
+    if guesses_log10 is not None and guesses_log10 >= policy.min_guesses_log10:
+        raw_score += policy.guesses_weight
+
+    # Normalise to 0–5 (labels & colors: password_messages.STRENGTH)
+    score = min(5, round(raw_score / policy.points_per_star))
+    if policy.has_requirements and (decided or _violates(checks, entropy, guesses_log10, policy)):
+        score = min(score, policy.reject_score)
+
+    tips, positive = _messages(
+        length, checks, entropy, guesses_log10, is_common, breach_count,
+        _BREACH_INDEX is not None, patterns, policy,
+    )
+
+    timer.lap("scoring")
+    return PasswordEvaluation(
+        score, entropy, guesses_log10, is_common, breach_count, tuple(checks), tips, positive
+    )
+
+
+# ---------------------------------------------------------------------------
+# Incremental analysis (keystroke-by-keystroke input)
+# ---------------------------------------------------------------------------
+class _PrefixState(NamedTuple):
+    """Scanner + automaton state after a given prefix of the password."""
+    upper: int
+    lower: int
+    digit: int
+    special: int
+    run: int
+    max_run: int
+    prev: Optional[str]
+    ac_state: int
+    lower_len: int          # length of the lowercased prefix (match positions)
+    sequential: Optional[PatternMatch]
+    keyboard: Optional[PatternMatch]
+
+
+_EMPTY_PREFIX = _PrefixState(0, 0, 0, 0, 0, 0, None, 0, 0, None, None)
+
+
+class IncrementalAnalyzer:
+    """
+    Keeps the analysis state of every prefix of the current password.
+
+    Appending a character costs O(1) (one scanner step + one automaton step);
+    deleting from the end pops prefix states. Any other edit truncates to the
+    common prefix and replays the rest. ``result()`` is always identical to
+    ``validate_password(analyzer.password)``.
+    """
+
+    def __init__(self, password: str = ""):
+        self._chars: list = []
+        self._states = [_EMPTY_PREFIX]
+        self.append(password)
+
+    @property
+    def password(self) -> str:
+        return "".join(self._chars)
+
+    def __len__(self) -> int:
+        return len(self._chars)
+
+    def append(self, text: str) -> None:
+        """Extend the password with ``text``, one O(1) step per character."""
+        states = self._states
+        chars = self._chars
+        state = states[-1]
+        get_class = _CHAR_CLASS.get
+        advance = _PATTERN_MATCHER.advance
+        outputs = _PATTERN_MATCHER.outputs
+
+        for ch in text:
+            upper, lower, digit, special, run, max_run, prev, ac, lower_len, seq, kb = state
+
+            cls = get_class(ch)
+            if cls is None:
+                special += 1
+                if ch.isdecimal():
+                    digit += 1
+            elif cls == _UPPER:
+                upper += 1
+            elif cls == _LOWER:
+                lower += 1
+            else:
+                digit += 1
+
+            if ch == prev:
+                run += 1
+            else:
+                prev = ch
+                run = 1
+            if run > max_run and ch != "\n":
+                max_run = run
 
-    if not no_keyboard:
-        tips.append("Evite padrões de teclado como 'qwerty', 'asdf'. São muito fáceis de adivinhar.")
+            # lower() of a single char may expand (e.g. "İ" -> "i̇")
+            for lch in ch.lower():
+                ac = advance(ac, lch)
+                lower_len += 1
+                if (seq is None or kb is None) and outputs(ac):
+                    for pattern, kind in outputs(ac):
+                        match = PatternMatch(lower_len - len(pattern), lower_len, pattern, kind)
+                        if kind == _SEQUENTIAL and seq is None:
+                            seq = match
+                        elif kind == _KEYBOARD and kb is None:
+                            kb = match
+
+            state = _PrefixState(
+                upper, lower, digit, special, run, max_run, prev, ac, lower_len, seq, kb
+            )
+            states.append(state)
+            chars.append(ch)
+
+    def delete(self, count: int = 1) -> None:
+        """Remove ``count`` characters from the end (backspace)."""
+        keep = max(0, len(self._chars) - count)
+        del self._chars[keep:]
+        del self._states[keep + 1 :]
+
+    def set(self, password: str) -> None:
+        """Replace the password, reusing the state of the common prefix."""
+        chars = self._chars
+        common = 0
+        limit = min(len(chars), len(password))
+        while common < limit and chars[common] == password[common]:
+            common += 1
+        self.delete(len(chars) - common)
+        self.append(password[common:])
+
+    def result(self) -> dict:
+        """Same dict as ``validate_password(self.password)``."""
+        state = self._states[-1]
+        scan = _CharScan(
+            len(self._chars), state.upper, state.lower, state.digit, state.special, state.max_run
+        )
+        patterns: Dict[str, PatternMatch] = {}
+        if state.sequential is not None:
+            patterns[_SEQUENTIAL] = state.sequential
+        if state.keyboard is not None:
+            patterns[_KEYBOARD] = state.keyboard
+        return _build_result(self.password, scan, patterns)
+
+
+# ---------------------------------------------------------------------------
+# Vectorized batch kernel (offline scoring of large corpora)
+# ---------------------------------------------------------------------------
+# evaluate_batch() runs the evaluate_password() pipeline over N passwords at
+# once. Passwords are sorted by length and packed, one chunk at a time, into
+# a zero-padded (rows x longest) code-point matrix; class flags, repeated
+# runs, charset size, entropy, sequential/keyboard patterns and the score are
+# whole-array NumPy operations, matching evaluate_password() exactly. Only
+# rows with a character whose lowercase is ASCII or longer than one char
+# ("İ", the Kelvin sign) take the scalar path. Blocklist, breach and guess
+# lookups stay per password; tip texts are only built on request.
+_BATCH_CHUNK_CELLS = 1 << 21    # rows x width of one packed chunk
+_PATTERN_PAD = max(map(len, _KEYBOARD_PATTERNS))
+_LOG2_CHARSET = np.array([math.log2(max(size, 1)) for size in range(26 + 26 + 10 + 32 + 1)])
+
+
+def _triple_code(chunk: str) -> int:
+    a, b, c = map(ord, chunk)
+    return a << 14 | b << 7 | c
+
+
+# Every 3-char ASCII window -> bit 0: sequential run, bit 1: first 3 chars of
+# a keyboard pattern (checked in full only at those positions).
+_TRIPLE_FLAGS = np.zeros(1 << 21, dtype=np.uint8)
+_KEYBOARD_BY_PREFIX: Dict[int, List[bytes]] = {}
+for _pattern, _kind in _pattern_entries():
+    _code = _triple_code(_pattern[:3])
+    if _kind == _SEQUENTIAL:
+        _TRIPLE_FLAGS[_code] |= 1
     else:
-        positive.append("Sem padrões de teclado detectados.")
+        _TRIPLE_FLAGS[_code] |= 2
+        _KEYBOARD_BY_PREFIX.setdefault(_code, []).append(_pattern.encode())
+del _pattern, _kind, _code
+
+
+class BatchEvaluation:
+    """
+    Columnar outcome of evaluate_batch(), in input order.
+
+    ``checks`` is an (N, len(CHECK_NAMES)) int8 matrix: 1 passed, 0 failed,
+    -1 skipped (None in PasswordEvaluation). Skipped stages are also -1 in
+    ``breach_count`` and NaN in ``guesses_log10``. Tips and feedbacks are
+    only produced by ``evaluation(i)``.
+    """
+    __slots__ = (
+        "passwords", "policy", "breach_enabled",
+        "length", "score", "entropy_bits", "guesses_log10", "breach_count", "checks",
+    )
+
+    def __init__(self, passwords: Sequence[str], policy: Policy, breach_enabled: bool):
+        n = len(passwords)
+        self.passwords = passwords
+        self.policy = policy
+        self.breach_enabled = breach_enabled
+        self.length = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.entropy_bits = np.zeros(n, dtype=np.float64)
+        self.guesses_log10 = np.full(n, np.nan)
+        self.breach_count = np.full(n, -1, dtype=np.int64)
+        self.checks = np.full((n, len(CHECK_NAMES)), -1, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.passwords)
+
+    @property
+    def is_common(self) -> np.ndarray:
+        """1 common, 0 not common, -1 skipped."""
+        not_common = self.checks[:, _NOT_COMMON]
+        return np.where(not_common < 0, not_common, 1 - not_common).astype(np.int8)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Every column by name (one per check), e.g. for a DataFrame or ``np.savez``."""
+        columns = {
+            "length": self.length,
+            "score": self.score,
+            "entropy_bits": self.entropy_bits,
+            "guesses_log10": self.guesses_log10,
+            "is_common": self.is_common,
+            "breach_count": self.breach_count,
+        }
+        for i, name in enumerate(CHECK_NAMES):
+            columns[name] = self.checks[:, i]
+        return columns
+
+    def evaluation(self, i: int) -> PasswordEvaluation:
+        """Row ``i`` as evaluate_password() returns it (tips rendered on demand)."""
+        password = self.passwords[i]
+        checks = tuple(None if c < 0 else bool(c) for c in self.checks[i].tolist())
+        entropy = float(self.entropy_bits[i])
+        guesses = float(self.guesses_log10[i])
+        guesses_log10 = None if math.isnan(guesses) else guesses
+        breach_count = int(self.breach_count[i])
+        if breach_count < 0:
+            breach_count = None
+        is_common = None if checks[_NOT_COMMON] is None else not checks[_NOT_COMMON]
+        patterns = None
+        if checks[_NO_SEQUENTIAL] is False or checks[_NO_KEYBOARD] is False:
+            patterns = _find_patterns(password)
+        tips, positive = _messages(
+            int(self.length[i]), checks, entropy, guesses_log10, is_common, breach_count,
+            self.breach_enabled, patterns, self.policy,
+        )
+        return PasswordEvaluation(
+            int(self.score[i]), entropy, guesses_log10, is_common, breach_count, checks, tips, positive
+        )
+
+    def _store(self, i: int, result: PasswordEvaluation) -> None:
+        """Columns of a row evaluated by the scalar pipeline."""
+        self.length[i] = len(self.passwords[i])
+        self.score[i] = result.score
+        self.entropy_bits[i] = result.entropy_bits
+        if result.guesses_log10 is not None:
+            self.guesses_log10[i] = result.guesses_log10
+        if result.breach_count is not None:
+            self.breach_count[i] = result.breach_count
+        self.checks[i] = [-1 if c is None else c for c in result.checks]
 
-    if entropy < 50:
-        tips.append(f"A entropia estimada é {entropy} bits. O ideal é ≥ 50 bits para resistir a ataques modernos.")
+
+def evaluate_batch(
+    passwords: Sequence[str], policy: Optional[Policy] = None, guesses: bool = True
+) -> BatchEvaluation:
+    """
+    evaluate_password() for every password, as NumPy columns.
+
+    ``guesses=False`` drops the guess-estimation stage (by far the most
+    expensive one, and not vectorizable): results then equal the scalar
+    pipeline run with ``policy`` minus its ``guesses`` stage.
+    """
+    ensure_data_loaded()
+    if policy is None:
+        policy = default_policy()
+    if not guesses:
+        policy = policy._replace(stages=tuple(s for s in policy.stages if s != "guesses"))
+    batch = BatchEvaluation(passwords, policy, _BREACH_INDEX is not None)
+
+    lengths = np.fromiter(map(len, passwords), dtype=np.int64, count=len(passwords))
+    order = np.argsort(lengths, kind="stable")
+    sorted_lengths = lengths[order]
+    estimates: Dict[str, float] = {}
+    start = 0
+    while start < len(order):
+        # similar lengths share a chunk: little padding, bounded memory
+        end = min(len(order), start + max(1, _BATCH_CHUNK_CELLS // max(int(sorted_lengths[start]), 1)))
+        while end - start > 1 and (end - start) * int(sorted_lengths[end - 1]) > _BATCH_CHUNK_CELLS:
+            end = start + max(1, _BATCH_CHUNK_CELLS // int(sorted_lengths[end - 1]))
+        _evaluate_chunk(batch, order[start:end], lengths, estimates)
+        start = end
+    return batch
+
+
+def _violates_many(
+    checks: np.ndarray, entropy: np.ndarray, guesses_log10: np.ndarray, policy: Policy
+) -> np.ndarray:
+    """_violates() for every row (skipped checks and NaN estimates don't count)."""
+    violated = np.zeros(len(checks), dtype=bool)
+    for i in policy.required:
+        violated |= checks[:, i] == 0
+    if policy.require_entropy:
+        violated |= entropy < policy.min_entropy
+    if policy.require_guesses:
+        violated |= guesses_log10 < policy.min_guesses_log10
+    return violated
+
+
+def _unicode_classes(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per non-ASCII code point: (Unicode decimal?, lowercases to exactly one
+    non-ASCII char?). The latter keeps pattern positions aligned with
+    ``password.lower()``.
+    """
+    decimal, simple = [], []
+    for code in codes.tolist():
+        ch = chr(code)
+        lowered = ch.lower()
+        decimal.append(ch.isdecimal())
+        simple.append(len(lowered) == 1 and ord(lowered) >= 128)
+    return np.array(decimal, dtype=bool), np.array(simple, dtype=bool)
+
+
+def _pattern_flags(lowered: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(sequential, keyboard) presence per row of a lowercased matrix (non-ASCII = 0)."""
+    n = len(lowered)
+    padded = np.zeros((n, lowered.shape[1] + _PATTERN_PAD), dtype=np.int32)
+    padded[:, : lowered.shape[1]] = lowered
+    triples = padded[:, :-2] << 14 | padded[:, 1:-1] << 7 | padded[:, 2:]
+    flags = _TRIPLE_FLAGS[triples]
+    sequential = (flags & 1).any(axis=1)
+    keyboard = np.zeros(n, dtype=bool)
+    rows, cols = np.nonzero(flags & 2)
+    if len(rows):
+        starts = triples[rows, cols]
+        for code in np.unique(starts).tolist():
+            at = starts == code
+            r, c = rows[at], cols[at]
+            for pattern in _KEYBOARD_BY_PREFIX[code]:
+                found = np.ones(len(r), dtype=bool)
+                for k in range(3, len(pattern)):
+                    found &= padded[r, c + k] == pattern[k]
+                keyboard[r[found]] = True
+    return sequential, keyboard
+
+
+def _evaluate_chunk(
+    batch: BatchEvaluation, rows: np.ndarray, lengths: np.ndarray, estimates: Dict[str, float]
+) -> None:
+    passwords = batch.passwords
+    policy = batch.policy
+    common, breach_index, counts = _COMMON_PASSWORDS, _BREACH_INDEX, _LOOKUP_COUNTS
+
+    width = max(int(lengths[rows[-1]]), 1)
+    packed = np.array([passwords[i] for i in rows.tolist()], dtype=f"<U{width}")
+    chars = packed.view(np.uint32).reshape(len(rows), width)
+    wide = chars >= 128
+    unicode_digit = None
+    if wide.any():
+        at_row, at_col = np.nonzero(wide)
+        distinct, which = np.unique(chars[at_row, at_col], return_inverse=True)
+        decimal, simple = _unicode_classes(distinct)
+        which = which.reshape(-1)
+        # lower() turning into ASCII or changing the length: scalar path
+        scalar = np.zeros(len(rows), dtype=bool)
+        scalar[at_row[~simple[which]]] = True
+        for i in rows[scalar].tolist():
+            batch._store(i, _evaluate(passwords[i], _scan(passwords[i]), None, policy=policy))
+        unicode_digit = np.zeros(chars.shape, dtype=bool)
+        unicode_digit[at_row, at_col] = decimal[which]
+        keep = ~scalar
+        rows, chars, wide, unicode_digit = rows[keep], chars[keep], wide[keep], unicode_digit[keep]
+        if not len(rows):
+            return
     else:
-        positive.append(f"Entropia alta: {entropy} bits.")
+        chars = chars.astype(np.uint8)
+    length = lengths[rows]
+    n = len(rows)
 
-    return {
-        "score": score,
-        "strength_label": label,
-        "strength_color": color,
-        "entropy_bits": entropy,
-        "is_common": is_common,
-        "checks": {
-            "length_ok": length_ok,
-            "length_great": length_great,
-            "has_uppercase": has_upper,
-            "has_lowercase": has_lower,
-            "has_digit": has_digit,
-            "has_special": has_special,
-            "not_common": not_common,
-            "no_repeated_chars": no_repeated,
-            "no_sequential_chars": no_sequential,
-            "no_keyboard_pattern": no_keyboard,
-        },
-        "tips": tips,
-        "positive_feedbacks": positive,
-    }
+    # ---- cheap checks ------------------------------------------------------
+    in_password = np.arange(width) < length[:, None]
+    upper = (chars >= 65) & (chars <= 90)
+    lower = (chars >= 97) & (chars <= 122)
+    digit = (chars >= 48) & (chars <= 57)
+    has_upper, has_lower = upper.any(axis=1), lower.any(axis=1)
+    has_special = (in_password & ~(upper | lower | digit)).any(axis=1)
+    if unicode_digit is not None:
+        digit |= unicode_digit   # \d: also special, as in _scan()
+    has_digit = digit.any(axis=1)
+    # (.)\1{2,} outside newlines, within the password (padding is also 0)
+    repeated = (
+        (chars[:, 2:] == chars[:, 1:-1]) & (chars[:, 1:-1] == chars[:, :-2])
+        & (chars[:, 2:] != 10) & in_password[:, 2:]
+    ).any(axis=1)
+
+    checks = np.full((n, len(CHECK_NAMES)), -1, dtype=np.int8)
+    checks[:, _LENGTH_OK] = length >= policy.min_length
+    checks[:, _LENGTH_GREAT] = length >= policy.great_length
+    checks[:, _HAS_UPPER] = has_upper
+    checks[:, _HAS_LOWER] = has_lower
+    checks[:, _HAS_DIGIT] = has_digit
+    checks[:, _HAS_SPECIAL] = has_special
+    checks[:, _NO_REPEATED] = ~repeated
+
+    charset = 26 * has_lower + 26 * has_upper + 10 * has_digit + 32 * has_special
+    raw_entropy = _LOG2_CHARSET[charset] * length
+    # round() per distinct value: np.round is not correctly rounded
+    distinct, inverse = np.unique(raw_entropy, return_inverse=True)
+    entropy = np.array([round(x, 2) for x in distinct.tolist()])[inverse.reshape(-1)]
+
+    # ---- costly stages, in policy order ------------------------------------
+    guesses_log10 = np.full(n, np.nan)
+    breach_count = np.full(n, -1, dtype=np.int64)
+    short_circuit = policy.short_circuit
+    decided = (
+        _violates_many(checks, entropy, guesses_log10, policy)
+        if short_circuit else np.zeros(n, dtype=bool)
+    )
+    for stage in policy.stages:
+        todo = np.flatnonzero(~decided)
+        if not len(todo):
+            break
+        if stage == "patterns":
+            lowered = np.where(upper[todo], chars[todo] + 32, chars[todo])
+            if unicode_digit is not None:
+                lowered[wide[todo]] = 0   # never part of a (pure ASCII) pattern
+            sequential, keyboard = _pattern_flags(lowered)
+            checks[todo, _NO_SEQUENTIAL] = ~sequential
+            checks[todo, _NO_KEYBOARD] = ~keyboard
+        elif stage == "blocklist":
+            lowered = map(str.lower, [passwords[i] for i in rows[todo].tolist()])
+            hits = np.fromiter(map(common.__contains__, lowered), dtype=bool, count=len(todo))
+            checks[todo, _NOT_COMMON] = ~hits
+            counts[0] += len(todo)
+            counts[1] += int(hits.sum())
+        elif stage == "breach":
+            if breach_index is None:
+                breach_count[todo] = 0
+            else:
+                breach_count[todo] = list(map(breach_index.count, [passwords[i] for i in rows[todo].tolist()]))
+                counts[2] += len(todo)
+                counts[3] += int((breach_count[todo] > 0).sum())
+            checks[todo, _NOT_BREACHED] = breach_count[todo] == 0
+        else:
+            for j, i in zip(todo.tolist(), rows[todo].tolist()):
+                password = passwords[i]
+                estimate = estimates.get(password)
+                if estimate is None:
+                    estimate = estimates[password] = round(estimate_guesses(password).guesses_log10, 2)
+                guesses_log10[j] = estimate
+        if short_circuit:
+            decided |= _violates_many(checks, entropy, guesses_log10, policy)
+
+    # ---- score -------------------------------------------------------------
+    raw_score = np.zeros(n)
+    for threshold, points in policy.length_points:
+        raw_score += np.where(length >= threshold, points, 0)
+    for i, points in policy.weights:
+        raw_score += np.where(checks[:, i] == 1, points, 0)
+    raw_score += np.where(entropy >= policy.min_entropy, policy.entropy_weight, 0)
+    raw_score += np.where(guesses_log10 >= policy.min_guesses_log10, policy.guesses_weight, 0)
+    score = np.minimum(5, np.rint(raw_score / policy.points_per_star)).astype(np.int64)
+    if policy.has_requirements:
+        rejected = _violates_many(checks, entropy, guesses_log10, policy)
+        score[rejected] = np.minimum(score[rejected], policy.reject_score)
 
+    batch.length[rows] = length
+    batch.score[rows] = score
+    batch.entropy_bits[rows] = entropy
+    batch.guesses_log10[rows] = guesses_log10
+    batch.breach_count[rows] = breach_count
+    batch.checks[rows] = checks
@@ -0,0 +1,103 @@
+"""
+Autômato Aho-Corasick para busca simultânea de vários padrões em um texto.
+
+Compilado uma única vez (na importação do validador) a partir de pares
+(padrão, tipo). A busca percorre o texto em uma única passagem linear,
+independente da quantidade de padrões, e informa qual padrão casou e onde.
+"""
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+
+class PatternMatch(NamedTuple):
+    """Ocorrência de um padrão: posição [start, end) no texto, padrão e tipo."""
+    start: int
+    end: int
+    pattern: str
+    kind: str
+
+
+class AhoCorasick:
+    """
+    Autômato determinístico (transições completas pré-calculadas).
+
+    Cada passo da busca é um único lookup em dict — não há laço de
+    "failure links" em tempo de consulta. Caracteres que não aparecem em
+    nenhum padrão levam direto ao estado inicial.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[Tuple[str, str]]] = [[]]
+
+        # ---- trie ---------------------------------------------------------
+        for pattern, kind in entries:
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                node = nxt
+            if (pattern, kind) not in out[node]:
+                out[node].append((pattern, kind))
+
+        # ---- failure links + transições completas (BFS) -------------------
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = deque(goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            f = fail[node]
+            out[node].extend(o for o in out[f] if o not in out[node])
+            # herda as transições do estado de falha e sobrepõe as próprias
+            trans = dict(delta[f])
+            for ch, child in goto[node].items():
+                fail[child] = delta[f].get(ch, 0)
+                trans[ch] = child
+                queue.append(child)
+            delta[node] = trans
+
+        self._delta = delta
+        self._out = [tuple(o) for o in out]
+        self.kinds = frozenset(kind for node_out in out for _, kind in node_out)
+
+    def advance(self, state: int, ch: str) -> int:
+        """Um passo do autômato (uso incremental, caractere a caractere)."""
+        return self._delta[state].get(ch, 0)
+
+    def outputs(self, state: int) -> Tuple[Tuple[str, str], ...]:
+        """Padrões (padrão, tipo) que terminam no estado ``state``."""
+        return self._out[state]
+
+    def iter_matches(self, text: str) -> Iterator[PatternMatch]:
+        """Gera todas as ocorrências, ordenadas pela posição final."""
+        delta = self._delta
+        out = self._out
+        state = 0
+        for i, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                end = i + 1
+                for pattern, kind in out[state]:
+                    yield PatternMatch(end - len(pattern), end, pattern, kind)
+
+    def first_by_kind(self, text: str) -> Dict[str, PatternMatch]:
+        """
+        Primeira ocorrência de cada tipo de padrão.
+        Interrompe a passagem assim que todos os tipos foram encontrados.
+        """
+        found: Dict[str, PatternMatch] = {}
+        total = len(self.kinds)
+        for match in self.iter_matches(text):
+            if match.kind not in found:
+                found[match.kind] = match
+                if len(found) == total:
+                    break
+        return found
@@ -0,0 +1,641 @@
+"""
+Detector de phishing por análise léxica da URL — offline, sem nenhuma
+consulta de rede (DNS, WHOIS, listas remotas) no caminho da análise.
+
+Pipeline por lote:
+  1. ``url_parser.split_url`` separa esquema, userinfo, host, porta e o resto da URL
+     (parser próprio, sem ``urllib``: só ``find``/fatiamento)
+  2. ``analyze_host`` — com cache LRU, pois hosts se repetem muito em lotes
+     reais — decodifica punycode, extrai o domínio registrável pela trie da
+     Public Suffix List, detecta IP literal, mistura de alfabetos e imitação
+     de marcas pelo "esqueleto" do domínio (homóglifos normalizados:
+     ``раураӏ`` cirílico, ``paypa1``, ``rnicrosoft`` → ``paypal``/``microsoft``)
+  3. features da URL inteira (tamanho, proporção de dígitos e símbolos,
+     entropia, ``%``-encoding, parâmetros) são calculadas em NumPy sobre os
+     bytes de todas as URLs do bloco concatenadas: um ``bincount`` por
+     (linha, classe de byte) e outro por (linha, byte) para a entropia
+  4. palavras suspeitas (login, verify, senha, conta, pix…) e menções a
+     marcas: hash polinomial de cada palavra do bloco, buscado por
+     ``searchsorted`` nas tabelas ordenadas do vocabulário
+  5. lista de bloqueio local (``domain_blocklist``, opcional): o host e seus
+     domínios pais, e a URL exata, contra o arquivo compilado via mmap
+  6. score = sigmoid(X·w + b) — modelo linear pequeno em
+     ``app/data/phishing_model.json`` (ou PHISHING_MODEL_PATH)
+
+A análise de uma URL é um lote de tamanho 1, mais os motivos (features com
+maior contribuição para o score).
+"""
+import json
+import math
+import os
+import re
+import threading
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.domain_blocklist import current as current_blocklist
+from app.services.public_suffix import split_host
+from app.services.url_parser import split_url
+
+_DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+_MODEL_FILE = os.path.join(_DATA_DIR, "phishing_model.json")
+_BRANDS_FILE = os.path.join(_DATA_DIR, "phishing_brands.txt")
+
+_CHUNK_ROWS = 4096   # linhas por bloco vetorizado (~8 MB na matriz de bytes da entropia)
+
+# Ordem das colunas da matriz de features (a mesma dos pesos do modelo)
+FEATURES = (
+    "url_length",
+    "host_length",
+    "subdomain_depth",
+    "host_hyphens",
+    "host_digit_ratio",
+    "digit_ratio",
+    "special_ratio",
+    "url_entropy",
+    "host_entropy",
+    "percent_encoded",
+    "query_params",
+    "userinfo",
+    "path_double_slash",
+    "no_https",
+    "nonstandard_port",
+    "ip_host",
+    "punycode",
+    "mixed_script",
+    "homoglyph_brand",
+    "brand_in_domain",
+    "brand_elsewhere",
+    "suspicious_tld",
+    "shortener",
+    "suspicious_tokens",
+    "legit_brand_domain",
+    "blocklisted",
+)
+_COL = {name: i for i, name in enumerate(FEATURES)}
+
+# Colunas que dependem só do host (pré-calculadas no cache de analyze_host)
+_HOST_FEATURES = (
+    "host_length", "subdomain_depth", "host_hyphens", "host_digit_ratio",
+    "host_entropy", "ip_host", "punycode", "mixed_script", "homoglyph_brand",
+    "brand_in_domain", "suspicious_tld", "shortener", "legit_brand_domain",
+)
+_HOST_COLS = [_COL[name] for name in _HOST_FEATURES]
+_URL_COLS = [_COL[name] for name in ("userinfo", "path_double_slash", "no_https", "nonstandard_port")]
+
+VERDICTS = ("legitimate", "suspicious", "phishing")
+
+_REASONS = {
+    "url_length": "URL muito longa",
+    "host_length": "Nome de domínio muito longo",
+    "subdomain_depth": "Muitos níveis de subdomínio",
+    "host_hyphens": "Domínio com vários hífens",
+    "host_digit_ratio": "Domínio com muitos dígitos",
+    "digit_ratio": "URL com muitos dígitos",
+    "special_ratio": "URL com muitos caracteres especiais",
+    "url_entropy": "URL com aparência aleatória (alta entropia)",
+    "host_entropy": "Domínio com aparência aleatória (alta entropia)",
+    "percent_encoded": "Caracteres ofuscados com %-encoding",
+    "query_params": "Muitos parâmetros na URL",
+    "userinfo": "URL com '@' antes do domínio — o navegador ignora o que vem antes dele",
+    "path_double_slash": "Redirecionamento embutido ('//') no caminho",
+    "no_https": "Conexão sem HTTPS",
+    "nonstandard_port": "Porta fora do padrão",
+    "ip_host": "Endereço IP no lugar de um domínio",
+    "punycode": "Domínio internacionalizado (punycode/IDN)",
+    "mixed_script": "Domínio mistura alfabetos (ex.: latino e cirílico)",
+    "homoglyph_brand": "Domínio imita '{brand}' com caracteres parecidos",
+    "brand_in_domain": "Domínio usa o nome '{brand}' mas não pertence à marca",
+    "brand_elsewhere": "Cita a marca '{brand}' fora do domínio oficial",
+    "suspicious_tld": "Extensão de domínio muito usada em golpes",
+    "shortener": "Encurtador de URL esconde o destino real",
+    "suspicious_tokens": "Palavras típicas de golpe (login, senha, verificar…)",
+    "blocklisted": "Domínio ou URL presente na lista de bloqueio",
+}
+
+_SUSPICIOUS_TLDS = frozenset((
+    "zip", "mov", "xyz", "top", "tk", "ml", "ga", "cf", "gq", "buzz", "club",
+    "work", "click", "link", "country", "kim", "loan", "men", "review", "rest",
+    "fit", "icu", "cyou", "sbs", "monster", "quest", "support", "live", "online",
+    "site", "website", "space", "fun", "host", "pw", "cam", "bar", "best",
+))
+
+_SHORTENERS = frozenset((
+    "bit.ly", "tinyurl.com", "goo.gl", "t.co", "ow.ly", "is.gd", "buff.ly",
+    "cutt.ly", "rebrand.ly", "shorturl.at", "tiny.cc", "rb.gy", "t.ly",
+    "s.id", "v.gd", "bl.ink", "encurtador.com.br", "encr.pw", "l1nq.com",
+))
+
+# Palavras típicas de golpe (inglês e português), comparadas com as palavras
+# inteiras da URL — sequências de letras delimitadas por dígitos e símbolos
+_SUSPICIOUS_WORDS = (
+    # inglês
+    "login", "logon", "signin", "verify", "verification", "validate", "account",
+    "update", "secure", "security", "confirm", "banking", "webscr", "password",
+    "passwd", "credential", "credentials", "wallet", "unlock", "suspend",
+    "suspended", "billing", "invoice", "payment", "recover", "reset",
+    "authenticate", "bonus", "gift", "prize", "winner",
+    # português (com e sem acento)
+    "senha", "conta", "acesso", "entrar", "verificar", "verificacao",
+    "verificação", "confirmar", "atualizar", "atualizacao", "atualização",
+    "seguranca", "segurança", "cadastro", "recadastramento", "desbloqueio",
+    "desbloquear", "bloqueado", "bloqueada", "suspenso", "suspensa", "pagamento",
+    "boleto", "fatura", "pix", "premio", "prêmio", "cartao", "cartão",
+    "regularizar", "pendencia", "pendência", "restituicao", "restituição", "cpf",
+    "resgate",
+)
+
+_IPV4 = re.compile(r"(?:0x[0-9a-f]+|\d+)(?:\.(?:0x[0-9a-f]+|\d+)){0,3}")
+
+# Homóglifos → letra latina equivalente. Complementa a NFKD (que já remove
+# acentos e desfaz formas de largura total/compatibilidade). i/1/l/| viram
+# todos "l" — o esqueleto da marca passa pela mesma função, então a
+# comparação é feita entre esqueletos.
+_CONFUSABLES = str.maketrans({
+    # cirílico
+    "а": "a", "в": "b", "е": "e", "ё": "e", "к": "k", "м": "m", "н": "h",
+    "о": "o", "р": "p", "с": "c", "т": "t", "у": "y", "х": "x", "ѕ": "s",
+    "і": "l", "ї": "l", "ј": "j", "ԁ": "d", "ԛ": "q", "ԝ": "w", "һ": "h",
+    "ӏ": "l", "ѵ": "v", "ɡ": "g", "ս": "u", "օ": "o",
+    # grego
+    "α": "a", "β": "b", "ε": "e", "η": "n", "ι": "l", "κ": "k", "ν": "v",
+    "ο": "o", "ρ": "p", "τ": "t", "υ": "u", "χ": "x", "ϲ": "c", "ω": "w",
+    # latinos e dígitos
+    "ı": "l", "ł": "l", "ø": "o", "đ": "d", "ß": "b",
+    "i": "l", "1": "l", "|": "l", "!": "l", "0": "o", "3": "e", "4": "a",
+    "5": "s", "7": "t", "8": "b", "$": "s", "@": "a",
+})
+_MULTI_CHAR_CONFUSABLES = (("rn", "m"), ("vv", "w"))
+
+# Palavra = sequência de letras ASCII ou bytes UTF-8 não ASCII (mesma regra
+# do caminho vetorizado, que trabalha sobre os bytes)
+_WORD = re.compile(r"[a-z\x80-\U0010ffff]+")
+
+# Classes de byte para as contagens vetorizadas
+_CLS_OTHER, _CLS_DIGIT, _CLS_PERCENT, _CLS_EQUALS, _CLS_SPECIAL, _CLS_NON_ASCII = range(6)
+_N_CLASSES = 6
+_BYTE_CLASS = np.full(256, _CLS_SPECIAL, dtype=np.int64)
+_BYTE_CLASS[128:] = _CLS_NON_ASCII
+for _ch in b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ/.:":
+    _BYTE_CLASS[_ch] = _CLS_OTHER
+_BYTE_CLASS[ord("0"):ord("9") + 1] = _CLS_DIGIT
+_BYTE_CLASS[ord("%")] = _CLS_PERCENT
+_BYTE_CLASS[ord("=")] = _CLS_EQUALS
+
+_ASCII_LOWER = np.arange(256, dtype=np.uint8)
+_ASCII_LOWER[ord("A"):ord("Z") + 1] += 32
+_IS_LETTER = np.zeros(256, dtype=bool)
+_IS_LETTER[ord("a"):ord("z") + 1] = True
+_IS_LETTER[128:] = True
+
+# Hash polinomial das palavras, módulo 2^64 (o overflow de uint64 do NumPy
+# já faz o módulo): h(w) = Σ b_j·B^j. Com a soma de prefixos P, a palavra
+# [s, e) tem hash (P[e] - P[s])·B^-s — B é ímpar, logo invertível.
+_HASH_BASE = 0x100000001B3   # primo do FNV-64
+_HASH_BASE_INV = pow(_HASH_BASE, -1, 1 << 64)
+_POWERS: Tuple[np.ndarray, np.ndarray] = (np.ones(1, np.uint64), np.ones(1, np.uint64))
+
+
+class HostInfo(NamedTuple):
+    host: str                      # forma Unicode (punycode decodificado)
+    registrable: Optional[str]     # domínio registrável (None: IP ou sufixo puro)
+    suffix: Optional[str]          # sufixo público
+    subdomain_depth: int           # níveis abaixo do registrável (sem "www")
+    hyphens: int
+    digit_ratio: float
+    entropy: float                 # bits por caractere
+    ip: bool
+    punycode: bool                 # rótulo xn-- ou caracteres não ASCII
+    mixed_script: bool
+    homoglyph_brand: Optional[str]
+    brand_in_domain: Optional[str]
+    legit_brand: Optional[str]     # o host é de uma marca monitorada
+    suspicious_tld: bool
+    shortener: bool
+    vector: Tuple[float, ...] = ()   # colunas _HOST_FEATURES, já transformadas
+
+
+class _Model(NamedTuple):
+    version: str
+    weights: np.ndarray            # float64, na ordem de FEATURES
+    bias: float
+    suspicious: float
+    phishing: float
+
+
+class _Vocabulary(NamedTuple):
+    token_hashes: np.ndarray       # hashes ordenados das palavras suspeitas
+    brand_hashes: np.ndarray       # hashes ordenados dos nomes de marca
+    brand_names: frozenset
+
+
+class _Brand(NamedTuple):
+    name: str
+    skeleton: str
+    legit: frozenset
+    pattern: Optional["re.Pattern"]   # marcas curtas: só casam em borda de rótulo
+
+
+_MODEL: Optional[_Model] = None
+_BRANDS: Optional[Tuple[_Brand, ...]] = None
+_VOCABULARY: Optional[_Vocabulary] = None
+_LOCK = threading.Lock()
+
+
+# ---------------------------------------------------------------------------
+# Dados (carregados no primeiro uso)
+# ---------------------------------------------------------------------------
+
+def skeleton(text: str) -> str:
+    """Forma canônica para comparar com marcas: sem acentos, homóglifos e caixa."""
+    if not text.isascii():
+        text = "".join(
+            ch for ch in unicodedata.normalize("NFKD", text) if not unicodedata.combining(ch)
+        )
+    text = text.lower().translate(_CONFUSABLES)
+    for pair, single in _MULTI_CHAR_CONFUSABLES:
+        text = text.replace(pair, single)
+    return text
+
+
+def _word_hash(word: str) -> int:
+    value, power = 0, 1
+    for byte in word.encode("utf-8"):
+        value = (value + byte * power) % (1 << 64)
+        power = power * _HASH_BASE % (1 << 64)
+    return value
+
+
+def _load_brands(path: str = _BRANDS_FILE) -> Tuple[_Brand, ...]:
+    brands = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            fields = line.split("#", 1)[0].split()
+            if len(fields) < 2:
+                continue
+            name = fields[0].lower()
+            skel = skeleton(name)
+            pattern = None
+            if len(skel) < 5:
+                # "itau" casa em "itau-seguro.com", mas não dentro de outra palavra
+                pattern = re.compile(rf"(?:^|[-.]){re.escape(skel)}|{re.escape(skel)}(?:$|[-.])")
+            brands.append(_Brand(name, skel, frozenset(d.lower() for d in fields[1:]), pattern))
+    return tuple(brands)
+
+
+def _load_model(path: str) -> _Model:
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    weights = spec["weights"]
+    unknown = set(weights) - set(FEATURES)
+    if unknown:
+        raise ValueError(f"Modelo de phishing com features desconhecidas: {sorted(unknown)}")
+    thresholds = spec.get("thresholds", {})
+    return _Model(
+        version=str(spec.get("version", "")),
+        weights=np.array([float(weights.get(name, 0.0)) for name in FEATURES]),
+        bias=float(spec.get("bias", 0.0)),
+        suspicious=float(thresholds.get("suspicious", 0.5)),
+        phishing=float(thresholds.get("phishing", 0.8)),
+    )
+
+
+def _ensure_loaded() -> None:
+    global _MODEL, _BRANDS, _VOCABULARY
+    if _MODEL is not None:
+        return
+    with _LOCK:
+        if _MODEL is None:
+            brands = _load_brands()
+            names = frozenset(b.name for b in brands)
+            _VOCABULARY = _Vocabulary(
+                token_hashes=np.array(sorted({_word_hash(w) for w in _SUSPICIOUS_WORDS}), np.uint64),
+                brand_hashes=np.array(sorted({_word_hash(w) for w in names}), np.uint64),
+                brand_names=names,
+            )
+            _BRANDS = brands
+            _MODEL = _load_model(settings.PHISHING_MODEL_PATH or _MODEL_FILE)
+
+
+def model_version() -> str:
+    _ensure_loaded()
+    return _MODEL.version
+
+
+# ---------------------------------------------------------------------------
+# URL e host
+# ---------------------------------------------------------------------------
+
+def _entropy(text: str) -> float:
+    if not text:
+        return 0.0
+    n = len(text)
+    return -sum(c / n * math.log2(c / n) for c in Counter(text).values())
+
+
+def _scripts(text: str) -> set:
+    return {
+        unicodedata.name(ch, "UNKNOWN").partition(" ")[0]
+        for ch in text if ch.isalpha()
+    }
+
+
+@lru_cache(maxsize=65_536)
+def analyze_host(host: str) -> HostInfo:
+    """Features do host (``url_parser.parse_url(...).host``); puras e em cache por host."""
+    _ensure_loaded()
+    length = len(host) or 1
+    digit_ratio = sum(ch.isdigit() for ch in host) / length
+    entropy = _entropy(host)
+
+    if host.startswith("[") or _IPV4.fullmatch(host):
+        return _with_vector(HostInfo(host, None, None, 0, 0, digit_ratio, entropy, True,
+                                     False, False, None, None, None, False, False))
+
+    labels = host.split(".")
+    punycode = not host.isascii()
+    if "xn--" in host:
+        decoded = []
+        for label in labels:
+            if label.startswith("xn--"):
+                punycode = True
+                try:
+                    label = label[4:].encode("ascii").decode("punycode").lower()
+                except (UnicodeError, ValueError):
+                    pass   # punycode inválido: fica como está (e já conta como IDN)
+            decoded.append(label)
+        labels = decoded
+    unicode_host = ".".join(labels)
+
+    subdomain, registrable, suffix = split_host(unicode_host)
+    sub_labels = subdomain.split(".") if subdomain else []
+    if sub_labels and sub_labels[0] == "www":
+        sub_labels = sub_labels[1:]
+    name = registrable[: len(registrable) - len(suffix) - 1] if registrable else unicode_host
+    mixed_script = not unicode_host.isascii() and len(_scripts(unicode_host)) > 1
+
+    homoglyph = in_domain = legit = None
+    skel = skeleton(name)
+    flat_skel = skel.replace("-", "")
+    flat_name = name.replace("-", "")
+    for brand in _BRANDS:
+        if registrable in brand.legit:
+            legit = brand.name
+            break
+        if brand.pattern is None:
+            found = brand.skeleton in flat_skel
+            literal = brand.name in flat_name
+        else:
+            found = brand.pattern.search(skel) is not None
+            literal = found and brand.name in name
+        if found and in_domain is None and homoglyph is None:
+            if literal:
+                in_domain = brand.name
+            else:
+                homoglyph = brand.name
+
+    return _with_vector(HostInfo(
+        host=unicode_host,
+        registrable=registrable,
+        suffix=suffix,
+        subdomain_depth=len(sub_labels),
+        hyphens=host.count("-"),
+        digit_ratio=digit_ratio,
+        entropy=entropy,
+        ip=False,
+        punycode=punycode,
+        mixed_script=mixed_script,
+        homoglyph_brand=homoglyph,
+        brand_in_domain=in_domain,
+        legit_brand=legit,
+        suspicious_tld=suffix.rpartition(".")[2] in _SUSPICIOUS_TLDS,
+        shortener=registrable in _SHORTENERS,
+    ))
+
+
+def _with_vector(info: HostInfo) -> HostInfo:
+    return info._replace(vector=(
+        min(len(info.host), 100) / 25,
+        min(info.subdomain_depth, 6),
+        min(info.hyphens, 6),
+        info.digit_ratio,
+        info.entropy,
+        float(info.ip),
+        float(info.punycode),
+        float(info.mixed_script),
+        float(info.homoglyph_brand is not None),
+        float(info.brand_in_domain is not None),
+        float(info.suspicious_tld),
+        float(info.shortener),
+        float(info.legit_brand is not None),
+    ))
+
+
+# ---------------------------------------------------------------------------
+# Features vetorizadas
+# ---------------------------------------------------------------------------
+
+def _powers(size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """B^j e B^-j (mod 2^64) para j < size; a tabela cresce por duplicação."""
+    global _POWERS
+    powers = _POWERS
+    if powers[0].size < size:
+        grown = max(size, 2 * powers[0].size)
+        forward = np.full(grown, _HASH_BASE, dtype=np.uint64)
+        inverse = np.full(grown, _HASH_BASE_INV, dtype=np.uint64)
+        forward[0] = inverse[0] = 1
+        powers = _POWERS = (np.cumprod(forward), np.cumprod(inverse))
+    return powers
+
+
+def _in_sorted(values: np.ndarray, table: np.ndarray) -> np.ndarray:
+    idx = np.minimum(np.searchsorted(table, values), table.size - 1)
+    return table[idx] == values
+
+
+def _vector_features(urls: Sequence[str]) -> Tuple[np.ndarray, ...]:
+    """
+    Features das URLs inteiras sobre os bytes do bloco, sem laço Python por
+    caractere: tamanho em bytes, contagem por classe de byte (n × classes),
+    entropia de Shannon (bits/byte), nº de palavras suspeitas e de menções a
+    marcas.
+    """
+    n = len(urls)
+    text = "\n".join(urls) + "\n"   # "\n" fecha cada linha: nenhuma palavra atravessa URLs
+    data = np.frombuffer(text.encode("utf-8", "surrogatepass"), dtype=np.uint8)
+    if data.size == len(text):   # tudo ASCII: bytes = caracteres
+        lengths = np.fromiter(map(len, urls), dtype=np.int64, count=n)
+    else:
+        lengths = np.fromiter(
+            (len(u.encode("utf-8", "surrogatepass")) for u in urls), dtype=np.int64, count=n
+        )
+    rows = np.repeat(np.arange(n, dtype=np.int64), lengths + 1)
+    own = np.arange(n, dtype=np.int64)
+
+    classes = np.bincount(
+        rows * _N_CLASSES + _BYTE_CLASS[data], minlength=n * _N_CLASSES
+    ).reshape(n, _N_CLASSES)
+    classes[:, _BYTE_CLASS[10]] -= 1   # descontar o separador
+
+    # H = log2(L) - Σ c·log2(c) / L; c·log2(c) sai de uma tabela indexada
+    # pela contagem (0·log2(0) = 0), sem log sobre a matriz n × 256
+    per_byte = np.bincount(rows * 256 + data, minlength=n * 256)
+    per_byte[own * 256 + 10] -= 1
+    c = np.arange(int(lengths.max(initial=0)) + 1, dtype=np.float64)
+    clogc = c * np.log2(np.maximum(c, 1))
+    sum_clogc = clogc.take(per_byte).reshape(n, 256).sum(axis=1)
+    safe = np.maximum(lengths, 1)
+    entropy = np.log2(safe) - sum_clogc / safe
+
+    # palavras: hash de cada sequência de letras, buscado nas tabelas ordenadas
+    lower = _ASCII_LOWER[data]
+    letter = _IS_LETTER[lower]
+    edge = np.diff(letter.astype(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edge == 1)
+    ends = np.flatnonzero(edge == -1)
+    forward, inverse = _powers(data.size)
+    prefix = np.zeros(data.size + 1, dtype=np.uint64)
+    np.cumsum(lower * forward[:data.size], out=prefix[1:])
+    hashes = (prefix[ends] - prefix[starts]) * inverse[starts]
+    word_rows = rows[starts]
+    tokens = np.bincount(word_rows[_in_sorted(hashes, _VOCABULARY.token_hashes)], minlength=n)
+    mentions = np.bincount(word_rows[_in_sorted(hashes, _VOCABULARY.brand_hashes)], minlength=n)
+    return lengths, classes, entropy, tokens, mentions
+
+
+def _feature_chunk(urls: Sequence[str]) -> Tuple[np.ndarray, List[HostInfo]]:
+    n = len(urls)
+    clean = [u.strip() for u in urls]
+    parsed = [split_url(u) for u in clean]
+    hosts = [analyze_host(p[2]) for p in parsed]
+    lengths, classes, entropy, tokens, mentions = _vector_features(clean)
+
+    X = np.empty((n, len(FEATURES)), dtype=np.float64)
+    safe = np.maximum(lengths, 1)
+    X[:, _COL["url_length"]] = np.minimum(lengths, 400) / 100
+    X[:, _COL["digit_ratio"]] = classes[:, _CLS_DIGIT] / safe
+    X[:, _COL["special_ratio"]] = (
+        classes[:, _CLS_SPECIAL] + classes[:, _CLS_PERCENT] + classes[:, _CLS_EQUALS]
+    ) / safe
+    X[:, _COL["url_entropy"]] = entropy
+    X[:, _COL["percent_encoded"]] = np.minimum(classes[:, _CLS_PERCENT], 20) / 5
+    X[:, _COL["query_params"]] = np.minimum(classes[:, _CLS_EQUALS], 20)
+    X[:, _COL["suspicious_tokens"]] = np.minimum(tokens, 5)
+
+    # colunas do host: tuplas prontas no cache, copiadas sem montar listas
+    X[:, _HOST_COLS] = np.fromiter(
+        chain.from_iterable(h.vector for h in hosts), dtype=np.float64,
+        count=n * len(_HOST_FEATURES),
+    ).reshape(n, len(_HOST_FEATURES))
+    # scheme, userinfo, host, port, rest
+    X[:, _URL_COLS] = np.fromiter(
+        chain.from_iterable(
+            (p[1], "//" in p[4], p[0] != "https", p[3] is not None and p[3] not in (80, 443))
+            for p in parsed
+        ),
+        dtype=np.float64, count=n * len(_URL_COLS),
+    ).reshape(n, len(_URL_COLS))
+
+    # marca citada no caminho/subdomínio de um domínio que não é dela (e que
+    # já não foi contada como imitação no próprio domínio)
+    impersonating = X[:, _COL["homoglyph_brand"]] + X[:, _COL["brand_in_domain"]]
+    X[:, _COL["brand_elsewhere"]] = (
+        (mentions > 0) & (impersonating == 0) & (X[:, _COL["legit_brand_domain"]] == 0)
+    )
+
+    # uma referência por bloco: uma recarga no meio do lote não mistura listas
+    blocklist = current_blocklist()
+    if blocklist is None:
+        X[:, _COL["blocklisted"]] = 0
+    else:
+        X[:, _COL["blocklisted"]] = blocklist.match_urls(parsed) | np.fromiter(
+            (blocklist.match_host(p[2]) is not None for p in parsed), dtype=bool, count=n
+        )
+    return X, hosts
+
+
+def extract_features(urls: Sequence[str]) -> np.ndarray:
+    """Matriz (n × len(FEATURES)) de features das URLs."""
+    _ensure_loaded()
+    if not urls:
+        return np.empty((0, len(FEATURES)))
+    return np.concatenate([
+        _feature_chunk(urls[i:i + _CHUNK_ROWS])[0] for i in range(0, len(urls), _CHUNK_ROWS)
+    ])
+
+
+# ---------------------------------------------------------------------------
+# Score
+# ---------------------------------------------------------------------------
+
+def _verdicts(scores: np.ndarray) -> np.ndarray:
+    """0 = legitimate, 1 = suspicious, 2 = phishing."""
+    return (scores >= _MODEL.suspicious).astype(np.int8) + (scores >= _MODEL.phishing)
+
+
+def score_batch(urls: Sequence[str]) -> Dict[str, list]:
+    """
+    Score de cada URL, em colunas (na ordem de entrada): ``scores`` (0–1),
+    ``verdicts``, ``domains`` (domínio registrável, ou o host quando é IP) e
+    ``blocklisted`` (host ou URL na lista de bloqueio).
+    """
+    _ensure_loaded()
+    scores: List[np.ndarray] = []
+    blocked: List[np.ndarray] = []
+    domains: List[Optional[str]] = []
+    for i in range(0, len(urls), _CHUNK_ROWS):
+        X, hosts = _feature_chunk(urls[i:i + _CHUNK_ROWS])
+        scores.append(1.0 / (1.0 + np.exp(-(X @ _MODEL.weights + _MODEL.bias))))
+        blocked.append(X[:, _COL["blocklisted"]] > 0)
+        domains.extend(h.registrable or h.host for h in hosts)
+    all_scores = np.concatenate(scores) if scores else np.empty(0)
+    return {
+        "scores": np.round(all_scores, 4).tolist(),
+        "verdicts": [VERDICTS[v] for v in _verdicts(all_scores)],
+        "domains": domains,
+        "blocklisted": np.concatenate(blocked).tolist() if blocked else [],
+    }
+
+
+def analyze_url(url: str, max_reasons: int = 5) -> dict:
+    """Análise completa de uma URL: score, veredito, features e motivos."""
+    _ensure_loaded()
+    X, hosts = _feature_chunk([url])
+    x, host = X[0], hosts[0]
+    contributions = x * _MODEL.weights
+    score = float(1.0 / (1.0 + math.exp(-(contributions.sum() + _MODEL.bias))))
+
+    brand = host.homoglyph_brand or host.brand_in_domain or host.legit_brand
+    if brand is None and x[_COL["brand_elsewhere"]]:
+        brand = next((w for w in _WORD.findall(url.lower()) if w in _VOCABULARY.brand_names), None)
+
+    blocklist_match = None
+    blocklist = current_blocklist()
+    if x[_COL["blocklisted"]] and blocklist is not None:
+        blocklist_match = blocklist.match_url(url)
+
+    reasons = []
+    for i in np.argsort(-contributions)[:max_reasons]:
+        if contributions[i] < 0.6:
+            break
+        reasons.append(_REASONS[FEATURES[i]].format(brand=brand))
+
+    return {
+        "url": url,
+        "score": round(score, 4),
+        "verdict": VERDICTS[int(_verdicts(np.array([score]))[0])],
+        "host": host.host,
+        "registrable_domain": host.registrable,
+        "public_suffix": host.suffix,
+        "brand": brand,
+        "blocklist_match": blocklist_match,
+        "features": {name: round(float(v), 4) for name, v in zip(FEATURES, x)},
+        "reasons": reasons,
+        "model_version": _MODEL.version,
+    }
@@ -0,0 +1,152 @@
+"""
+Trie da Public Suffix List (publicsuffix.org) para extrair o domínio registrável.
+
+``conta.banco.com.br`` → sufixo público ``com.br``, domínio registrável
+``banco.com.br``. As regras (inclusive curingas ``*.ck`` e exceções
+``!www.ck``) formam uma trie indexada pelos rótulos de trás para frente,
+guardada "achatada": um único dict caminho do nó → flags (``"br"``,
+``"br.com"``, ``"jp.kawasaki"``…), com todos os nós intermediários
+presentes. A consulta percorre no máximo um nó por rótulo do host, e carregar
+um dict plano é bem mais barato que milhares de dicts aninhados.
+
+A lista em texto (``app/data/public_suffix_list.dat``, MPL-2.0) é compilada
+no build para um ``marshal`` da tabela (``public_suffix.bin``), carregado
+sem parse; sem o .bin, a tabela é montada do texto no primeiro uso. As
+regras IDN entram nas duas formas (Unicode e ``xn--``), então o host pode ser
+consultado em qualquer uma.
+
+Uso (a partir de backend/):
+    python -m app.services.public_suffix app/data/public_suffix.bin
+"""
+import argparse
+import marshal
+import os
+import tempfile
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+
+_DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+_PSL_FILE = os.path.join(_DATA_DIR, "public_suffix_list.dat")
+_PSL_BIN = os.path.join(_DATA_DIR, "public_suffix.bin")
+
+# flags de cada nó
+_END = 1         # uma regra termina aqui (o caminho é um sufixo público)
+_WILDCARD = 2    # regra "*.<caminho>": qualquer filho é sufixo público
+_EXCEPTION = 4   # regra "!<caminho>": o caminho é registrável
+
+_TRIE: Optional[Dict[str, int]] = None
+_LOCK = threading.Lock()
+
+
+def build_trie(psl_path: str = _PSL_FILE) -> Dict[str, int]:
+    """Tabela caminho → flags das regras da lista (ICANN e privadas)."""
+    nodes: Dict[str, int] = {}
+    with open(psl_path, encoding="utf-8") as f:
+        for raw in f:
+            rule = raw.split(None, 1)[0] if raw.strip() else ""
+            if not rule or rule.startswith("//"):
+                continue
+            flag = _END
+            if rule.startswith("!"):
+                flag, rule = _EXCEPTION, rule[1:]
+            labels = rule.lower().split(".")[::-1]
+            if labels[-1] == "*":
+                flag, labels = _WILDCARD, labels[:-1]
+            variants = [labels]
+            if not rule.isascii():
+                # a lista traz as regras IDN em Unicode; o host pode vir em punycode
+                variants.append([to_ascii_label(label) for label in labels])
+            for variant in variants:
+                path = ""
+                for label in variant:
+                    path = f"{path}.{label}" if path else label
+                    nodes.setdefault(path, 0)
+                nodes[path] |= flag
+    return nodes
+
+
+def to_ascii_label(label: str) -> str:
+    """Rótulo Unicode → forma ``xn--`` (punycode); rótulos ASCII ficam iguais."""
+    if label.isascii():
+        return label
+    return "xn--" + label.encode("punycode").decode("ascii")
+
+
+def compile_trie(dest_path: str, psl_path: str = _PSL_FILE) -> int:
+    """Grava a tabela em ``dest_path`` (troca atômica); retorna o nº de bytes."""
+    data = marshal.dumps(build_trie(psl_path))
+    dest_dir = os.path.dirname(os.path.abspath(dest_path))
+    fd, partial = tempfile.mkstemp(dir=dest_dir)
+    with os.fdopen(fd, "wb") as out:
+        out.write(data)
+    os.replace(partial, dest_path)
+    return len(data)
+
+
+def _trie() -> Dict[str, int]:
+    global _TRIE
+    if _TRIE is None:
+        with _LOCK:
+            if _TRIE is None:
+                compiled = os.path.exists(_PSL_BIN) and (
+                    os.path.getmtime(_PSL_BIN) >= os.path.getmtime(_PSL_FILE)
+                )
+                if compiled:
+                    with open(_PSL_BIN, "rb") as f:
+                        _TRIE = marshal.loads(f.read())
+                else:
+                    _TRIE = build_trie()
+    return _TRIE
+
+
+def suffix_length(labels: Sequence[str]) -> int:
+    """
+    Quantos rótulos finais de ``labels`` (host já separado por ".") formam o
+    sufixo público. Sem regra conhecida vale a regra implícita ``*`` (1).
+    """
+    nodes = _trie()
+    length = 1
+    path = ""
+    parent = 0
+    for i in range(len(labels)):
+        label = labels[-1 - i]
+        path = f"{path}.{label}" if path else label
+        flags = nodes.get(path)
+        if flags is not None and flags & _EXCEPTION:
+            return i   # exceção: este rótulo já é registrável
+        if parent & _WILDCARD:
+            length = i + 1
+        if flags is None:
+            break
+        if flags & _END:
+            length = i + 1
+        parent = flags
+    return length
+
+
+def split_host(host: str) -> Tuple[str, Optional[str], str]:
+    """
+    (subdomínio, domínio registrável, sufixo público) de um host em
+    minúsculas. Domínio registrável é None quando o host é o próprio sufixo.
+    """
+    labels = host.split(".")
+    n = suffix_length(labels)
+    if n >= len(labels):
+        return "", None, host
+    suffix = ".".join(labels[len(labels) - n:])
+    registrable = ".".join(labels[len(labels) - n - 1:])
+    subdomain = ".".join(labels[: len(labels) - n - 1])
+    return subdomain, registrable, suffix
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Compila a Public Suffix List em uma trie binária.")
+    parser.add_argument("dest", help="arquivo de saída (ex.: app/data/public_suffix.bin)")
+    parser.add_argument("--psl", default=_PSL_FILE, help="public_suffix_list.dat")
+    args = parser.parse_args(argv)
+    size = compile_trie(args.dest, args.psl)
+    print(f"trie da PSL ({size} bytes) gravada em {args.dest}")
+
+
+if __name__ == "__main__":
+    main()
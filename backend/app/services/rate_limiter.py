@@ -0,0 +1,280 @@
+"""
+Limite de requisições por cliente e por rota (token bucket).
+
+Cada par (rota, cliente) tem um balde de ``burst`` fichas que se recarrega a
+``rate`` fichas por segundo; cada requisição gasta uma ficha e, com o balde
+vazio, é recusada com o tempo até a próxima ficha (``Retry-After``).
+
+O balde é guardado como um único número: o instante em que ele estará cheio
+de novo (formulação GCRA do token bucket). Consumir é O(1) — ``cheio_em =
+max(cheio_em, agora) + 1/rate``, aceito se não passar de ``agora +
+burst/rate`` — e um balde cujo instante já passou está cheio: esquecê-lo não
+muda nada. É isso que permite a tabela limitada com despejo de ociosos.
+
+Backends:
+  - ``MemoryBuckets`` : por processo; ``shards`` dicionários ordenados (um lock
+                        cada), com no máximo ``max_clients`` baldes no total.
+                        Os menos recentes saem primeiro — os ociosos (cheios)
+                        a cada consulta, e o mais antigo quando o shard lota.
+  - ``SharedBuckets`` : tabela de tamanho fixo num arquivo mapeado em memória
+                        (ex.: ``/dev/shm``), compartilhada entre os workers do
+                        uvicorn; cada shard é protegido por um lock ``fcntl``
+                        em um byte do arquivo. Sondagem linear limitada: o
+                        cliente novo ocupa um slot livre/ocioso ou, na falta,
+                        o mais perto de encher. Os instantes são do relógio
+                        monotônico, que recomeça a cada boot: o cabeçalho
+                        guarda o boot id do kernel e a tabela é zerada quando
+                        ele muda (arquivo fora de tmpfs que sobreviveu a um
+                        reboot).
+
+Formato de RATE_LIMITS: ``<rota>=<n>/<s|min|h>[:<rajada>]`` separados por
+vírgula, ex. ``/api/password/analyze=5/s:20,/api/password/export=6/min:2``
+(rajada padrão: n).
+"""
+import fcntl
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+
+_PERIODS = {"s": 1.0, "min": 60.0, "h": 3600.0}
+_IDLE_EVICTIONS = 2                     # ociosos despejados por consulta (O(1))
+
+_MAGIC = b"CSRL"
+_VERSION = 2
+_HEADER = struct.Struct("<4sHHII16s")   # magic, versão, reservado, shards, slots por shard, boot id
+_GEOMETRY = struct.calcsize("<4sHHII")  # prefixo do cabeçalho que precisa bater entre os workers
+_BOOT_ID_PATH = "/proc/sys/kernel/random/boot_id"
+_SLOT = struct.Struct("<Qd")            # chave (hash de 64 bits, 0 = livre), cheio_em
+_PROBES = 8                             # slots sondados por consulta no backend compartilhado
+
+
+class RateLimit(NamedTuple):
+    """Limite de uma rota: ``rate`` fichas por segundo, balde de ``burst`` fichas."""
+    rate: float
+    burst: float
+
+    @property
+    def interval(self) -> float:
+        return 1.0 / self.rate
+
+    @property
+    def tolerance(self) -> float:
+        """Quanto o instante de balde cheio pode estar à frente de agora."""
+        return self.burst / self.rate
+
+
+def parse_limits(spec: str) -> Dict[str, RateLimit]:
+    """``"/rota=5/s:20,..."`` → {rota: RateLimit}; ValueError se mal formado."""
+    limits: Dict[str, RateLimit] = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        route, sep, rule = item.rpartition("=")
+        amount, _, burst = rule.partition(":")
+        count, _, period = amount.partition("/")
+        try:
+            count_value = float(count)
+            burst_value = float(burst) if burst else count_value
+            seconds = _PERIODS[period.strip()]
+        except (KeyError, ValueError):
+            raise ValueError(f"Limite inválido em RATE_LIMITS: '{item}' (use rota=N/s|min|h[:rajada]).")
+        if not sep or not route.strip() or count_value <= 0 or burst_value < 1:
+            raise ValueError(f"Limite inválido em RATE_LIMITS: '{item}' (use rota=N/s|min|h[:rajada]).")
+        limits[route.strip()] = RateLimit(count_value / seconds, burst_value)
+    return limits
+
+
+# ---------------------------------------------------------------------------
+# Backend em memória (por processo)
+# ---------------------------------------------------------------------------
+
+class MemoryBuckets:
+    """Baldes em ``shards`` dicionários ordenados pelo último uso, com limite total."""
+
+    def __init__(self, max_clients: int, shards: int = 64):
+        self._shards: List["OrderedDict[Hashable, float]"] = [OrderedDict() for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._capacity = max(1, max_clients // shards)
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return sum(map(len, self._shards))
+
+    def take(self, key: Hashable, limit: RateLimit, now: float) -> float:
+        """Gasta uma ficha do balde de ``key``: 0.0 se aceito, senão segundos até a próxima."""
+        index = hash(key) % len(self._shards)
+        shard = self._shards[index]
+        with self._locks[index]:
+            full_at = shard.get(key, now)
+            due = (full_at if full_at > now else now) + limit.interval
+            wait = due - now - limit.tolerance
+            if wait > 0:
+                return wait
+            shard[key] = due
+            shard.move_to_end(key)
+            # o menos recente primeiro: ocioso (já cheio) sai sem perda; tabela lotada, sai de qualquer jeito
+            for _ in range(_IDLE_EVICTIONS):
+                oldest, oldest_full_at = next(iter(shard.items()))
+                if oldest_full_at > now and len(shard) <= self._capacity:
+                    break
+                del shard[oldest]
+                self.evicted += 1
+        return 0.0
+
+
+# ---------------------------------------------------------------------------
+# Backend compartilhado entre processos (arquivo mapeado + fcntl)
+# ---------------------------------------------------------------------------
+
+def _boot_id() -> bytes:
+    """Identificador do boot atual (Linux); zeros onde não existe — aí use um tmpfs."""
+    try:
+        with open(_BOOT_ID_PATH, encoding="ascii") as f:
+            return uuid.UUID(f.read().strip()).bytes
+    except (OSError, ValueError):
+        return bytes(16)
+
+
+def _fingerprint(key: Tuple[str, str]) -> int:
+    """Hash estável entre processos (o ``hash()`` do Python muda a cada processo)."""
+    digest = hashlib.blake2b("\0".join(key).encode("utf-8", "surrogatepass"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class SharedBuckets:
+    """Tabela de baldes de tamanho fixo num arquivo compartilhado pelos workers."""
+
+    def __init__(self, path: str, max_clients: int, shards: int = 64):
+        self.path = path
+        self._shards = shards
+        self._slots = max(_PROBES, math.ceil(max_clients / shards))
+        size = _HEADER.size + shards * self._slots * _SLOT.size
+        header = _HEADER.pack(_MAGIC, _VERSION, 0, shards, self._slots, _boot_id())
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # o primeiro worker cria a tabela; os demais conferem a geometria
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(self._fd).st_size == 0:
+                    os.ftruncate(self._fd, size)
+                    os.pwrite(self._fd, header, 0)
+                else:
+                    stored = os.pread(self._fd, _HEADER.size, 0)
+                    if stored[:_GEOMETRY] != header[:_GEOMETRY] or os.fstat(self._fd).st_size != size:
+                        raise ValueError(
+                            f"Tabela de limites em {path} tem outro formato (RATE_LIMIT_MAX_CLIENTS/"
+                            "RATE_LIMIT_SHARDS mudaram?); apague o arquivo com o serviço parado."
+                        )
+                    if stored != header:
+                        # outro boot: os instantes gravados são do relógio monotônico antigo
+                        os.ftruncate(self._fd, 0)
+                        os.ftruncate(self._fd, size)
+                        os.pwrite(self._fd, header, 0)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+            self._mm = mmap.mmap(self._fd, size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+        # locks fcntl são por processo: threads do mesmo worker se excluem aqui
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        total = 0
+        for offset in range(_HEADER.size, len(self._mm), _SLOT.size):
+            total += _SLOT.unpack_from(self._mm, offset)[0] != 0
+        return total
+
+    def take(self, key: Tuple[str, str], limit: RateLimit, now: float) -> float:
+        """Como ``MemoryBuckets.take``; ``now`` deve ser ``time.monotonic()`` (relógio do sistema)."""
+        fingerprint = _fingerprint(key)
+        shard = fingerprint % self._shards
+        base = _HEADER.size + shard * self._slots * _SLOT.size
+        start = (fingerprint >> 32) % self._slots
+        mm, slot = self._mm, _SLOT
+
+        with self._locks[shard]:
+            # byte ``shard`` do arquivo como lock do shard entre os workers
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, shard)
+            try:
+                target, full_at, victim_full_at = -1, now, math.inf
+                for probe in range(_PROBES):
+                    offset = base + ((start + probe) % self._slots) * slot.size
+                    stored, stored_full_at = slot.unpack_from(mm, offset)
+                    if stored == fingerprint:
+                        target, full_at = offset, stored_full_at
+                        break
+                    if stored == 0 or stored_full_at <= now:
+                        # livre ou ocioso: reaproveitar não perde nada
+                        if victim_full_at > -math.inf:
+                            target, victim_full_at = offset, -math.inf
+                    elif stored_full_at < victim_full_at:
+                        target, victim_full_at = offset, stored_full_at
+                else:
+                    if victim_full_at > -math.inf:
+                        self.evicted += 1
+
+                due = (full_at if full_at > now else now) + limit.interval
+                wait = due - now - limit.tolerance
+                if wait > 0:
+                    return wait
+                slot.pack_into(mm, target, fingerprint, due)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, shard)
+        return 0.0
+
+    def close(self) -> None:
+        self._mm.close()
+        os.close(self._fd)
+
+
+# ---------------------------------------------------------------------------
+# Limitador
+# ---------------------------------------------------------------------------
+
+class RateLimiter:
+    """Limites por rota sobre um backend de baldes, com contadores para as métricas."""
+
+    def __init__(self, limits: Dict[str, RateLimit], buckets):
+        self.limits = limits
+        self.buckets = buckets
+        self._counts = {route: [0, 0] for route in limits}   # aceitas, recusadas
+
+    def check(self, route: str, client: str, now: Optional[float] = None) -> float:
+        """0.0 se a requisição de ``client`` em ``route`` passa; senão segundos de espera."""
+        limit = self.limits.get(route)
+        if limit is None:
+            return 0.0
+        wait = self.buckets.take((route, client), limit, time.monotonic() if now is None else now)
+        self._counts[route][wait > 0] += 1
+        return wait
+
+    def counts(self) -> Dict[str, Tuple[int, int]]:
+        """(aceitas, recusadas) por rota desde o startup (deste processo)."""
+        return {route: (allowed, limited) for route, (allowed, limited) in self._counts.items()}
+
+
+def build_limiter() -> Optional[RateLimiter]:
+    """Limitador configurado em RATE_LIMITS (None = sem limites)."""
+    limits = parse_limits(settings.RATE_LIMITS)
+    if not limits:
+        return None
+    if settings.RATE_LIMIT_SHARED_PATH:
+        buckets = SharedBuckets(
+            settings.RATE_LIMIT_SHARED_PATH, settings.RATE_LIMIT_MAX_CLIENTS, settings.RATE_LIMIT_SHARDS
+        )
+    else:
+        buckets = MemoryBuckets(settings.RATE_LIMIT_MAX_CLIENTS, settings.RATE_LIMIT_SHARDS)
+    return RateLimiter(limits, buckets)
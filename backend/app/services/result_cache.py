@@ -0,0 +1,118 @@
+"""
+Cache LRU + TTL em processo para os resultados do /api/password/analyze.
+
+Retentativas, backspace-e-redigita e senhas fracas idênticas ("123456")
+repetem a mesma análise. O cache guarda o corpo JSON já serializado, então
+um acerto pula tanto o validador quanto a validação/serialização do Pydantic.
+
+A chave é um HMAC-SHA256 da senha (e da política, fora da padrão) com
+``settings.SECRET_KEY`` — nenhuma senha em texto puro fica na memória como
+chave de dict. O cache é limpo a
+cada recarga da blocklist/índice de vazamentos.
+"""
+import hashlib
+import hmac
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.core.config import settings
+from app.services.password_validator import on_blocklists_reload
+
+
+class ResultCache:
+
+    def __init__(self, secret: str, max_entries: int, max_bytes: int, ttl: float):
+        self._secret = secret.encode("utf-8")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def _key(self, password: str, scope: str = "") -> bytes:
+        data = password.encode("utf-8", "surrogatepass")
+        if scope:
+            data = scope.encode("utf-8") + b"\0" + data
+        return hmac.new(self._secret, data, hashlib.sha256).digest()
+
+    def get(self, password: str, scope: str = "") -> Optional[bytes]:
+        """
+        Corpo serializado em cache, ou None (miss/expirado/desativado).
+        ``scope`` separa resultados da mesma senha sob políticas diferentes.
+        """
+        if not self.enabled:
+            return None
+        key = self._key(password, scope)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, body = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def put(self, password: str, body: bytes, scope: str = "") -> None:
+        if not self.enabled or len(body) > self.max_bytes:
+            return
+        key = self._key(password, scope)
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl, body)
+        self._bytes += len(body)
+        # despeja os menos usados até caber nos limites
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, old) = self._entries.popitem(last=False)
+            self._bytes -= len(old)
+            self.evictions += 1
+
+    def _remove(self, key: bytes) -> None:
+        _, body = self._entries.pop(key)
+        self._bytes -= len(body)
+
+    def clear(self) -> None:
+        """Invalida tudo (ex.: blocklist recarregada)."""
+        self._entries.clear()
+        self._bytes = 0
+        self.invalidations += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+analysis_cache = ResultCache(
+    settings.SECRET_KEY,
+    max_entries=settings.ANALYZE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.ANALYZE_CACHE_MAX_BYTES,
+    ttl=settings.ANALYZE_CACHE_TTL_SECONDS,
+)
+on_blocklists_reload(analysis_cache.clear)
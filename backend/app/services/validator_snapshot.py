@@ -0,0 +1,166 @@
+"""
+Snapshot binário versionado dos dados do validador de senha.
+
+Montar o ``set`` da lista de senhas comuns e a trie do estimador de
+tentativas a partir dos .txt custa segundos com listas reais — e isso
+acontecia na importação, a cada deploy e a cada worker novo. O snapshot é
+gerado uma vez no build (Dockerfile) e, na subida, só o cabeçalho e a tabela
+de seções são lidos:
+
+  - ``blocklist`` : imagem da blocklist compilada (mesmo formato de
+                    ``blocklist.py``), consultada direto no mmap — zero parse
+  - ``guess_trie``: trie do dicionário do estimador (``marshal``), lida só no
+                    primeiro uso
+
+Formato do arquivo (little-endian):
+  - cabeçalho : magic ``CSVS``, versão do formato, nº de seções, data de
+                geração (epoch), versão do conteúdo (blake2b-128 das seções)
+                — 48 bytes
+  - seções    : N × (nome 16 bytes, offset uint64, tamanho uint64)
+  - dados     : cada seção alinhada em 4096 bytes
+
+Uso (a partir de backend/):
+    python -m app.services.validator_snapshot app/data/validator_snapshot.bin
+"""
+import argparse
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from app.services.blocklist import (
+    _DEFAULT_BLOOM_BITS_PER_KEY,
+    MmapBlocklist,
+    _iter_words,
+    build_blocklist,
+)
+from app.services.guess_estimator import build_dictionary_trie
+
+_MAGIC = b"CSVS"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHH4xQ16s8x")   # 48 bytes
+_SECTION = struct.Struct("<16sQQ")         # 32 bytes
+_ALIGN = 4096
+
+_DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+_COMMON_PASSWORDS_FILE = os.path.join(_DATA_DIR, "common_passwords.txt")
+
+BLOCKLIST_SECTION = "blocklist"
+GUESS_TRIE_SECTION = "guess_trie"
+
+
+# ---------------------------------------------------------------------------
+# Build (offline)
+# ---------------------------------------------------------------------------
+
+def build_snapshot(
+    dest_path: str,
+    common_passwords_path: str = _COMMON_PASSWORDS_FILE,
+    bloom_bits_per_key: int = _DEFAULT_BLOOM_BITS_PER_KEY,
+) -> str:
+    """Gera o snapshot em ``dest_path`` (troca atômica) e retorna a versão."""
+    dest_dir = os.path.dirname(os.path.abspath(dest_path))
+    with tempfile.TemporaryDirectory(dir=dest_dir) as tmp:
+        blocklist_path = os.path.join(tmp, "blocklist.bin")
+        words = _iter_words(common_passwords_path) if os.path.exists(common_passwords_path) else ()
+        build_blocklist(words, blocklist_path, bloom_bits_per_key)
+        with open(blocklist_path, "rb") as f:
+            blocklist = f.read()
+
+        sections = [
+            (BLOCKLIST_SECTION, blocklist),
+            (GUESS_TRIE_SECTION, marshal.dumps(build_dictionary_trie(common_passwords_path))),
+        ]
+        digest = hashlib.blake2b(digest_size=16)
+        for name, data in sections:
+            digest.update(name.encode())
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+
+        partial = os.path.join(tmp, "snapshot.bin")
+        with open(partial, "wb") as out:
+            out.write(_HEADER.pack(
+                _MAGIC, _FORMAT_VERSION, len(sections), int(time.time()), digest.digest()
+            ))
+            offset = _HEADER.size + _SECTION.size * len(sections)
+            table = []
+            for name, data in sections:
+                offset = -(-offset // _ALIGN) * _ALIGN
+                table.append((name, offset, len(data)))
+                offset += len(data)
+            for name, start, size in table:
+                out.write(_SECTION.pack(name.encode(), start, size))
+            for (_, start, _), (_, data) in zip(table, sections):
+                out.write(b"\x00" * (start - out.tell()))
+                out.write(data)
+        os.replace(partial, dest_path)
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Leitura
+# ---------------------------------------------------------------------------
+
+class ValidatorSnapshot:
+    """Cabeçalho e seções do snapshot; os dados ficam no mmap até serem usados."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, fmt, count, created_at, version = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or fmt != _FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"Snapshot do validador inválido ou de versão incompatível: {path}")
+
+        self.version = version.hex()
+        self.created_at = datetime.fromtimestamp(created_at, tz=timezone.utc)
+        self._sections: Dict[str, Tuple[int, int]] = {}
+        for i in range(count):
+            name, start, size = _SECTION.unpack_from(self._mm, _HEADER.size + i * _SECTION.size)
+            self._sections[name.rstrip(b"\x00").decode()] = (start, size)
+
+    def blocklist(self, use_bloom: bool = True) -> MmapBlocklist:
+        """Blocklist consultada direto na seção do arquivo (sem cópia nem parse)."""
+        start, _ = self._sections[BLOCKLIST_SECTION]
+        return MmapBlocklist(self.path, use_bloom=use_bloom, offset=start)
+
+    def guess_trie(self) -> dict:
+        start, size = self._sections[GUESS_TRIE_SECTION]
+        return marshal.loads(self._mm[start : start + size])
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+def open_snapshot(path: Optional[str]) -> Optional[ValidatorSnapshot]:
+    """Abre o snapshot configurado; ``None`` se não existir (usa os .txt)."""
+    if path and os.path.exists(path):
+        return ValidatorSnapshot(path)
+    return None
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Gera o snapshot binário dos dados do validador.")
+    parser.add_argument("dest", help="arquivo de saída (ex.: app/data/validator_snapshot.bin)")
+    parser.add_argument(
+        "--common-passwords", default=_COMMON_PASSWORDS_FILE,
+        help="lista de senhas comuns, uma por linha",
+    )
+    parser.add_argument(
+        "--bloom-bits", type=int, default=_DEFAULT_BLOOM_BITS_PER_KEY,
+        help="bits do filtro de Bloom por chave (0 desativa)",
+    )
+    args = parser.parse_args(argv)
+    version = build_snapshot(args.dest, args.common_passwords, args.bloom_bits)
+    print(f"snapshot {version} gravado em {args.dest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Verificação de manifesto sobre uma árvore sintética (muitos arquivos pequenos
+e alguns grandes), em três rodadas:
+  - 1 thread      : sem paralelismo
+  - pool          : default_workers() threads, maiores primeiro
+  - com cache     : segunda passada com o cache (caminho, tamanho, mtime)
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_checksum_manifest --files 20000 --large-mb 256
+"""
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.checksum_manifest import (  # noqa: E402
+    DigestCache,
+    default_workers,
+    parse_manifest,
+    verify_manifest,
+)
+
+
+def _build_tree(root: str, files: int, large_mb: int) -> str:
+    lines = []
+    for i in range(files):
+        rel = f"d{i % 100:02d}/f{i}.bin"
+        data = os.urandom(512 + i % 8192)
+        os.makedirs(os.path.join(root, os.path.dirname(rel)), exist_ok=True)
+        with open(os.path.join(root, rel), "wb") as f:
+            f.write(data)
+        lines.append(f"{hashlib.sha256(data).hexdigest()}  {rel}")
+    block = os.urandom(1024 * 1024)
+    for i in range(2):
+        rel = f"large{i}.iso"
+        digest = hashlib.sha256()
+        with open(os.path.join(root, rel), "wb") as f:
+            for _ in range(large_mb):
+                f.write(block)
+                digest.update(block)
+        lines.append(f"{digest.hexdigest()}  {rel}")
+    return "\n".join(lines) + "\n"
+
+
+def _run(entries, root, workers=0, cache=None) -> dict:
+    summary = {}
+    for event in verify_manifest(entries, root, workers=workers, cache=cache):
+        if event["event"] == "summary":
+            summary = event
+    assert summary["ok"] == summary["total"], summary
+    return summary
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Vazão da verificação de manifestos.")
+    parser.add_argument("--files", type=int, default=20_000)
+    parser.add_argument("--large-mb", type=int, default=256,
+                        help="tamanho de cada um dos 2 arquivos grandes")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        manifest = _build_tree(root, args.files, args.large_mb)
+        entries = parse_manifest(manifest, manifest_name="SHA256SUMS")
+        cache = DigestCache(os.path.join(root, "cache.db"))
+        rows = []
+        for label, workers, use_cache in (
+            ("1 thread", 1, False),
+            (f"pool ({default_workers()} threads)", 0, False),
+            ("pool, preenchendo cache", 0, True),
+            ("com cache", 0, True),
+        ):
+            started = time.perf_counter()
+            summary = _run(entries, root, workers, cache if use_cache else None)
+            rows.append((label, time.perf_counter() - started, summary))
+        cache.close()
+
+    total_mb = rows[0][2]["bytes_total"] / 1e6
+    print(f"{len(entries)} arquivos, {total_mb:.0f} MB (cache de páginas quente)")
+    print(f"{'rodada':<30}{'s':>8}{'MB/s':>10}{'do cache':>10}")
+    for label, elapsed, summary in rows:
+        print(f"{label:<30}{elapsed:>8.2f}{summary['bytes_total'] / elapsed / 1e6:>10.0f}"
+              f"{summary['cached']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Latência do estimador de tentativas (guess_estimator) em senhas de 128 caracteres.
+
+O estimador roda a cada tecla no canal /live, então o p99 precisa caber num
+orçamento fixo mesmo para entradas adversariais (dígitos repetidos, l33t
+ambíguo, palavras coladas). O script mede cada corpus e termina com código 1
+se algum p99 passar do orçamento.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_guess_estimator
+    python -m benchmarks.bench_guess_estimator --budget-ms 10 --samples 2000
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.guess_estimator import (  # noqa: E402
+    _KEY_AT, _KEY_POSITION, _KEYBOARD_DIRECTIONS, estimate_guesses,
+)
+
+_LENGTH = 128
+_DEFAULT_BUDGET_MS = 15.0
+
+
+def _keyboard_walk(rng: random.Random) -> str:
+    """Caminho no teclado que muda de direção a cada tecla (pior caso de curvas)."""
+    keys = [rng.choice(list(_KEY_AT.values()))]
+    last = None
+    while len(keys) < _LENGTH:
+        x, y = _KEY_POSITION[keys[-1]]
+        steps = [
+            (d, _KEY_AT[(x + dx, y + dy)]) for d, (dx, dy) in enumerate(_KEYBOARD_DIRECTIONS)
+            if d != last and (x + dx, y + dy) in _KEY_AT
+        ]
+        last, key = rng.choice(steps)
+        keys.append(key)
+    return "".join(keys)
+
+
+def _corpora(rng: random.Random):
+    printable = string.ascii_letters + string.digits + string.punctuation
+    return {
+        "aleatória": lambda: "".join(rng.choice(printable) for _ in range(_LENGTH)),
+        "palavras+datas": lambda: "".join(
+            rng.choice(["Password", "senha", "2024", "19/05/1990", "qwerty", "amor", "!"])
+            for _ in range(_LENGTH)
+        )[:_LENGTH],
+        "l33t ambíguo": lambda: "".join(rng.choice("1l!|iI0o@a4$s5") for _ in range(_LENGTH)),
+        "dígitos": lambda: "".join(rng.choice("0123456789") for _ in range(_LENGTH)),
+        "repetição": lambda: rng.choice("1a!") * _LENGTH,
+        "teclado": lambda: ("1qaz2wsx3edc4rfv" * 8)[:_LENGTH],
+        "teclado curvas": lambda: _keyboard_walk(rng),
+        "zigue-zague": lambda: "qw" * (_LENGTH // 2),
+        "unicode": lambda: "".join(rng.choice("çãõéüß密码Ωж٣") for _ in range(_LENGTH)),
+    }
+
+
+def _percentile(sorted_values, pct: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=_DEFAULT_BUDGET_MS)
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    estimate_guesses("aquecimento")   # caches de combinatória/datas
+
+    print(f"{'corpus':<16}{'p50 (ms)':>10}{'p99 (ms)':>10}{'max (ms)':>10}")
+    failed = False
+    for name, make in _corpora(rng).items():
+        inputs = [make() for _ in range(args.samples)]
+        timings = []
+        for password in inputs:
+            start = time.perf_counter()
+            estimate_guesses(password)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        p99 = _percentile(timings, 99)
+        failed |= p99 > args.budget_ms
+        print(f"{name:<16}{_percentile(timings, 50):>10.3f}{p99:>10.3f}{timings[-1]:>10.3f}")
+
+    verdict = "ESTOUROU" if failed else "ok"
+    print(f"\norçamento p99: {args.budget_ms} ms — {verdict}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Vazão e memória do cálculo de hashes em passada única (/api/hash/compute).
+
+Compara, sobre um stream em memória entregue em pedaços de 64 KiB (o que o
+servidor ASGI repassa ao app):
+  - sequencial : todos os algoritmos, um após o outro, na mesma thread
+  - pool       : hash_stream — um algoritmo por thread, recebendo o próximo
+                 bloco enquanto o anterior é processado
+  - limite     : só o algoritmo mais lento (teto teórico do pool)
+
+Depois mede o pico de memória (tracemalloc) de hash_stream para tamanhos
+crescentes de arquivo — deve ficar constante (~2 blocos).
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_hash --size-mb 256
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.config import settings  # noqa: E402
+from app.services.hash_checker import ALGORITHMS, MultiHasher, hash_stream, shutdown_pool  # noqa: E402
+
+_PIECE = 64 * 1024
+
+
+async def _pieces(block: bytes, total: int):
+    sent = 0
+    while sent < total:
+        piece = block[: min(_PIECE, total - sent)]
+        sent += len(piece)
+        yield piece
+
+
+def _sequential(block: bytes, total: int) -> None:
+    hasher = MultiHasher(tuple(ALGORITHMS))
+    for offset in range(0, total, settings.HASH_CHUNK_SIZE):
+        hasher.update(block[: min(settings.HASH_CHUNK_SIZE, total - offset)])
+    hasher.digests()
+
+
+def _slowest(block: bytes) -> str:
+    timings = {}
+    for name, factory in ALGORITHMS.items():
+        start = time.perf_counter()
+        hasher = factory()
+        hasher.update(block[: 64 * 1024 * 1024])
+        timings[name] = time.perf_counter() - start
+    return max(timings, key=timings.get)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Vazão do cálculo de hashes em passada única.")
+    parser.add_argument("--size-mb", type=int, default=256, help="tamanho do stream simulado")
+    args = parser.parse_args(argv)
+
+    total = args.size_mb * 1024 * 1024
+    block = os.urandom(max(total, 64 * 1024 * 1024))   # reaproveitado; conteúdo não importa
+    slowest = _slowest(block)
+
+    def measure(run) -> float:
+        start = time.perf_counter()
+        run()
+        return total / (time.perf_counter() - start) / 1e6
+
+    rows = [
+        ("sequencial", measure(lambda: _sequential(block, total))),
+        ("pool", measure(lambda: asyncio.run(
+            hash_stream(_pieces(block, total), tuple(ALGORITHMS), settings.HASH_CHUNK_SIZE)
+        ))),
+        (f"limite ({slowest})", measure(
+            lambda: getattr(hashlib, slowest)(memoryview(block)[:total]).digest()
+        )),
+    ]
+    print(f"{len(ALGORITHMS)} algoritmos, {args.size_mb} MiB, blocos de "
+          f"{settings.HASH_CHUNK_SIZE // 1024} KiB, {os.cpu_count()} CPUs")
+    print(f"{'caminho':<22}{'MB/s':>10}")
+    for name, mbps in rows:
+        print(f"{name:<22}{mbps:>10.1f}")
+
+    print(f"\n{'arquivo MiB':<14}{'pico KiB':>10}")
+    for size_mb in (16, 64, args.size_mb):
+        size = size_mb * 1024 * 1024
+        tracemalloc.start()
+        asyncio.run(hash_stream(_pieces(block, size), tuple(ALGORITHMS), settings.HASH_CHUNK_SIZE))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{size_mb:<14}{peak / 1024:>10.0f}")
+    shutdown_pool()
+
+
+if __name__ == "__main__":
+    main()
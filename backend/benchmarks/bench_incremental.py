@@ -0,0 +1,121 @@
+"""
+Análise incremental (``IncrementalAnalyzer``) contra a análise completa.
+
+Simula sessões de digitação com semente — caracteres acrescentados um a um,
+backspace, colagens e edições no meio (``set``) — e mede o custo por tecla:
+  - completo    : ``validate_password`` da senha inteira a cada tecla
+  - incremental : a edição no analisador + ``result()``
+
+``--verify`` não mede nada: confere que ``result()`` é igual a
+``validate_password`` depois de cada edição de cada sessão, e termina com
+código 1 se algum divergir.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_incremental
+    python -m benchmarks.bench_incremental --verify
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services import password_validator as pv  # noqa: E402
+
+_ALPHABET = string.ascii_letters + string.digits + "!@#$%&*-_" + "çãéİ٣😀"
+_RUNS = ["abc", "123", "qwerty", "asdf", "senha", "aaa", "xyz"]
+
+
+def _sessions(n: int, rng: random.Random):
+    """Listas de edições ``(op, arg)`` no formato do canal /live."""
+    sessions = []
+    for _ in range(n):
+        edits = []
+        length = 0
+        for _ in range(rng.randint(5, 40)):
+            roll = rng.random()
+            if roll < 0.70 or length == 0:
+                text = rng.choice(_RUNS) if rng.random() < 0.15 else rng.choice(_ALPHABET)
+                edits.append(("append", text))
+                length += len(text)
+            elif roll < 0.90:
+                count = rng.randint(1, min(3, length))
+                edits.append(("delete", count))
+                length -= count
+            else:
+                # edição no meio: troca um trecho (cai no replay a partir do prefixo comum)
+                position = rng.randint(0, length)
+                edits.append(("splice", position))
+                length += position == length   # no fim, o trecho trocado é um acréscimo
+        sessions.append(edits)
+    return sessions
+
+
+def _apply(analyzer: pv.IncrementalAnalyzer, op: str, arg, rng: random.Random) -> None:
+    if op == "append":
+        analyzer.append(arg)
+    elif op == "delete":
+        analyzer.delete(arg)
+    else:
+        password = analyzer.password
+        analyzer.set(password[:arg] + rng.choice(_ALPHABET) + password[arg + 1:])
+
+
+def _verify(sessions) -> int:
+    rng = random.Random(3)
+    divergences = checked = 0
+    for edits in sessions:
+        analyzer = pv.IncrementalAnalyzer()
+        for op, arg in edits:
+            _apply(analyzer, op, arg, rng)
+            checked += 1
+            if analyzer.result() != pv.validate_password(analyzer.password):
+                divergences += 1
+                if divergences <= 5:
+                    print(f"divergência após {op}({arg!r}): {analyzer.password!r}")
+    print(f"incremental × completo: {checked:,} edições conferidas em {len(sessions):,} sessões")
+    return divergences
+
+
+def _per_edit_us(sessions, incremental: bool) -> float:
+    rng = random.Random(3)
+    edits = 0
+    started = time.perf_counter()
+    for session in sessions:
+        analyzer = pv.IncrementalAnalyzer()
+        for op, arg in session:
+            _apply(analyzer, op, arg, rng)
+            if incremental:
+                analyzer.result()
+            else:
+                pv.validate_password(analyzer.password)
+            edits += 1
+    return (time.perf_counter() - started) / edits * 1e6
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Análise incremental × completa.")
+    parser.add_argument("--sessions", type=int, default=2_000)
+    parser.add_argument("--verify", action="store_true", help="só confere incremental × completo (código 1 se divergir)")
+    args = parser.parse_args(argv)
+
+    sessions = _sessions(args.sessions, random.Random(2024))
+    pv.ensure_data_loaded()
+    if args.verify:
+        divergences = _verify(sessions)
+        print(f"divergências: {divergences}")
+        sys.exit(1 if divergences else 0)
+
+    # o custo do completo inclui as edições no analisador, para comparar só a análise
+    full = _per_edit_us(sessions, incremental=False)
+    incremental = _per_edit_us(sessions, incremental=True)
+    print(f"{'caminho':<14}{'µs/tecla':>10}")
+    print(f"{'completo':<14}{full:>10.1f}")
+    print(f"{'incremental':<14}{incremental:>10.1f}  ({full / incremental:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
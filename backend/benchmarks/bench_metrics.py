@@ -0,0 +1,95 @@
+"""
+Custo da instrumentação Prometheus por requisição.
+
+  - middleware : app ASGI mínima (só start + corpo) chamada direto, com e sem
+                 MetricsMiddleware — isola o custo de medir/rotular/contar
+  - validador  : evaluate_password sem observer, com amostragem padrão (1/64)
+                 e cronometrando toda análise (1/1)
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_metrics
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.metrics import MetricsMiddleware, observe_checks  # noqa: E402
+from app.services import password_validator as pv  # noqa: E402
+
+_REQUESTS = 200_000
+_PASSWORDS = ["Password2024!", "Tr0ub4dor&3xyz", "correcthorsebatterystaple", "abc"] * 500
+_ROUNDS = 5
+
+
+class _Route:
+    path = "/api/bench"
+
+
+_ROUTE = _Route()
+_START = {"type": "http.response.start", "status": 200, "headers": []}
+_BODY = {"type": "http.response.body", "body": b"{}"}
+
+
+async def _app(scope, receive, send):
+    scope["route"] = _ROUTE   # como o roteador do FastAPI faz
+    await send(_START)
+    await send(_BODY)
+
+
+async def _receive():
+    return {"type": "http.request"}
+
+
+async def _send(message):
+    pass
+
+
+async def _per_request_us(app) -> float:
+    scope = {"type": "http", "method": "POST", "path": "/api/bench"}
+    for _ in range(1_000):
+        await app(dict(scope), _receive, _send)
+    best = float("inf")
+    for _ in range(_ROUNDS):
+        start = time.perf_counter()
+        for _ in range(_REQUESTS // _ROUNDS):
+            await app(dict(scope), _receive, _send)
+        best = min(best, (time.perf_counter() - start) / (_REQUESTS // _ROUNDS))
+    return best * 1e6
+
+
+def _per_evaluation_us() -> float:
+    best = float("inf")
+    for _ in range(_ROUNDS):
+        start = time.perf_counter()
+        for password in _PASSWORDS:
+            pv.evaluate_password(password)
+        best = min(best, (time.perf_counter() - start) / len(_PASSWORDS))
+    return best * 1e6
+
+
+def main() -> None:
+    bare = asyncio.run(_per_request_us(_app))
+    instrumented = asyncio.run(_per_request_us(MetricsMiddleware(_app)))
+    print(f"{'middleware':<28}{'µs/req':>10}")
+    print(f"{'  sem métricas':<28}{bare:>10.2f}")
+    print(f"{'  com MetricsMiddleware':<28}{instrumented:>10.2f}")
+    print(f"{'  custo':<28}{instrumented - bare:>+10.2f}")
+
+    pv.ensure_data_loaded()
+    _per_evaluation_us()   # aquecimento (trie do estimador, caches)
+    rows = []
+    for label, sample_every in (("sem observer", 0), ("amostrado 1/64", 64), ("toda análise", 1)):
+        pv.set_check_observer(observe_checks if sample_every else None, sample_every)
+        rows.append((label, _per_evaluation_us()))
+    pv.set_check_observer(None)
+    base = rows[0][1]
+    print(f"\n{'validador':<28}{'µs/análise':>12}{'custo':>10}")
+    for label, us in rows:
+        print(f"{'  ' + label:<28}{us:>12.2f}{us - base:>+10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Pipeline de políticas de senha contra a pontuação original (antes das políticas).
+
+  - original : reprodução do ``_evaluate`` fixo de antes das políticas
+               (limiares e pesos no código, todos os checks sempre rodam)
+  - default  : ``evaluate_password`` com a política padrão do arquivo
+  - strict   : idem com ``strict`` (short_circuit: para no primeiro
+               obrigatório reprovado), se existir no arquivo
+
+``--verify`` não mede nada: confere, byte a byte, que a política ``default``
+produz a mesma resposta que a pontuação original num corpus com semente, e
+termina com código 1 se algum divergir.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_password_policy
+    python -m benchmarks.bench_password_policy --verify
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services import password_validator as pv  # noqa: E402
+from app.services.guess_estimator import estimate_guesses  # noqa: E402
+from app.services.password_policy import get_policy, policy_ids  # noqa: E402
+
+from benchmarks.bench_batch_kernel import _EDGE_CASES, _corpus  # noqa: E402
+
+
+def _legacy(password: str) -> pv.PasswordEvaluation:
+    """
+    Reprodução da pontuação original (sem política), sobre os helpers atuais.
+    Os limiares fixos de antes (12, 16 e 50 bits) entram como parâmetros das
+    mensagens, que hoje vêm da política.
+    """
+    scan = pv._scan(password)
+    patterns = pv._find_patterns(password)
+    length = scan.length
+    length_ok = length >= 12
+    length_great = length >= 16
+    is_common = password.lower() in pv._COMMON_PASSWORDS
+    breach_count = pv._breach_count(password)
+    not_breached = breach_count == 0
+    no_repeated = not pv._has_repeated_chars(password, scan)
+    no_sequential = not pv._has_sequential_chars(password, patterns)
+    no_keyboard = not pv._has_keyboard_pattern(password, patterns)
+    entropy = pv._calc_entropy(password, scan)
+    guesses_log10 = round(estimate_guesses(password).guesses_log10, 2)
+
+    raw_score = (
+        (length >= 8) + length_ok + length_great
+        + scan.has_upper + scan.has_lower + scan.has_digit + scan.has_special + (not is_common)
+        + 0.5 * (no_repeated + no_sequential + no_keyboard + (entropy >= 50))
+    )
+    score = min(5, round(raw_score / 2))
+
+    tips, positive = [], []
+    if not length_ok:
+        tips.append(("length_short", (12,)))
+    elif not length_great:
+        tips.append(("length_ok", (16,)))
+    else:
+        positive.append(("length_great", (length,)))
+    for present, missing, ok in (
+        (scan.has_upper, "upper_missing", "upper_ok"),
+        (scan.has_lower, "lower_missing", "lower_ok"),
+        (scan.has_digit, "digit_missing", "digit_ok"),
+        (scan.has_special, "special_missing", "special_ok"),
+    ):
+        if present:
+            positive.append((ok, ()))
+        else:
+            tips.append((missing, ()))
+    if is_common:
+        tips.append(("common", ()))
+    else:
+        positive.append(("not_common", ()))
+    if not not_breached:
+        tips.append(("breached", (breach_count,)))
+    elif pv._BREACH_INDEX is not None:
+        positive.append(("not_breached", ()))
+    if not no_repeated:
+        tips.append(("repeated", ()))
+    else:
+        positive.append(("no_repeated", ()))
+    if not no_sequential:
+        tips.append(("sequential", (patterns[pv._SEQUENTIAL].pattern,)))
+    else:
+        positive.append(("no_sequential", ()))
+    if not no_keyboard:
+        tips.append(("keyboard", (patterns[pv._KEYBOARD].pattern,)))
+    else:
+        positive.append(("no_keyboard", ()))
+    if entropy < 50:
+        tips.append(("entropy_low", (entropy, 50)))
+    elif guesses_log10 < 10:
+        tips.append(("predictable", (entropy, guesses_log10)))
+    else:
+        positive.append(("entropy_high", (entropy,)))
+
+    checks = (
+        length_ok, length_great, scan.has_upper, scan.has_lower, scan.has_digit, scan.has_special,
+        not is_common, no_repeated, no_sequential, no_keyboard, not_breached,
+    )
+    return pv.PasswordEvaluation(
+        score, entropy, guesses_log10, is_common, breach_count, checks, tuple(tips), tuple(positive),
+    )
+
+
+def _verify(passwords) -> int:
+    """Divergências entre a política ``default`` e a pontuação original."""
+    policy = get_policy("default")
+    divergences = 0
+    for password in passwords:
+        if pv.evaluate_password(password, policy).to_json() != _legacy(password).to_json():
+            divergences += 1
+            if divergences <= 5:
+                print(f"divergência: {password!r}")
+    print(f"default × original: {len(passwords):,} senhas conferidas")
+    return divergences
+
+
+def _per_password_us(fn, passwords) -> float:
+    started = time.perf_counter()
+    for password in passwords:
+        fn(password)
+    return (time.perf_counter() - started) / len(passwords) * 1e6
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Políticas de senha × pontuação original.")
+    parser.add_argument("--passwords", type=int, default=5_000)
+    parser.add_argument("--verify", action="store_true", help="só confere default × original (código 1 se divergir)")
+    args = parser.parse_args(argv)
+
+    passwords = _EDGE_CASES + _corpus(args.passwords, random.Random(11))
+    pv.ensure_data_loaded()
+    if args.verify:
+        divergences = _verify(passwords)
+        print(f"divergências: {divergences}")
+        sys.exit(1 if divergences else 0)
+
+    print(f"{'caminho':<12}{'µs/senha':>10}")
+    print(f"{'original':<12}{_per_password_us(_legacy, passwords):>10.1f}")
+    for policy_id in policy_ids():
+        policy = get_policy(policy_id)
+        us = _per_password_us(lambda p: pv.evaluate_password(p, policy), passwords)
+        print(f"{policy_id:<12}{us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
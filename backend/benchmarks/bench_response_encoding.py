@@ -0,0 +1,91 @@
+"""
+Vazão (bytes/s) da serialização da resposta do validador.
+
+Compara três caminhos para o corpo do /analyze:
+  - response_model : dict → validação contra PasswordResponse → jsonable_encoder
+                     → json.dumps (o que o FastAPI faz ao retornar um dict)
+  - json.dumps     : dict → json.dumps compacto, sem revalidar
+  - pré-codificado : PasswordEvaluation.to_json() — fragmentos JSON em cache
+
+A tabela "só serialização" parte de avaliações já prontas (isola o custo de
+montar texto e JSON); a "ponta a ponta" inclui a análise da senha.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_response_encoding
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from app.models.password_models import PasswordResponse  # noqa: E402
+from app.services.password_validator import evaluate_password  # noqa: E402
+
+_CORPUS = [
+    "abc",
+    "123456",
+    "Password2024!",
+    "Tr0ub4dor&3xyz",
+    "correcthorsebatterystaple",
+    "çãõ-Ünïcødé-٣٤٥-senha",
+    "xK9#mW2$qL7&vB!pZ4",
+]
+_ROUNDS = 3_000
+
+
+def _via_response_model(result: dict) -> bytes:
+    model = PasswordResponse.model_validate(result)
+    return json.dumps(
+        jsonable_encoder(model), ensure_ascii=False, allow_nan=False, indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _via_json_dumps(result: dict) -> bytes:
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _measure(fn, items) -> tuple:
+    total = 0
+    start = time.perf_counter()
+    for _ in range(_ROUNDS):
+        for item in items:
+            total += len(fn(item))
+    elapsed = time.perf_counter() - start
+    return total / elapsed, _ROUNDS * len(items) / elapsed
+
+
+def _print_table(title: str, rows) -> None:
+    print(f"\n{title}")
+    print(f"{'caminho':<18}{'MB/s':>10}{'respostas/s':>14}{'ganho':>8}")
+    base = rows[0][1]
+    for name, bps, ops in rows:
+        print(f"{name:<18}{bps / 1e6:>10.2f}{ops:>14,.0f}{bps / base:>7.1f}x")
+
+
+def main() -> None:
+    evaluations = [evaluate_password(p) for p in _CORPUS]
+    for evaluation in evaluations:   # os três caminhos produzem o mesmo JSON
+        assert evaluation.to_json() == _via_json_dumps(evaluation.to_dict())
+        assert evaluation.to_json() == _via_response_model(evaluation.to_dict())
+
+    _print_table("só serialização", [
+        ("response_model", *_measure(lambda e: _via_response_model(e.to_dict()), evaluations)),
+        ("json.dumps", *_measure(lambda e: _via_json_dumps(e.to_dict()), evaluations)),
+        ("pré-codificado", *_measure(lambda e: e.to_json(), evaluations)),
+    ])
+    _print_table("ponta a ponta (análise + serialização)", [
+        ("response_model", *_measure(
+            lambda p: _via_response_model(evaluate_password(p).to_dict()), _CORPUS)),
+        ("json.dumps", *_measure(
+            lambda p: _via_json_dumps(evaluate_password(p).to_dict()), _CORPUS)),
+        ("pré-codificado", *_measure(lambda p: evaluate_password(p).to_json(), _CORPUS)),
+    ])
+
+
+if __name__ == "__main__":
+    main()
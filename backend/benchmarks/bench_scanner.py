@@ -0,0 +1,65 @@
+"""
+Benchmark do scanner de classes de caracteres do validador de senha.
+
+Compara o caminho antigo (um ``re.search`` por classe em validate_password,
+mais os mesmos quatro em _charset_size e outro em _has_repeated_chars)
+com o scanner de passagem única (_scan) que alimenta checks e entropia.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_scanner
+"""
+import re
+import sys
+import os
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.password_validator import _calc_entropy, _scan  # noqa: E402
+
+_CORPUS = [
+    "abc",
+    "Password2024!",
+    "Tr0ub4dor&3xyz",
+    "correcthorsebatterystaple",
+    "çãõ-Ünïcødé-٣٤٥-senha",
+    "aaaaaaaaaaaaaaaa" * 4,
+]
+_NUMBER = 100_000
+
+
+def _legacy(password: str):
+    """Reprodução do caminho por regex (antes do scanner)."""
+    has_upper = bool(re.search(r"[A-Z]", password))
+    has_lower = bool(re.search(r"[a-z]", password))
+    has_digit = bool(re.search(r"\d", password))
+    has_special = bool(re.search(r"[^a-zA-Z0-9]", password))
+    size = 0
+    if re.search(r"[a-z]", password):
+        size += 26
+    if re.search(r"[A-Z]", password):
+        size += 26
+    if re.search(r"\d", password):
+        size += 10
+    if re.search(r"[^a-zA-Z0-9]", password):
+        size += 32
+    repeated = bool(re.search(r"(.)\1{2,}", password))
+    return has_upper, has_lower, has_digit, has_special, max(size, 1), repeated
+
+
+def _single_pass(password: str):
+    scan = _scan(password)
+    return scan, _calc_entropy(password, scan), scan.max_run >= 3
+
+
+def main() -> None:
+    print(f"{'entrada':<28}{'len':>5}{'regex µs':>12}{'scan µs':>12}{'ganho':>8}")
+    for password in _CORPUS:
+        legacy = timeit.timeit(lambda: _legacy(password), number=_NUMBER) / _NUMBER * 1e6
+        single = timeit.timeit(lambda: _single_pass(password), number=_NUMBER) / _NUMBER * 1e6
+        label = password if len(password) <= 24 else password[:21] + "..."
+        print(f"{label:<28}{len(password):>5}{legacy:>12.2f}{single:>12.2f}{legacy / single:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
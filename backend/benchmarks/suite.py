@@ -0,0 +1,303 @@
+"""
+Suíte de benchmarks do validador de senha e dos endpoints HTTP.
+
+Dois níveis:
+  - micro : helpers do validador (_has_*, _calc_entropy), estimador de
+            tentativas e validate_password sobre corpora sintéticos
+            (curtas, longas, unicode, adversariais)
+  - macro : carga in-process via ASGI (httpx.ASGITransport, com o lifespan
+            do app) contra /api/password/analyze, /validate e /stats, usando
+            o banco de DATABASE_URL (Postgres local)
+
+Para cada caso: ops/s, latência p50/p99 (µs) e pico de memória alocada
+(tracemalloc, numa passada separada para não distorcer o tempo).
+
+``--save`` grava os resultados como baseline JSON; ``--compare`` roda de novo
+e termina com código 1 se algum caso piorar além do limite (queda de ops/s
+ou aumento do p99).
+
+Uso (a partir de backend/):
+    python -m benchmarks.suite --save benchmarks/baseline.json
+    python -m benchmarks.suite --compare benchmarks/baseline.json --threshold 0.15
+    python -m benchmarks.suite --only micro --quick
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import string
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Sequence
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services import password_validator as pv  # noqa: E402
+from app.services.guess_estimator import estimate_guesses  # noqa: E402
+
+_SEED = 2024
+_CORPUS_SIZE = 400
+
+
+# ---------------------------------------------------------------------------
+# Corpora sintéticos
+# ---------------------------------------------------------------------------
+
+def _corpora(rng: random.Random) -> Dict[str, List[str]]:
+    printable = string.ascii_letters + string.digits + string.punctuation
+    unicode_chars = "çãõéüßñ密码Ωжλ٣٤٥ßİ🙂"
+
+    def words(n: int) -> str:
+        return "".join(rng.choice(["senha", "Password", "2024", "qwerty", "amor", "!", "abc"])
+                       for _ in range(n))
+
+    return {
+        "short": ["".join(rng.choice(printable) for _ in range(rng.randint(1, 10)))
+                  for _ in range(_CORPUS_SIZE)],
+        "long": ["".join(rng.choice(printable) for _ in range(rng.randint(64, 256)))
+                 for _ in range(_CORPUS_SIZE)],
+        "unicode": ["".join(rng.choice(unicode_chars + string.ascii_letters)
+                            for _ in range(rng.randint(4, 64)))
+                    for _ in range(_CORPUS_SIZE)],
+        # pior caso dos matchers: repetições, sequências, l33t ambíguo, palavras coladas
+        "adversarial": [
+            rng.choice([
+                lambda: rng.choice("1a!") * rng.randint(32, 128),
+                lambda: "0123456789abcdefghijklmnopqrstuvwxyz"[: rng.randint(10, 36)] * 3,
+                lambda: "".join(rng.choice("1l!|iI0o@a4$s5") for _ in range(rng.randint(32, 128))),
+                lambda: words(rng.randint(8, 24)),
+                lambda: "".join(rng.choice(string.digits) for _ in range(128)),
+            ])()
+            for _ in range(_CORPUS_SIZE)
+        ],
+    }
+
+
+_MICRO_FUNCTIONS: Dict[str, Callable[[str], object]] = {
+    "_has_repeated_chars": pv._has_repeated_chars,
+    "_has_sequential_chars": pv._has_sequential_chars,
+    "_has_keyboard_pattern": pv._has_keyboard_pattern,
+    "_calc_entropy": pv._calc_entropy,
+    "estimate_guesses": estimate_guesses,
+    "validate_password": pv.validate_password,
+    "validate_password_json": pv.validate_password_json,
+}
+
+
+# ---------------------------------------------------------------------------
+# Medição
+# ---------------------------------------------------------------------------
+
+def _percentile(sorted_values: Sequence[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _summary(latencies_ns: List[int], elapsed_s: float, peak_bytes: int, **extra) -> dict:
+    latencies_ns.sort()
+    return {
+        "ops_per_sec": round(len(latencies_ns) / elapsed_s, 1),
+        "p50_us": round(_percentile(latencies_ns, 50) / 1000, 2),
+        "p99_us": round(_percentile(latencies_ns, 99) / 1000, 2),
+        "peak_alloc_kib": round(peak_bytes / 1024, 1),
+        "samples": len(latencies_ns),
+        **extra,
+    }
+
+
+def _peak_alloc(run: Callable[[], None]) -> int:
+    """Pico de memória alocada (bytes) durante ``run``, acima do que já existia."""
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - base)
+
+
+def run_micro(min_time: float) -> Dict[str, dict]:
+    pv.ensure_data_loaded()
+    corpora = _corpora(random.Random(_SEED))
+    results = {}
+    clock = time.perf_counter_ns
+    for fn_name, fn in _MICRO_FUNCTIONS.items():
+        for corpus_name, corpus in corpora.items():
+            for password in corpus:   # aquecimento (caches, tries lazy)
+                fn(password)
+            latencies: List[int] = []
+            start = time.perf_counter()
+            while True:
+                for password in corpus:
+                    t0 = clock()
+                    fn(password)
+                    latencies.append(clock() - t0)
+                if time.perf_counter() - start >= min_time:
+                    break
+            elapsed = sum(latencies) / 1e9
+            peak = _peak_alloc(lambda: [fn(p) for p in corpus])
+            results[f"micro.{fn_name}.{corpus_name}"] = _summary(latencies, elapsed, peak)
+    return results
+
+
+async def _macro(requests_per_case: int, concurrency: int) -> Dict[str, dict]:
+    try:
+        import httpx
+    except ImportError:
+        raise SystemExit("O benchmark macro precisa do httpx: pip install httpx")
+
+    from app.database import engine
+    from app.main import app
+
+    engine.echo = False   # o log de SQL do modo dev dominaria o tempo medido
+
+    rng = random.Random(_SEED)
+    printable = string.ascii_letters + string.digits + string.punctuation
+
+    def body() -> dict:
+        # senhas distintas: mede o caminho completo, não o cache do /analyze
+        return {"password": "".join(rng.choice(printable) for _ in range(rng.randint(8, 32)))}
+
+    cases = {
+        "analyze": ("POST", "/api/password/analyze", body),
+        "validate": ("POST", "/api/password/validate", body),
+        "stats": ("GET", "/api/password/stats", None),
+    }
+    results = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+            async def call(method, url, make_body) -> bool:
+                response = await client.request(method, url, json=make_body() if make_body else None)
+                return response.status_code < 400
+
+            for name, (method, url, make_body) in cases.items():
+                for _ in range(min(20, requests_per_case)):   # aquecimento
+                    await call(method, url, make_body)
+
+                latencies: List[int] = []
+                errors = 0
+                remaining = requests_per_case
+
+                async def worker():
+                    nonlocal remaining, errors
+                    while remaining > 0:
+                        remaining -= 1
+                        t0 = time.perf_counter_ns()
+                        ok = await call(method, url, make_body)
+                        latencies.append(time.perf_counter_ns() - t0)
+                        errors += not ok
+
+                start = time.perf_counter()
+                await asyncio.gather(*(worker() for _ in range(concurrency)))
+                elapsed = time.perf_counter() - start
+
+                tracemalloc.start()
+                try:
+                    base, _ = tracemalloc.get_traced_memory()
+                    tracemalloc.reset_peak()
+                    for _ in range(min(50, requests_per_case)):
+                        await call(method, url, make_body)
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+
+                results[f"macro.{name}"] = _summary(
+                    latencies, elapsed, max(0, peak - base),
+                    errors=errors, concurrency=concurrency,
+                )
+    return results
+
+
+def run_macro(requests_per_case: int, concurrency: int) -> Dict[str, dict]:
+    return asyncio.run(_macro(requests_per_case, concurrency))
+
+
+# ---------------------------------------------------------------------------
+# Baseline e comparação
+# ---------------------------------------------------------------------------
+
+def _metadata() -> dict:
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float, p99_threshold: float) -> List[str]:
+    """Casos que pioraram além do limite (ops/s caiu ou p99 subiu)."""
+    regressions = []
+    print(f"\n{'caso':<52}{'ops/s base':>12}{'ops/s atual':>13}{'Δ':>8}{'p99 Δ':>8}")
+    for key, now in current.items():
+        before = baseline.get(key)
+        if before is None:
+            print(f"{key:<52}{'—':>12}{now['ops_per_sec']:>13,.0f}{'novo':>8}")
+            continue
+        d_ops = now["ops_per_sec"] / before["ops_per_sec"] - 1 if before["ops_per_sec"] else 0.0
+        d_p99 = now["p99_us"] / before["p99_us"] - 1 if before["p99_us"] else 0.0
+        flag = ""
+        if d_ops < -threshold or d_p99 > p99_threshold:
+            regressions.append(key)
+            flag = "  ← regressão"
+        print(f"{key:<52}{before['ops_per_sec']:>12,.0f}{now['ops_per_sec']:>13,.0f}"
+              f"{d_ops:>+8.0%}{d_p99:>+8.0%}{flag}")
+    return regressions
+
+
+def _print_results(results: Dict[str, dict]) -> None:
+    print(f"{'caso':<52}{'ops/s':>12}{'p50 µs':>10}{'p99 µs':>10}{'pico KiB':>10}")
+    for key, r in results.items():
+        print(f"{key:<52}{r['ops_per_sec']:>12,.0f}{r['p50_us']:>10.2f}{r['p99_us']:>10.2f}"
+              f"{r['peak_alloc_kib']:>10.1f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks do validador e dos endpoints.")
+    parser.add_argument("--only", choices=("micro", "macro"))
+    parser.add_argument("--save", metavar="ARQUIVO", help="grava os resultados como baseline JSON")
+    parser.add_argument("--compare", metavar="ARQUIVO", help="compara com uma baseline JSON")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="queda máxima tolerada de ops/s (fração, padrão 0.15)")
+    parser.add_argument("--p99-threshold", type=float, default=0.50,
+                        help="aumento máximo tolerado do p99 (fração, padrão 0.50)")
+    parser.add_argument("--quick", action="store_true", help="rodada curta (menos amostras)")
+    parser.add_argument("--requests", type=int, default=2000, help="requisições por endpoint")
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    results: Dict[str, dict] = {}
+    if args.only in (None, "micro"):
+        results.update(run_micro(min_time=0.05 if args.quick else 0.3))
+    if args.only in (None, "macro"):
+        requests = min(args.requests, 300) if args.quick else args.requests
+        results.update(run_macro(requests, args.concurrency))
+
+    _print_results(results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"meta": _metadata(), "results": results}, f, indent=2, ensure_ascii=False)
+        print(f"\nbaseline gravada em {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(baseline, results, args.threshold, args.p99_threshold)
+        if regressions:
+            print(f"\n{len(regressions)} caso(s) com regressão além do limite.")
+            return 1
+        print("\nsem regressões.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
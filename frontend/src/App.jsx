@@ -2,6 +2,8 @@ import { BrowserRouter, Routes, Route } from 'react-router-dom'
 import Navbar from './components/shared/Navbar'
 import ToolSelector from './components/ToolSelector/ToolSelector'
 import PasswordValidator from './components/PasswordValidator/PasswordValidator'
+import HashChecker from './components/HashChecker/HashChecker'
+import PhishingDetector from './components/PhishingDetector/PhishingDetector'
 
 function App() {
   return (
@@ -12,6 +14,8 @@ function App() {
           <Routes>
             <Route path="/" element={<ToolSelector />} />
             <Route path="/password" element={<PasswordValidator />} />
+            <Route path="/hash" element={<HashChecker />} />
+            <Route path="/phishing" element={<PhishingDetector />} />
           </Routes>
         </main>
       </div>
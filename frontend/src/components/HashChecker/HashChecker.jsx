@@ -0,0 +1,126 @@
+import { useState } from 'react'
+import { computeHashes } from '../../services/api'
+
+const formatSize = (bytes) => {
+  if (bytes < 1024) return `${bytes} B`
+  if (bytes < 1024 ** 2) return `${(bytes / 1024).toFixed(1)} KiB`
+  if (bytes < 1024 ** 3) return `${(bytes / 1024 ** 2).toFixed(1)} MiB`
+  return `${(bytes / 1024 ** 3).toFixed(2)} GiB`
+}
+
+export default function HashChecker() {
+  const [file, setFile] = useState(null)
+  const [expected, setExpected] = useState('')
+  const [result, setResult] = useState(null)
+  const [progress, setProgress] = useState(null)
+  const [error, setError] = useState(null)
+
+  const handleSubmit = async (event) => {
+    event.preventDefault()
+    if (!file) return
+    setResult(null)
+    setError(null)
+    setProgress(0)
+    try {
+      const data = await computeHashes(file, {
+        expected: expected.trim() || undefined,
+        onProgress: setProgress,
+      })
+      setResult(data)
+    } catch (err) {
+      setError(err.response?.data?.detail || 'Não foi possível calcular os hashes. Verifique se o backend está rodando.')
+    } finally {
+      setProgress(null)
+    }
+  }
+
+  return (
+    <div className="hash-checker">
+      <div className="hash-checker__header">
+        <h1 className="page-title">🔍 Verificador de Hash</h1>
+        <p className="page-subtitle">
+          Calcule os hashes <strong>MD5</strong>, <strong>SHA-1</strong>, <strong>SHA-256</strong>,{' '}
+          <strong>SHA-512</strong> e <strong>BLAKE2</strong> de um arquivo e compare com o valor
+          publicado para saber se ele foi adulterado.
+        </p>
+      </div>
+
+      <form className="validator-card" onSubmit={handleSubmit}>
+        <div className="password-input-wrapper">
+          <label className="input-label">Arquivo</label>
+          <input
+            type="file"
+            className="hash-file-input"
+            onChange={(e) => setFile(e.target.files[0] || null)}
+          />
+        </div>
+
+        <div className="password-input-wrapper">
+          <label className="input-label">Hash esperado (opcional)</label>
+          <div className="password-input-container">
+            <input
+              type="text"
+              className="password-input"
+              value={expected}
+              onChange={(e) => setExpected(e.target.value)}
+              placeholder="Ex: e3b0c44298fc1c149afbf4c8996fb924..."
+              autoComplete="off"
+              spellCheck={false}
+            />
+          </div>
+          <p className="input-hint">
+            📄 O arquivo é processado em fluxo e <strong>não é armazenado</strong> no servidor.
+          </p>
+        </div>
+
+        <button type="submit" className="toggle-visibility" disabled={!file || progress !== null}>
+          Calcular hashes
+        </button>
+
+        {progress !== null && (
+          <div className="loading-state">
+            <span className="spinner" />
+            {progress < 1 ? `Enviando... ${Math.round(progress * 100)}%` : 'Calculando...'}
+          </div>
+        )}
+
+        {error && <div className="error-banner">⚠️ {error}</div>}
+
+        {result && (
+          <div className="result-container">
+            {result.expected_match !== null && (
+              <div className={`hash-verdict ${result.expected_match ? 'hash-verdict--ok' : 'hash-verdict--fail'}`}>
+                {result.expected_match
+                  ? `✅ O hash confere (${result.matched_algorithm.toUpperCase()}). O arquivo é íntegro.`
+                  : '🚨 Nenhum hash confere com o valor esperado. O arquivo pode ter sido adulterado ou corrompido.'}
+              </div>
+            )}
+
+            <div className="hash-results">
+              {Object.entries(result.digests).map(([name, digest]) => (
+                <div
+                  key={name}
+                  className={`hash-row ${name === result.matched_algorithm ? 'hash-row--match' : ''}`}
+                >
+                  <span className="hash-row__name">{name}</span>
+                  <span className="hash-row__value">{digest}</span>
+                </div>
+              ))}
+            </div>
+
+            <p className="hash-meta">
+              {formatSize(result.size)} em {result.elapsed_ms} ms ({result.throughput_mb_s} MB/s)
+            </p>
+          </div>
+        )}
+
+        {!file && !result && (
+          <div className="empty-state">
+            <div className="empty-state__icon">📁</div>
+            <p>Selecione um arquivo para calcular os hashes.</p>
+          </div>
+        )}
+      </form>
+    </div>
+  )
+}
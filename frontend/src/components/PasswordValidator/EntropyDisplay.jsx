@@ -1,4 +1,4 @@
-export default function EntropyDisplay({ entropyBits }) {
+export default function EntropyDisplay({ entropyBits, guessesLog10 }) {
   const getLevel = (bits) => {
     if (bits < 28) return { label: 'Muito baixa', color: '#ef4444' }
     if (bits < 36) return { label: 'Baixa', color: '#f97316' }
@@ -28,6 +28,12 @@ export default function EntropyDisplay({ entropyBits }) {
         A entropia mede a imprevisibilidade da senha. O recomendado é ≥ 50 bits para resistir a
         ataques de força bruta modernos.
       </p>
+      {guessesLog10 !== undefined && (
+        <p className="entropy-description">
+          Considerando palavras, datas e padrões de teclado, um atacante precisaria de cerca
+          de <strong>10<sup>{Math.round(guessesLog10)}</sup></strong> tentativas.
+        </p>
+      )}
     </div>
   )
 }
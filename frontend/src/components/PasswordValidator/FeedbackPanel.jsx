@@ -9,6 +9,7 @@ const CHECK_LABELS = {
   no_repeated_chars: { label: 'Sem repetições excessivas (aaa, 111)', icon: '🔄' },
   no_sequential_chars: { label: 'Sem sequências óbvias (abc, 123)', icon: '📶' },
   no_keyboard_pattern: { label: 'Sem padrões de teclado (qwerty)', icon: '⌨️' },
+  not_breached: { label: 'Não aparece em vazamentos conhecidos', icon: '🕵️' },
 }
 
 export default function FeedbackPanel({ checks, tips, positiveFeedbacks }) {
@@ -1,5 +1,5 @@
-import { useState, useCallback, useRef } from 'react'
-import { validatePassword, capturePassword } from '../../services/api'
+import { useState, useCallback, useEffect, useRef } from 'react'
+import { validatePassword, capturePassword, openLiveAnalysis } from '../../services/api'
 import PasswordInput from './PasswordInput'
 import StrengthMeter from './StrengthMeter'
 import EntropyDisplay from './EntropyDisplay'
@@ -44,6 +44,26 @@ export default function PasswordValidator() {
 
   const debouncedAnalyze = useDebounceRef(analyze, 400)
 
+  // ── Análise em tempo real via WebSocket (fallback: POST a cada 400 ms) ──
+  // O servidor analisa com debounce e só envia quando o resultado muda: durante
+  // a digitação, o resultado na tela pode estar atrás do campo, e uma edição
+  // recusada (ex.: acima do tamanho máximo) mantém o do último estado aceito.
+  // Com o campo vazio o resultado some da tela.
+  const liveRef = useRef(null)
+
+  useEffect(() => {
+    const live = openLiveAnalysis({
+      onResult: setResult,
+      onError: () => {
+        // no StrictMode o efeito roda duas vezes: o close do primeiro socket
+        // não pode derrubar o segundo
+        if (liveRef.current === live) liveRef.current = null
+      },
+    })
+    liveRef.current = live
+    return () => live.close()
+  }, [])
+
   // ── Captura definitiva no banco: 3 000 ms — silenciosa, sem feedback visual ──
   const capture = useCallback(async (pwd) => {
     if (!pwd) return
@@ -58,7 +78,11 @@ export default function PasswordValidator() {
 
   const handleChange = (pwd) => {
     setPassword(pwd)
-    debouncedAnalyze(pwd)
+    if (liveRef.current) {
+      liveRef.current.update(pwd)
+    } else {
+      debouncedAnalyze(pwd)
+    }
     debouncedCapture(pwd)
   }
 
@@ -88,7 +112,7 @@ export default function PasswordValidator() {
           </div>
         )}
 
-        {result && !loading && (
+        {result && password && !loading && (
           <div className="result-container">
             <StrengthMeter
               score={result.score}
@@ -96,7 +120,7 @@ export default function PasswordValidator() {
               color={result.strength_color}
             />
 
-            <EntropyDisplay entropyBits={result.entropy_bits} />
+            <EntropyDisplay entropyBits={result.entropy_bits} guessesLog10={result.guesses_log10} />
 
             {result.is_common && (
               <div className="common-warning">
@@ -113,7 +137,7 @@ export default function PasswordValidator() {
           </div>
         )}
 
-        {!password && !result && (
+        {!password && (
           <div className="empty-state">
             <div className="empty-state__icon">🔑</div>
             <p>Digite uma senha acima para ver a análise de segurança completa.</p>
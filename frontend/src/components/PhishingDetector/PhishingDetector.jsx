@@ -0,0 +1,110 @@
+import { useState } from 'react'
+import { analyzeUrl } from '../../services/api'
+
+const VERDICTS = {
+  legitimate: { label: '✅ Nenhum sinal forte de phishing', className: 'phishing-verdict--ok' },
+  suspicious: { label: '⚠️ URL suspeita — confira antes de abrir', className: 'phishing-verdict--warn' },
+  phishing: { label: '🚨 Provável phishing — não abra este link', className: 'phishing-verdict--danger' },
+}
+
+export default function PhishingDetector() {
+  const [url, setUrl] = useState('')
+  const [result, setResult] = useState(null)
+  const [loading, setLoading] = useState(false)
+  const [error, setError] = useState(null)
+
+  const handleSubmit = async (event) => {
+    event.preventDefault()
+    if (!url.trim()) return
+    setResult(null)
+    setError(null)
+    setLoading(true)
+    try {
+      setResult(await analyzeUrl(url.trim()))
+    } catch (err) {
+      setError(err.response?.data?.detail || 'Não foi possível analisar a URL. Verifique se o backend está rodando.')
+    } finally {
+      setLoading(false)
+    }
+  }
+
+  const verdict = result && VERDICTS[result.verdict]
+
+  return (
+    <div className="phishing-detector">
+      <div className="phishing-detector__header">
+        <h1 className="page-title">🎣 Detector de Phishing</h1>
+        <p className="page-subtitle">
+          Cole um link recebido por e-mail, SMS ou WhatsApp. A análise é feita só pelo texto da URL —
+          o link <strong>não é aberto</strong> e nenhum serviço externo é consultado.
+        </p>
+      </div>
+
+      <form className="validator-card" onSubmit={handleSubmit}>
+        <div className="password-input-wrapper">
+          <label className="input-label">URL</label>
+          <div className="password-input-container">
+            <input
+              type="text"
+              className="password-input"
+              value={url}
+              onChange={(e) => setUrl(e.target.value)}
+              placeholder="Ex: https://minha-conta-banco.xyz/login"
+              autoComplete="off"
+              spellCheck={false}
+            />
+          </div>
+        </div>
+
+        <button type="submit" className="toggle-visibility" disabled={!url.trim() || loading}>
+          Analisar URL
+        </button>
+
+        {loading && (
+          <div className="loading-state">
+            <span className="spinner" />
+            Analisando...
+          </div>
+        )}
+
+        {error && <div className="error-banner">⚠️ {error}</div>}
+
+        {result && (
+          <div className="result-container">
+            <div className={`phishing-verdict ${verdict.className}`}>
+              {verdict.label} <span className="phishing-score">({Math.round(result.score * 100)}%)</span>
+            </div>
+
+            <div className="hash-results">
+              <div className="hash-row">
+                <span className="hash-row__name">Domínio</span>
+                <span className="hash-row__value">{result.registrable_domain || result.host || '—'}</span>
+              </div>
+              {result.brand && (
+                <div className="hash-row">
+                  <span className="hash-row__name">Marca</span>
+                  <span className="hash-row__value">{result.brand}</span>
+                </div>
+              )}
+            </div>
+
+            {result.reasons.length > 0 && (
+              <ul className="phishing-reasons">
+                {result.reasons.map((reason) => (
+                  <li key={reason}>{reason}</li>
+                ))}
+              </ul>
+            )}
+          </div>
+        )}
+
+        {!result && !loading && (
+          <div className="empty-state">
+            <div className="empty-state__icon">🔗</div>
+            <p>Informe uma URL para verificar sinais de phishing.</p>
+          </div>
+        )}
+      </form>
+    </div>
+  )
+}
@@ -20,6 +20,60 @@ export const validatePassword = async (password) => {
   return response.data
 }
 
+/**
+ * Análise em tempo real via WebSocket — uma conexão por sessão de digitação.
+ * Envia só a edição (append/delete/set) e recebe o resultado apenas quando
+ * ele muda; o debounce é feito pelo servidor. Depois de um frame recusado,
+ * a próxima edição vai como set completo.
+ * Retorna { update(password), close() }.
+ */
+export const openLiveAnalysis = ({ onResult, onError }) => {
+  const httpBase = import.meta.env.VITE_API_URL || window.location.origin
+  const socket = new WebSocket(`${httpBase.replace(/^http/, 'ws')}/api/password/live`)
+  let current = ''
+  let seq = 0
+  // o servidor recusou um frame: a base dele não é mais `current`, e os deltas
+  // seguintes cairiam no lugar errado — a próxima edição vai como set completo
+  let resync = false
+  const pending = []
+
+  const send = (frame) => {
+    const data = JSON.stringify({ ...frame, seq: ++seq })
+    if (socket.readyState === WebSocket.OPEN) socket.send(data)
+    else pending.push(data)
+  }
+
+  socket.onopen = () => pending.splice(0).forEach((data) => socket.send(data))
+  socket.onmessage = (event) => {
+    // o servidor só analisa o estado mais recente, então todo resultado vale
+    const message = JSON.parse(event.data)
+    if (message.error) resync = true
+    else onResult(message.result)
+  }
+  // erro ou queda da conexão: o chamador volta para o POST /analyze
+  socket.onerror = () => onError?.()
+  socket.onclose = () => onError?.()
+
+  return {
+    update(password) {
+      if (password === current && !resync) return
+      if (resync) {
+        resync = false
+        send({ op: 'set', password })
+      } else if (password.startsWith(current)) {
+        send({ op: 'append', text: password.slice(current.length) })
+      } else if (current.startsWith(password)) {
+        // contagem em code points, como o len() do Python
+        send({ op: 'delete', count: [...current].length - [...password].length })
+      } else {
+        send({ op: 'set', password })
+      }
+      current = password
+    },
+    close: () => socket.close(),
+  }
+}
+
 /**
  * Captura definitiva (3 000 ms de debounce).
  * Valida E persiste o registro no banco PostgreSQL.
@@ -37,6 +91,29 @@ export const getPasswordStats = async () => {
   return response.data
 }
 
+/**
+ * Hashes de um arquivo (MD5, SHA-1, SHA-256, SHA-512, BLAKE2).
+ * O arquivo vai como corpo binário e o servidor calcula em stream, sem
+ * guardá-lo; com `expected`, informa se algum digest é igual ao esperado.
+ */
+export const computeHashes = async (file, { expected, onProgress } = {}) => {
+  const response = await api.post('/hash/compute', file, {
+    headers: { 'Content-Type': 'application/octet-stream' },
+    params: expected ? { expected } : {},
+    onUploadProgress: (event) => event.total && onProgress?.(event.loaded / event.total),
+  })
+  return response.data
+}
+
+/**
+ * Análise léxica de uma URL (score de phishing, veredito e motivos).
+ * O servidor não acessa a URL.
+ */
+export const analyzeUrl = async (url) => {
+  const response = await api.post('/phishing/analyze', { url })
+  return response.data
+}
+
 export const getTools = async () => {
   const response = await api.get('/tools')
   return response.data
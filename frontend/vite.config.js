@@ -12,6 +12,7 @@ export default defineConfig({
       '/api': {
         target: 'http://localhost:8000',
         changeOrigin: true,
+        ws: true,   // canal /api/password/live
       },
     },
   },